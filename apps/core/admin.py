@@ -3,16 +3,43 @@ from django.contrib import admin
 
 # Own Libraries
 from apps.core.models import (
+    ArchivedLocation,
+    ArchivedLocationCategory,
     Category,
+    CategoryLeaderboard,
     City,
     Country,
+    IdempotencyKey,
     Location,
     LocationCategory,
+    LocationCategoryViews,
+    LocationCluster,
+    QueuedTask,
 )
 
+
+class AuditableAdmin(admin.ModelAdmin):
+    """Lists the soft-deleted rows too, which the default manager hides."""
+
+    list_filter = ("is_deleted",)
+
+    def get_queryset(self, request):
+        queryset = self.model.all_objects.get_queryset()
+        if ordering := self.get_ordering(request):
+            queryset = queryset.order_by(*ordering)
+        return queryset
+
+
 # Register your models here.
-admin.site.register(Country)
-admin.site.register(City)
-admin.site.register(Location)
-admin.site.register(Category)
-admin.site.register(LocationCategory)
+admin.site.register(Country, AuditableAdmin)
+admin.site.register(City, AuditableAdmin)
+admin.site.register(Location, AuditableAdmin)
+admin.site.register(Category, AuditableAdmin)
+admin.site.register(LocationCategory, AuditableAdmin)
+admin.site.register(CategoryLeaderboard)
+admin.site.register(LocationCategoryViews)
+admin.site.register(LocationCluster)
+admin.site.register(ArchivedLocation)
+admin.site.register(ArchivedLocationCategory)
+admin.site.register(IdempotencyKey)
+admin.site.register(QueuedTask)
@@ -2,10 +2,11 @@
 import logging
 
 # Third-party Libraries
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Header, status
 
 # Own Libraries
 from apps.location.process.category import CategoryProcess
+from apps.location.process.idempotency import idempotent
 from apps.location.schema.inputs.category import CategoryAddInput
 from apps.location.schema.response.category import CreateCategoryPayload, Response
 from apps.location.schema.types.category import CategoryType
@@ -25,6 +26,8 @@ add_category_tag = MetadataTag(
         a new category instance.
         The function returns a payload containing the created category
         and a success message.
+        A retry sent with the same `Idempotency-Key` header gets the
+        response of the first request.
         """
     ),
 )
@@ -35,8 +38,12 @@ add_category_tag = MetadataTag(
     status_code=status.HTTP_201_CREATED,
     tags=[add_category_tag.name],
 )
+@idempotent(scope="add-categories", payload_class=CreateCategoryPayload)
 @handler_exception(payload_class=CreateCategoryPayload, log_tag="Add Categories")
-async def add_categories(input: CategoryAddInput) -> CreateCategoryPayload:
+async def add_categories(
+    input: CategoryAddInput,
+    idempotency_key: str | None = Header(default=None, max_length=255),
+) -> CreateCategoryPayload:
     process = CategoryProcess()
     kwargs = input.model_dump()
 
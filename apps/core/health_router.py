@@ -0,0 +1,62 @@
+# Standard Libraries
+import logging
+
+# Third-party Libraries
+from fastapi import APIRouter, status
+from fastapi.responses import JSONResponse
+
+# Own Libraries
+from apps.utils.tags import MetadataTag
+from apps.utils.warmup import ping_database, readiness
+
+health_router = APIRouter()
+
+logger = logging.getLogger(__name__)
+
+health_tag = MetadataTag(
+    name="Health",
+    description=(
+        """`/healthz` reports that the worker process is alive. `/readyz`
+        reports whether it is ready to serve traffic: it answers 503 SERVICE
+        UNAVAILABLE until the startup warm-up (database connections,
+        reference caches and response schemas) has completed and while the
+        database is unreachable. Both return the startup report of the
+        worker: the time spent importing the app and by each warm-up step.
+        """
+    ),
+)
+
+
+@health_router.get(
+    "/healthz",
+    status_code=status.HTTP_200_OK,
+    tags=[health_tag.name],
+)
+async def healthz() -> JSONResponse:
+    return JSONResponse(content={"status": "ok", **readiness.report()})
+
+
+@health_router.get(
+    "/readyz",
+    status_code=status.HTTP_200_OK,
+    tags=[health_tag.name],
+)
+async def readyz() -> JSONResponse:
+    log_tag = "Readyz"
+    status_code = status.HTTP_200_OK
+    if not await readiness.ensure_ready():
+        status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    else:
+        try:
+            await ping_database()
+        except Exception as exp:
+            logger.warning(f"***{log_tag}, Database Error, {repr(exp)}")
+            status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+
+    return JSONResponse(
+        content={
+            "status": "ready" if status_code == status.HTTP_200_OK else "not ready",
+            **readiness.report(),
+        },
+        status_code=status_code,
+    )
@@ -1,26 +1,47 @@
 # Standard Libraries
+import asyncio
 import logging
 
 # Third-party Libraries
-from fastapi import APIRouter, BackgroundTasks, status
+from fastapi import APIRouter, BackgroundTasks, Header, Query, Request, status
 from fastapi.responses import JSONResponse
 
 # Own Libraries
-from apps.location.bg_tasks.register_location_view import register_views
+from apps.location.bg_tasks.register_location_view import (
+    register_batch_views,
+    register_views,
+)
 from apps.location.process import LocationProcess
 from apps.location.process.category import CategoryProcess
 from apps.location.process.city import CityProcess
+from apps.location.process.cluster import ClusterProcess
+from apps.location.process.idempotency import idempotent
+from apps.location.process.leaderboard import LeaderboardProcess
+from apps.location.process.location import recommend_locations_flight
 from apps.location.process.location_category import LocationCategoryProcess
-from apps.location.schema.inputs.location import LocationAddInput
+from apps.location.process.search import SearchProcess
+from apps.location.schema.inputs.location import (
+    BatchLocationDetailInput,
+    LocationAddInput,
+)
 from apps.location.schema.response.interface import Response
 from apps.location.schema.response.location import (
+    BatchLocationDetailPayload,
+    BulkCreateLocationPayload,
     CreateLocationPayload,
     LocationListPayload,
     LocationMetadata,
+    NearbyLocationListPayload,
+    SearchLocationListPayload,
+    ViewportPayload,
 )
 from apps.location.schema.types.location import LocationType
 from apps.utils.decorator import handler_exception
+from apps.utils.etag import cache_headers, etag_matches, make_weak_etag, not_modified
+from apps.utils.ndjson import iter_lines
+from apps.utils.responses import PayloadResponse, get_type_adapter
 from apps.utils.tags import MetadataTag
+from config.env_vars import settings
 
 logger = logging.getLogger(__name__)
 
@@ -34,9 +55,17 @@ recommend_locations_tag = MetadataTag(
         ID and recent total reviews. It retrieves locations that belong to the
         specified category and have been updated within the last 30 days.
         Recommendations are sorted based on the total number of reviews received
-        in the past 30 days. The function returns a payload containing metadata
-        about the total count of recommended locations and a list of recommended
-        locations, including their IDs, names, cities, countries, and categories.
+        in the past 30 days, as kept by the precomputed category leaderboard.
+        The function returns a payload containing metadata about the total
+        count of recommended locations and a list of recommended locations,
+        including their IDs, names, cities, countries, and categories.
+        Results are paginated by keyset: pass the `next_cursor` of the
+        metadata as `cursor` to get the next page of `limit` locations.
+        Responses carry a weak ETag derived from the leaderboard state; when
+        it matches `If-None-Match` a 304 NOT MODIFIED is returned.
+        Concurrent identical requests share one computation, reused for
+        `RECOMMEND_MICRO_CACHE_TTL` seconds (and served stale for
+        `RECOMMEND_STALE_TTL` more while it is refreshed).
         """
     ),
 )
@@ -47,28 +76,215 @@ recommend_locations_tag = MetadataTag(
     status_code=status.HTTP_200_OK,
     tags=[recommend_locations_tag.name],
 )
-async def recommend_locations(category_id: int) -> LocationListPayload:
+@handler_exception(payload_class=LocationListPayload, log_tag="Recommend Locations")
+async def recommend_locations(
+    category_id: int,
+    limit: int = Query(
+        default=settings.RECOMMEND_DEFAULT_LIMIT,
+        ge=1,
+        le=settings.RECOMMEND_MAX_LIMIT,
+    ),
+    cursor: str | None = None,
+    estimate_total: bool = False,
+    if_none_match: str | None = Header(default=None),
+) -> LocationListPayload:
     log_tag = "Recommend Locations"
     logger.debug(f"***{log_tag}***")
     process = LocationProcess()
     category_process = LocationCategoryProcess()
     city_process = CityProcess()
+    leaderboard_process = LeaderboardProcess()
+    cache_control = settings.CACHE_CONTROL_RECOMMEND_LOCATIONS
+
+    version = await recommend_locations_flight.run(
+        key=("version", category_id),
+        compute=lambda: leaderboard_process.get_version(category_id=category_id),
+    )
+    etag = make_weak_etag(category_id, limit, cursor, estimate_total, version)
+    if etag_matches(if_none_match=if_none_match, etag=etag):
+        return not_modified(etag=etag, cache_control=cache_control)
+
+    async def render_page() -> bytes:
+        payload = await process.recommend_locations(
+            category_process=category_process,
+            city_process=city_process,
+            leaderboard_process=leaderboard_process,
+            category_id=category_id,
+            limit=limit,
+            cursor=cursor,
+            estimate_total=estimate_total,
+        )
+        return get_type_adapter(LocationListPayload).dump_json(payload)
+
+    # Keyed by the version as well, so a page always matches its ETag.
+    content = await recommend_locations_flight.run(
+        key=("page", category_id, limit, cursor, estimate_total, version),
+        compute=render_page,
+    )
+
+    return PayloadResponse(
+        content=content,
+        headers=cache_headers(etag=etag, cache_control=cache_control),
+    )
+
+
+nearby_locations_tag = MetadataTag(
+    name="Nearby Locations",
+    description=(
+        """This function returns the locations within a radius (in metres) of
+        the provided coordinate, optionally restricted to a category.
+        Candidates are looked up by the geohash cells surrounding the
+        coordinate and ranked by their exact distance, closest first.
+        The function returns a payload containing metadata about the total
+        count of locations found and the list of locations with their
+        distance to the coordinate.
+        """
+    ),
+)
+
+
+@location_router.get(
+    "/nearby-locations",
+    status_code=status.HTTP_200_OK,
+    tags=[nearby_locations_tag.name],
+)
+async def nearby_locations(
+    lat: float = Query(ge=-90, le=90),
+    lon: float = Query(ge=-180, le=180),
+    radius_m: float = Query(gt=0, le=settings.NEARBY_MAX_RADIUS_M),
+    category_id: int | None = None,
+) -> NearbyLocationListPayload:
+    log_tag = "Nearby Locations"
+    logger.debug(f"***{log_tag}***")
+    process = LocationProcess()
+    category_process = LocationCategoryProcess()
+    city_process = CityProcess()
 
     if not (
-        locations := await process.recommend_locations(
+        locations := await process.nearby_locations(
             category_process=category_process,
             city_process=city_process,
+            latitude=lat,
+            longitude=lon,
+            radius_m=radius_m,
             category_id=category_id,
+            limit=settings.NEARBY_LIMIT,
         )
     ):
-        return LocationListPayload.empty_state()
+        return PayloadResponse(content=NearbyLocationListPayload.empty_state())
 
-    return LocationListPayload(
-        metadata=LocationMetadata(total_count=len(locations)),
-        items=locations,
+    return PayloadResponse(
+        content=NearbyLocationListPayload.model_construct(
+            metadata=LocationMetadata(total_count=len(locations)),
+            items=locations,
+        )
     )
 
 
+search_locations_tag = MetadataTag(
+    name="Search Locations",
+    description=(
+        """This function searches locations by text, matching the query as a
+        prefix or fuzzily against their address, their city name and their
+        category names. It uses pg_trgm trigram indexes on PostgreSQL and an
+        in-memory n-gram index on other databases. Results blend the text
+        score, weighted by the matched field, with the total reviews of the
+        location, and carry the resulting `score`, best first.
+        """
+    ),
+)
+
+
+@location_router.get(
+    "/locations/search",
+    status_code=status.HTTP_200_OK,
+    tags=[search_locations_tag.name],
+)
+async def search_locations(
+    q: str = Query(min_length=2, max_length=100),
+    limit: int = Query(
+        default=settings.SEARCH_DEFAULT_LIMIT,
+        ge=1,
+        le=settings.SEARCH_MAX_LIMIT,
+    ),
+) -> SearchLocationListPayload:
+    log_tag = "Search Locations"
+    logger.debug(f"***{log_tag}***")
+    process = LocationProcess()
+    category_process = LocationCategoryProcess()
+    city_process = CityProcess()
+    search_process = SearchProcess()
+
+    if not (
+        locations := await process.search_locations(
+            category_process=category_process,
+            city_process=city_process,
+            search_process=search_process,
+            query=q,
+            limit=limit,
+        )
+    ):
+        return PayloadResponse(content=SearchLocationListPayload.empty_state())
+
+    return PayloadResponse(
+        content=SearchLocationListPayload.model_construct(
+            metadata=LocationMetadata(total_count=len(locations), limit=limit),
+            items=locations,
+        )
+    )
+
+
+viewport_locations_tag = MetadataTag(
+    name="Viewport Locations",
+    description=(
+        """This function returns what a map shows inside a bounding box at a
+        zoom level, optionally restricted to a category. When the viewport
+        holds many locations it returns clusters (count, centroid and top
+        category) read from precomputed per-zoom grid aggregates, so the
+        cost follows the number of visible clusters; otherwise, and at close
+        zoom levels, it returns the locations themselves, flagged as
+        `truncated` past the display limit. The metadata tells which `mode`
+        was used.
+        """
+    ),
+)
+
+
+@location_router.get(
+    "/locations/viewport",
+    status_code=status.HTTP_200_OK,
+    tags=[viewport_locations_tag.name],
+)
+@handler_exception(payload_class=ViewportPayload, log_tag="Viewport Locations")
+async def viewport_locations(
+    min_lat: float = Query(ge=-90, le=90),
+    min_lon: float = Query(ge=-180, le=180),
+    max_lat: float = Query(ge=-90, le=90),
+    max_lon: float = Query(ge=-180, le=180),
+    zoom: int = Query(ge=0, le=22),
+    category_id: int | None = None,
+) -> ViewportPayload:
+    log_tag = "Viewport Locations"
+    logger.debug(f"***{log_tag}***")
+    process = LocationProcess()
+    category_process = LocationCategoryProcess()
+    city_process = CityProcess()
+    cluster_process = ClusterProcess()
+
+    payload = await process.viewport_locations(
+        category_process=category_process,
+        city_process=city_process,
+        cluster_process=cluster_process,
+        zoom=zoom,
+        min_latitude=min_lat,
+        min_longitude=min_lon,
+        max_latitude=max_lat,
+        max_longitude=max_lon,
+        category_id=category_id,
+    )
+    return PayloadResponse(content=payload)
+
+
 location_detail_tag = MetadataTag(
     name="Location Detail",
     description=(
@@ -77,6 +293,9 @@ location_detail_tag = MetadataTag(
         If found, it retrieves additional details such as city and categories.
         It also adds a background task to register views for the location.
         If the location is not found, it returns a 404 NOT FOUND response.
+        Responses carry a weak ETag; when it matches `If-None-Match` a 304
+        NOT MODIFIED is returned without building the payload, and the view
+        is still registered.
         """
     ),
 )
@@ -88,30 +307,55 @@ location_detail_tag = MetadataTag(
     tags=[location_detail_tag.name],
 )
 async def location_detail(
-    location_id: int, category_id: int, bg_tasks: BackgroundTasks
+    location_id: int,
+    category_id: int,
+    bg_tasks: BackgroundTasks,
+    if_none_match: str | None = Header(default=None),
 ) -> LocationType | None:
     log_tag = "Location detail"
     logger.debug(f"***{log_tag}***")
     process = LocationProcess()
+    city_process = CityProcess()
+    category_process = LocationCategoryProcess()
+    cache_control = settings.CACHE_CONTROL_LOCATION_DETAIL
+
+    if version := await process.get_detail_version(
+        location_id=location_id,
+        category_id=category_id,
+    ):
+        etag = make_weak_etag(location_id, category_id, version)
+        if etag_matches(if_none_match=if_none_match, etag=etag):
+            bg_tasks.add_task(register_views, location_id, category_id)
+            return not_modified(etag=etag, cache_control=cache_control)
+    else:
+        etag = None
     kwargs = {
         "is_deleted": False,
         "id": location_id,
         "locations_categories_set__category_id": category_id,
     }
 
-    if location := await process.get_object(**kwargs):
-        city_process = CityProcess()
-        category_process = LocationCategoryProcess()
-        categories_index_dict = await category_process.get_categories_index_dict()
+    location, categories_index_dict, city_tuple_dict = await asyncio.gather(
+        process.get_object(**kwargs),
+        category_process.get_categories_by_location_ids(
+            location_id_list=[location_id],
+        ),
+        city_process.get_city_and_country(),
+    )
 
+    if location:
         bg_tasks.add_task(register_views, location_id, category_id)
-        city_tuple_dict = await city_process.get_city_and_country()
 
-        return LocationType.from_db_model(
-            instance=location,
-            category_id=category_id,
-            city_tuple=city_tuple_dict.get(location.city_id),
-            categories_list=categories_index_dict.get(location.id),
+        return PayloadResponse(
+            content=LocationType.construct_from_db_model(
+                instance=location,
+                category_id=category_id,
+                city_tuple=city_tuple_dict.get(location.city_id),
+                categories_list=categories_index_dict.get(location.id),
+            ),
+            headers=(
+                cache_headers(etag=etag, cache_control=cache_control) if etag else None
+            ),
         )
 
     return JSONResponse(
@@ -120,15 +364,68 @@ async def location_detail(
     )
 
 
+batch_location_detail_tag = MetadataTag(
+    name="Batch Location Detail",
+    description=(
+        """This resource retrieves the details of many locations at once, each
+        in a category, from a list of up to `BATCH_DETAIL_MAX_ITEMS`
+        (location_id, category_id) pairs. The details are built with a
+        constant number of queries however many pairs are requested, and are
+        returned in the order of the pairs; the pairs whose location does
+        not exist or does not belong to the category are listed in
+        `not_found`. A view is registered for every location found, all of
+        them written by the same bulk update.
+        """
+    ),
+)
+
+
+@location_router.post(
+    "/locations/batch-detail",
+    status_code=status.HTTP_200_OK,
+    tags=[batch_location_detail_tag.name],
+)
+@handler_exception(
+    payload_class=BatchLocationDetailPayload,
+    log_tag="Batch Location Detail",
+)
+async def batch_location_detail(
+    input: BatchLocationDetailInput,
+    bg_tasks: BackgroundTasks,
+) -> BatchLocationDetailPayload:
+    log_tag = "Batch Location Detail"
+    logger.debug(f"***{log_tag}***")
+    process = LocationProcess()
+    city_process = CityProcess()
+    category_process = LocationCategoryProcess()
+
+    keys = [(item.location_id, item.category_id) for item in input.items]
+    payload = await process.batch_location_detail(
+        category_process=category_process,
+        city_process=city_process,
+        keys=keys,
+    )
+
+    not_found = {(key.location_id, key.category_id) for key in payload.not_found}
+    if found := [key for key in dict.fromkeys(keys) if key not in not_found]:
+        bg_tasks.add_task(register_batch_views, found)
+
+    return PayloadResponse(content=payload)
+
+
 add_location_tag = MetadataTag(
     name="Add Location",
     description=(
         """This function adds a new location with the provided input data.
         It first retrieves the categories associated with the location.
         If the categories are not found, it raises an AssertionError.
+        A location of the same country and city registered within
+        `LOCATION_DUPLICATE_RADIUS_M` metres is rejected as a duplicate.
         Otherwise, it creates a new location instance and associates it
         with the retrieved categories.
         It returns a payload containing the created location and a success message.
+        A retry sent with the same `Idempotency-Key` header gets the
+        response of the first request.
         """
     ),
 )
@@ -139,12 +436,16 @@ add_location_tag = MetadataTag(
     status_code=status.HTTP_201_CREATED,
     tags=[add_location_tag.name],
 )
+@idempotent(scope="add-locations", payload_class=CreateLocationPayload)
 @handler_exception(payload_class=CreateLocationPayload, log_tag="Add Location")
-async def add_location(input: LocationAddInput) -> CreateLocationPayload:
+async def add_location(
+    input: LocationAddInput,
+    idempotency_key: str | None = Header(default=None, max_length=255),
+) -> CreateLocationPayload:
 
     location_process = LocationProcess()
     category_process = CategoryProcess()
-    location_category_process = LocationCategoryProcess()
+    city_process = CityProcess()
 
     if not (
         categories_list := await category_process.get_objects(
@@ -159,13 +460,14 @@ async def add_location(input: LocationAddInput) -> CreateLocationPayload:
     new_location = await location_process.create_instance(
         input=input,
         categories_list=categories_list,
-        location_category_process=location_category_process,
     )
+    city_tuple_dict = await city_process.get_city_and_country()
 
     return CreateLocationPayload(
         location=LocationType.from_db_model(
             instance=new_location,
             category_id=input.category_id_list[0],
+            city_tuple=city_tuple_dict.get(new_location.city_id),
             categories_list=categories_list,
         ),
         response=Response(
@@ -174,3 +476,43 @@ async def add_location(input: LocationAddInput) -> CreateLocationPayload:
             message="",
         ),
     )
+
+
+bulk_add_locations_tag = MetadataTag(
+    name="Bulk Add Locations",
+    description=(
+        """This function imports many locations from an NDJSON request body,
+        one `LocationAddInput` object per line, streamed as it is received.
+        Each line is validated, rows referencing missing categories, cities
+        or countries, or an already registered location (same country and
+        city, within `LOCATION_DUPLICATE_RADIUS_M` metres) are rejected, and
+        the rest are inserted in batches.
+        It returns a payload with one result per line (created, duplicated,
+        invalid or failed) and the totals by status.
+        """
+    ),
+)
+
+
+@location_router.post(
+    "/locations/bulk",
+    status_code=status.HTTP_201_CREATED,
+    tags=[bulk_add_locations_tag.name],
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/x-ndjson": {"schema": {"type": "string"}}},
+        }
+    },
+)
+@handler_exception(
+    payload_class=BulkCreateLocationPayload,
+    log_tag="Bulk Add Locations",
+)
+async def bulk_add_locations(request: Request) -> BulkCreateLocationPayload:
+    location_process = LocationProcess()
+
+    return await location_process.bulk_create_from_lines(
+        lines=iter_lines(request.stream()),
+        batch_size=settings.BULK_IMPORT_BATCH_SIZE,
+    )
@@ -0,0 +1,38 @@
+# Third-party Libraries
+from django.core.management.base import BaseCommand
+
+# Own Libraries
+from apps.location.process.archive import BATCH_SIZE, archive_deleted_rows
+
+
+class Command(BaseCommand):
+    help = (
+        "Move the locations and location categories soft-deleted long ago "
+        "to the archive tables. Run it daily."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=None,
+            help="Days since the deletion (defaults to ARCHIVE_AFTER_DAYS)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=BATCH_SIZE,
+            help="Rows archived per transaction",
+        )
+
+    def handle(self, *args, **options):
+        locations, locations_categories = archive_deleted_rows(
+            days=options["days"],
+            batch_size=options["batch_size"],
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Archived {locations} locations and "
+                f"{locations_categories} location categories"
+            )
+        )
@@ -0,0 +1,32 @@
+# Third-party Libraries
+from django.core.management.base import BaseCommand
+
+# Own Libraries
+from apps.location.process.location import backfill_geohash
+
+
+class Command(BaseCommand):
+    help = (
+        "Set the geohash of the locations written without save (bulk_create, "
+        "update), which the nearby and duplicate lookups need."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Recompute every geohash, not only the empty ones",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=2000,
+            help="Rows updated per round trip",
+        )
+
+    def handle(self, *args, **options):
+        updated = backfill_geohash(
+            batch_size=options["batch_size"],
+            all_rows=options["all"],
+        )
+        self.stdout.write(self.style.SUCCESS(f"Updated {updated} locations"))
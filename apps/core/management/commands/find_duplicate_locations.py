@@ -0,0 +1,43 @@
+# Third-party Libraries
+from django.core.management.base import BaseCommand
+
+# Own Libraries
+from apps.location.process.dedupe import find_duplicate_locations
+from config.env_vars import settings
+
+
+class Command(BaseCommand):
+    help = (
+        "List the live locations registered within a distance of an earlier "
+        "location of the same city, as location_id,duplicate_of,distance_m."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--radius",
+            type=float,
+            default=None,
+            help="Distance in metres (defaults to LOCATION_DUPLICATE_RADIUS_M)",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=2000,
+            help="Rows read from the database per round trip",
+        )
+
+    def handle(self, *args, **options):
+        radius_m = options["radius"]
+        if radius_m is None:
+            radius_m = settings.LOCATION_DUPLICATE_RADIUS_M
+
+        found = 0
+        for location, duplicate_of, distance in find_duplicate_locations(
+            radius_m=radius_m,
+            chunk_size=options["chunk_size"],
+        ):
+            self.stdout.write(f"{location.id},{duplicate_of.id},{distance:.2f}")
+            found += 1
+        self.stdout.write(
+            self.style.SUCCESS(f"Found {found} duplicate locations within {radius_m} m")
+        )
@@ -0,0 +1,13 @@
+# Third-party Libraries
+from django.core.management.base import BaseCommand
+
+# Own Libraries
+from apps.location.process.idempotency import prune_idempotency_keys
+
+
+class Command(BaseCommand):
+    help = "Delete the expired Idempotency-Key responses. Run it daily."
+
+    def handle(self, *args, **options):
+        deleted = prune_idempotency_keys()
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} idempotency keys"))
@@ -0,0 +1,26 @@
+# Third-party Libraries
+from django.core.management.base import BaseCommand
+
+# Own Libraries
+from apps.location.process.cluster import rebuild_clusters
+
+
+class Command(BaseCommand):
+    help = "Rebuild the per-zoom map cluster aggregates from the locations"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--max-zoom",
+            type=int,
+            default=None,
+            help="Highest zoom level rebuilt (defaults to CLUSTER_MAX_ZOOM)",
+        )
+
+    def handle(self, *args, **options):
+        written = rebuild_clusters(max_zoom=options["max_zoom"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt {len(written)} zoom levels "
+                f"({sum(written.values())} clusters)"
+            )
+        )
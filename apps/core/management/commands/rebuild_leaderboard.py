@@ -0,0 +1,26 @@
+# Third-party Libraries
+from django.core.management.base import BaseCommand
+
+# Own Libraries
+from apps.location.process.leaderboard import rebuild_leaderboard
+
+
+class Command(BaseCommand):
+    help = "Rebuild the per-category trending leaderboards from location_category"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--size",
+            type=int,
+            default=None,
+            help="Locations kept per category (defaults to LEADERBOARD_SIZE)",
+        )
+
+    def handle(self, *args, **options):
+        written = rebuild_leaderboard(size=options["size"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt {len(written)} leaderboards "
+                f"({sum(written.values())} rows)"
+            )
+        )
@@ -0,0 +1,24 @@
+# Third-party Libraries
+from django.core.management.base import BaseCommand
+
+# Own Libraries
+from apps.location.process.leaderboard import rebuild_leaderboard
+from apps.location.process.location_category_views import roll_view_buckets
+
+
+class Command(BaseCommand):
+    help = (
+        "Expire the daily view buckets that left the trending window, prune "
+        "the old ones and rebuild the leaderboards. Run it daily when no "
+        "run_task_worker rolls them."
+    )
+
+    def handle(self, *args, **options):
+        expired, deleted = roll_view_buckets()
+        written = rebuild_leaderboard()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Expired {expired} and deleted {deleted} view buckets, "
+                f"rebuilt {len(written)} leaderboards"
+            )
+        )
@@ -0,0 +1,72 @@
+# Standard Libraries
+import asyncio
+import signal
+
+# Third-party Libraries
+from django.core.management.base import BaseCommand
+
+# Own Libraries
+from apps.location.bg_tasks.task_worker import TaskWorker
+from apps.utils.db_executor import database_executor
+from apps.utils.db_pool import close_pools
+from config.env_vars import settings
+
+
+class Command(BaseCommand):
+    help = (
+        "Run the tasks of the durable task queue, rolling the daily view "
+        "buckets periodically, until stopped (SIGINT or SIGTERM), or until "
+        "it is empty with --once."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.TASK_QUEUE_BATCH_SIZE,
+            help="Tasks claimed per round",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=settings.TASK_QUEUE_POLL_INTERVAL,
+            help="Seconds to wait when the queue is empty",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit once no task is ready",
+        )
+
+    def handle(self, *args, **options):
+        worker = TaskWorker(
+            batch_size=options["batch_size"],
+            poll_interval=options["poll_interval"],
+            lease=settings.TASK_QUEUE_LEASE,
+            roll_interval=settings.VIEW_BUCKET_ROLL_INTERVAL,
+        )
+        try:
+            if options["once"]:
+                claimed = asyncio.run(self.run_until_empty(worker))
+                message = f"Claimed {claimed} tasks, none is ready"
+            else:
+                asyncio.run(self.run_until_stopped(worker))
+                message = "Task worker stopped"
+        finally:
+            database_executor.shutdown()
+            close_pools()
+        self.stdout.write(self.style.SUCCESS(message))
+
+    async def run_until_empty(self, worker: TaskWorker) -> int:
+        claimed = 0
+        while batch := await worker.run_once():
+            claimed += batch
+        await worker.report_depth()
+        return claimed
+
+    async def run_until_stopped(self, worker: TaskWorker) -> None:
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, stop.set)
+        await worker.run(stop)
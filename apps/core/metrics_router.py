@@ -0,0 +1,37 @@
+# Standard Libraries
+import logging
+
+# Third-party Libraries
+from fastapi import APIRouter, status
+from fastapi.responses import Response
+
+# Own Libraries
+from apps.utils.metrics import render_metrics
+from apps.utils.tags import MetadataTag
+
+metrics_router = APIRouter()
+
+logger = logging.getLogger(__name__)
+
+metrics_tag = MetadataTag(
+    name="Metrics",
+    description=(
+        """This resource exposes the service metrics in Prometheus text format:
+        request latency histograms by route, the outcomes of the routes that
+        handle their exceptions (success, validation or internal errors) and
+        the latency of every Process method run on the database threads,
+        and the depth, latency and outcomes of the durable task queue.
+        Under gunicorn the samples of all the workers are aggregated.
+        """
+    ),
+)
+
+
+@metrics_router.get(
+    "/metrics",
+    status_code=status.HTTP_200_OK,
+    tags=[metrics_tag.name],
+)
+async def metrics() -> Response:
+    content, media_type = render_metrics()
+    return Response(content=content, media_type=media_type)
@@ -0,0 +1,41 @@
+# Generated by Django 5.0.6 on 2026-10-18 09:12
+
+from django.db import migrations, models
+
+from apps.utils.geohash import encode
+
+
+def populate_geohash(apps, schema_editor):
+    Location = apps.get_model("core", "Location")
+    batch = []
+    queryset = Location.objects.only("id", "latitude", "longitude")
+    for location in queryset.iterator(chunk_size=2000):
+        location.geohash = encode(location.latitude, location.longitude)
+        batch.append(location)
+        if len(batch) >= 2000:
+            Location.objects.bulk_update(batch, ["geohash"])
+            batch = []
+    if batch:
+        Location.objects.bulk_update(batch, ["geohash"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0002_alter_city_country_alter_location_city_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="location",
+            name="geohash",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                default="",
+                max_length=12,
+                verbose_name="Geohash",
+            ),
+        ),
+        migrations.RunPython(populate_geohash, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,103 @@
+# Generated by Django 5.0.6 on 2026-10-18 10:41
+
+from datetime import datetime, timedelta, timezone
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+LEADERBOARD_SIZE = 100
+LEADERBOARD_WINDOW_DAYS = 30
+
+
+def populate_leaderboard(apps, schema_editor):
+    Category = apps.get_model("core", "Category")
+    CategoryLeaderboard = apps.get_model("core", "CategoryLeaderboard")
+    LocationCategory = apps.get_model("core", "LocationCategory")
+    since = datetime.now(timezone.utc) - timedelta(days=LEADERBOARD_WINDOW_DAYS)
+
+    for category_id in Category.objects.values_list("id", flat=True):
+        top_rows = (
+            LocationCategory.objects.filter(
+                category_id=category_id,
+                is_deleted=False,
+                location__is_deleted=False,
+                updated_at__gte=since,
+            )
+            .order_by("-total_reviews", "-location_id")
+            .values_list("location_id", "total_reviews", "updated_at")
+        )
+        CategoryLeaderboard.objects.bulk_create(
+            CategoryLeaderboard(
+                category_id=category_id,
+                location_id=location_id,
+                total_reviews=total_reviews,
+                last_viewed_at=updated_at,
+            )
+            for location_id, total_reviews, updated_at in top_rows[:LEADERBOARD_SIZE]
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0003_location_geohash"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CategoryLeaderboard",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "total_reviews",
+                    models.IntegerField(default=0, verbose_name="Total reviews"),
+                ),
+                (
+                    "last_viewed_at",
+                    models.DateTimeField(verbose_name="Last viewed at"),
+                ),
+                (
+                    "category",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="leaderboard_set",
+                        to="core.category",
+                    ),
+                ),
+                (
+                    "location",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="leaderboard_set",
+                        to="core.location",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Category leaderboard",
+                "verbose_name_plural": "Category leaderboards",
+                "db_table": "category_leaderboard",
+                "indexes": [
+                    models.Index(
+                        fields=["category", "-total_reviews", "-location"],
+                        name="leaderboard_rank_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("category", "location"),
+                        name="unique location for category leaderboard",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(populate_leaderboard, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,95 @@
+# Generated by Django 5.0.6 on 2026-10-18 12:17
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0004_categoryleaderboard"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="locationcategory",
+            name="recent_reviews",
+            field=models.IntegerField(default=0, verbose_name="Recent reviews"),
+        ),
+        migrations.AddIndex(
+            model_name="locationcategory",
+            index=models.Index(
+                fields=["category", "-recent_reviews", "-location"],
+                name="loc_cat_category_recent_idx",
+            ),
+        ),
+        migrations.AddField(
+            model_name="categoryleaderboard",
+            name="recent_reviews",
+            field=models.IntegerField(default=0, verbose_name="Recent reviews"),
+        ),
+        migrations.RemoveIndex(
+            model_name="categoryleaderboard",
+            name="leaderboard_rank_idx",
+        ),
+        migrations.AddIndex(
+            model_name="categoryleaderboard",
+            index=models.Index(
+                fields=["category", "-recent_reviews", "-location"],
+                name="leaderboard_recent_rank_idx",
+            ),
+        ),
+        migrations.CreateModel(
+            name="LocationCategoryViews",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("day", models.DateField(verbose_name="Day")),
+                ("views", models.IntegerField(default=0, verbose_name="Views")),
+                (
+                    "expired",
+                    models.BooleanField(default=False, verbose_name="Expired"),
+                ),
+                (
+                    "category",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="views_set",
+                        to="core.category",
+                    ),
+                ),
+                (
+                    "location",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="views_set",
+                        to="core.location",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Location category views",
+                "verbose_name_plural": "Location category views",
+                "db_table": "location_category_views",
+                "indexes": [
+                    models.Index(
+                        fields=["expired", "day"],
+                        name="views_bucket_expiry_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("location", "category", "day"),
+                        name="unique day for location category views",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 5.0.6 on 2026-10-18 03:43
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0005_locationcategoryviews"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LocationCluster",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("zoom", models.PositiveSmallIntegerField(verbose_name="Zoom")),
+                (
+                    "category_key",
+                    models.IntegerField(default=0, verbose_name="Category key"),
+                ),
+                ("cell_x", models.IntegerField(verbose_name="Cell x")),
+                ("cell_y", models.IntegerField(verbose_name="Cell y")),
+                ("count", models.IntegerField(default=0, verbose_name="Count")),
+                (
+                    "latitude_sum",
+                    models.FloatField(default=0, verbose_name="Latitude sum"),
+                ),
+                (
+                    "longitude_sum",
+                    models.FloatField(default=0, verbose_name="Longitude sum"),
+                ),
+                (
+                    "top_category",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="core.category",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Location cluster",
+                "verbose_name_plural": "Location clusters",
+                "db_table": "location_cluster",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="locationcluster",
+            constraint=models.UniqueConstraint(
+                fields=("zoom", "category_key", "cell_y", "cell_x"),
+                name="unique cell for location cluster",
+            ),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.0.6 on 2026-10-18 15:02
+
+from django.db import migrations
+
+TRIGRAM_INDEXES = [
+    ("location_address_trgm_idx", "location", "address"),
+    ("city_name_trgm_idx", "city", "name"),
+    ("category_name_trgm_idx", "category", "name"),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    """
+    Create the pg_trgm GiST indexes of the text search. They serve both the
+    word similarity filter and the ordering by trigram distance, so the
+    best matches are read from the index without sorting every match.
+    Other databases search an in-memory index instead.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {name} ON {table} "
+            f"USING gist ({column} gist_trgm_ops)"
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name, _, _ in TRIGRAM_INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0006_locationcluster"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
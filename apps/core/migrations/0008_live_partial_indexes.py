@@ -0,0 +1,82 @@
+# Generated by Django 5.0.6 on 2026-10-18 16:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0007_search_trigram_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="location",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["city"],
+                name="location_live_city_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="location",
+            index=models.Index(
+                condition=models.Q(("is_deleted", True)),
+                fields=["updated_at"],
+                name="location_deleted_updated_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="locationcategory",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["category", "-recent_reviews", "-location"],
+                name="loc_cat_live_recent_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="locationcategory",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["category", "updated_at", "total_reviews"],
+                name="loc_cat_live_updated_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="locationcategory",
+            index=models.Index(
+                condition=models.Q(("is_deleted", True)),
+                fields=["updated_at"],
+                name="loc_cat_deleted_updated_idx",
+            ),
+        ),
+        migrations.RemoveIndex(
+            model_name="locationcategory",
+            name="loc_cat_category_recent_idx",
+        ),
+        migrations.AlterField(
+            model_name="category",
+            name="is_deleted",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AlterField(
+            model_name="city",
+            name="is_deleted",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AlterField(
+            model_name="country",
+            name="is_deleted",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AlterField(
+            model_name="location",
+            name="is_deleted",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AlterField(
+            model_name="locationcategory",
+            name="is_deleted",
+            field=models.BooleanField(default=False),
+        ),
+    ]
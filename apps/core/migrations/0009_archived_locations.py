@@ -0,0 +1,86 @@
+# Generated by Django 5.0.6 on 2026-10-18 16:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0008_live_partial_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchivedLocation",
+            fields=[
+                ("id", models.BigIntegerField(primary_key=True, serialize=False)),
+                ("country_id", models.BigIntegerField(verbose_name="Country ID")),
+                ("city_id", models.BigIntegerField(verbose_name="City ID")),
+                ("address", models.TextField(verbose_name="Location Address")),
+                (
+                    "latitude",
+                    models.DecimalField(
+                        decimal_places=7, max_digits=10, verbose_name="Lat"
+                    ),
+                ),
+                (
+                    "longitude",
+                    models.DecimalField(
+                        decimal_places=7, max_digits=10, verbose_name="Long"
+                    ),
+                ),
+                (
+                    "geohash",
+                    models.CharField(default="", max_length=12, verbose_name="Geohash"),
+                ),
+                ("created_at", models.DateTimeField(verbose_name="Fecha de Creación")),
+                (
+                    "updated_at",
+                    models.DateTimeField(verbose_name="Fecha de modificación"),
+                ),
+                (
+                    "archived_at",
+                    models.DateTimeField(db_index=True, verbose_name="Archived at"),
+                ),
+            ],
+            options={
+                "verbose_name": "Archived location",
+                "verbose_name_plural": "Archived locations",
+                "db_table": "archived_location",
+            },
+        ),
+        migrations.CreateModel(
+            name="ArchivedLocationCategory",
+            fields=[
+                ("id", models.BigIntegerField(primary_key=True, serialize=False)),
+                (
+                    "location_id",
+                    models.BigIntegerField(db_index=True, verbose_name="Location ID"),
+                ),
+                ("category_id", models.BigIntegerField(verbose_name="Category ID")),
+                (
+                    "total_reviews",
+                    models.IntegerField(default=0, verbose_name="Total reviews"),
+                ),
+                (
+                    "recent_reviews",
+                    models.IntegerField(default=0, verbose_name="Recent reviews"),
+                ),
+                ("is_deleted", models.BooleanField(default=False)),
+                ("created_at", models.DateTimeField(verbose_name="Fecha de Creación")),
+                (
+                    "updated_at",
+                    models.DateTimeField(verbose_name="Fecha de modificación"),
+                ),
+                (
+                    "archived_at",
+                    models.DateTimeField(db_index=True, verbose_name="Archived at"),
+                ),
+            ],
+            options={
+                "verbose_name": "Archived location category",
+                "verbose_name_plural": "Archived location categories",
+                "db_table": "archived_location_category",
+            },
+        ),
+    ]
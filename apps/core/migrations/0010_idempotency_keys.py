@@ -0,0 +1,58 @@
+# Generated by Django 5.0.6 on 2026-10-18 17:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0009_archived_locations"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IdempotencyKey",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("scope", models.CharField(max_length=64, verbose_name="Scope")),
+                ("key", models.CharField(max_length=255, verbose_name="Key")),
+                (
+                    "request_hash",
+                    models.CharField(max_length=64, verbose_name="Request hash"),
+                ),
+                (
+                    "status_code",
+                    models.PositiveSmallIntegerField(
+                        blank=True, null=True, verbose_name="Status code"
+                    ),
+                ),
+                ("response", models.BinaryField(default=b"", verbose_name="Response")),
+                ("created_at", models.DateTimeField(verbose_name="Created at")),
+                ("expires_at", models.DateTimeField(verbose_name="Expires at")),
+            ],
+            options={
+                "verbose_name": "Idempotency key",
+                "verbose_name_plural": "Idempotency keys",
+                "db_table": "idempotency_key",
+                "indexes": [
+                    models.Index(
+                        fields=["expires_at"], name="idempotency_key_expiry_idx"
+                    )
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="idempotencykey",
+            constraint=models.UniqueConstraint(
+                fields=("scope", "key"), name="unique key for idempotency scope"
+            ),
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 5.0.6 on 2026-10-18 17:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0010_idempotency_keys"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="QueuedTask",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("kind", models.CharField(max_length=64, verbose_name="Kind")),
+                ("payload", models.JSONField(default=dict, verbose_name="Payload")),
+                (
+                    "attempts",
+                    models.PositiveSmallIntegerField(
+                        default=0, verbose_name="Attempts"
+                    ),
+                ),
+                ("available_at", models.DateTimeField(verbose_name="Available at")),
+                ("created_at", models.DateTimeField(verbose_name="Created at")),
+                (
+                    "failed_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="Failed at"
+                    ),
+                ),
+                (
+                    "last_error",
+                    models.TextField(blank=True, default="", verbose_name="Last error"),
+                ),
+            ],
+            options={
+                "verbose_name": "Queued task",
+                "verbose_name_plural": "Queued tasks",
+                "db_table": "task_queue",
+                "indexes": [
+                    models.Index(
+                        condition=models.Q(("failed_at__isnull", True)),
+                        fields=["available_at", "id"],
+                        name="task_queue_ready_idx",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -1,14 +1,28 @@
+from apps.core.models.archived_location import ArchivedLocation
+from apps.core.models.archived_location_category import ArchivedLocationCategory
 from apps.core.models.category import Category
+from apps.core.models.category_leaderboard import CategoryLeaderboard
 from apps.core.models.city import City
 from apps.core.models.country import Country
+from apps.core.models.idempotency_key import IdempotencyKey
 from apps.core.models.location import Location
 from apps.core.models.location_category import LocationCategory
+from apps.core.models.location_category_views import LocationCategoryViews
+from apps.core.models.location_cluster import LocationCluster
+from apps.core.models.queued_task import QueuedTask
 
 
 __all__ = [
+    "ArchivedLocation",
+    "ArchivedLocationCategory",
     "Category",
+    "CategoryLeaderboard",
     "City",
     "Country",
+    "IdempotencyKey",
     "Location",
     "LocationCategory",
+    "LocationCategoryViews",
+    "LocationCluster",
+    "QueuedTask",
 ]
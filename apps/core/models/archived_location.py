@@ -0,0 +1,54 @@
+# Third-party Libraries
+from django.db import models
+
+# Own Libraries
+from apps.utils.geohash import MAX_PRECISION as GEOHASH_PRECISION
+
+
+class ArchivedLocation(models.Model):
+    """
+    A model to represent a soft-deleted location moved out of the
+    ``location`` table by the ``archive_deleted_rows`` management command.
+
+    The columns mirror ``Location``, keeping its ID, with the foreign keys
+    as plain IDs so the referenced rows can be archived on their own.
+
+    Attributes:
+        id (BigIntegerField): The ID of the location.
+        country_id (BigIntegerField): The ID of its country.
+        city_id (BigIntegerField): The ID of its city.
+        address (TextField): The address of the location.
+        latitude (DecimalField): The latitude coordinate of the location.
+        longitude (DecimalField): The longitude coordinate of the location.
+        geohash (CharField): The geohash cell of the coordinates.
+        created_at (DateTimeField): When the location was created.
+        updated_at (DateTimeField): When it was last modified, i.e. deleted.
+        archived_at (DateTimeField): When it was archived.
+    """
+
+    id = models.BigIntegerField(primary_key=True)
+    country_id = models.BigIntegerField(verbose_name="Country ID")
+    city_id = models.BigIntegerField(verbose_name="City ID")
+    address = models.TextField(verbose_name="Location Address")
+    latitude = models.DecimalField(verbose_name="Lat", max_digits=10, decimal_places=7)
+    longitude = models.DecimalField(
+        verbose_name="Long",
+        max_digits=10,
+        decimal_places=7,
+    )
+    geohash = models.CharField(
+        verbose_name="Geohash",
+        max_length=GEOHASH_PRECISION,
+        default="",
+    )
+    created_at = models.DateTimeField(verbose_name="Fecha de Creación")
+    updated_at = models.DateTimeField(verbose_name="Fecha de modificación")
+    archived_at = models.DateTimeField(verbose_name="Archived at", db_index=True)
+
+    class Meta:
+        db_table = "archived_location"
+        verbose_name = "Archived location"
+        verbose_name_plural = "Archived locations"
+
+    def __str__(self) -> str:
+        return f"[{self.id}] {self.address}"
@@ -0,0 +1,43 @@
+# Third-party Libraries
+from django.db import models
+
+
+class ArchivedLocationCategory(models.Model):
+    """
+    A model to represent a location category moved out of the
+    ``location_category`` table by the ``archive_deleted_rows`` management
+    command, because it or its location was deleted long ago.
+
+    The columns mirror ``LocationCategory``, keeping its ID, with the
+    foreign keys as plain IDs.
+
+    Attributes:
+        id (BigIntegerField): The ID of the location category.
+        location_id (BigIntegerField): The ID of its location.
+        category_id (BigIntegerField): The ID of its category.
+        total_reviews (IntegerField): The all-time views when archived.
+        recent_reviews (IntegerField): The trending views when archived.
+        is_deleted (BooleanField): Whether the row itself was deleted, not
+            only its location.
+        created_at (DateTimeField): When the row was created.
+        updated_at (DateTimeField): When it was last modified.
+        archived_at (DateTimeField): When it was archived.
+    """
+
+    id = models.BigIntegerField(primary_key=True)
+    location_id = models.BigIntegerField(verbose_name="Location ID", db_index=True)
+    category_id = models.BigIntegerField(verbose_name="Category ID")
+    total_reviews = models.IntegerField(verbose_name="Total reviews", default=0)
+    recent_reviews = models.IntegerField(verbose_name="Recent reviews", default=0)
+    is_deleted = models.BooleanField(default=False)
+    created_at = models.DateTimeField(verbose_name="Fecha de Creación")
+    updated_at = models.DateTimeField(verbose_name="Fecha de modificación")
+    archived_at = models.DateTimeField(verbose_name="Archived at", db_index=True)
+
+    class Meta:
+        db_table = "archived_location_category"
+        verbose_name = "Archived location category"
+        verbose_name_plural = "Archived location categories"
+
+    def __str__(self) -> str:
+        return f"[{self.id}] {self.location_id} ({self.category_id})"
@@ -0,0 +1,58 @@
+# Third-party Libraries
+from django.db import models
+
+
+class CategoryLeaderboard(models.Model):
+    """
+    A model to represent the precomputed top locations of a category.
+
+    Holds at most ``LEADERBOARD_SIZE`` rows per category, kept up to date
+    when views are registered and rebuilt by the ``rebuild_leaderboard``
+    management command.
+
+    Attributes:
+        category (ForeignKey): A foreign key relationship to the Category
+            model, representing the ranked category.
+        location (ForeignKey): A foreign key relationship to the Location
+            model, representing the ranked location.
+        total_reviews (IntegerField): The total reviews of the location in
+            the category.
+        recent_reviews (IntegerField): The reviews of the location in the
+            category within the trending window; the ranking key.
+        last_viewed_at (DateTimeField): The last time the location was
+            viewed in the category.
+    """
+
+    category = models.ForeignKey(
+        "Category",
+        on_delete=models.CASCADE,
+        related_name="leaderboard_set",
+    )
+    location = models.ForeignKey(
+        "Location",
+        on_delete=models.CASCADE,
+        related_name="leaderboard_set",
+    )
+    total_reviews = models.IntegerField(verbose_name="Total reviews", default=0)
+    recent_reviews = models.IntegerField(verbose_name="Recent reviews", default=0)
+    last_viewed_at = models.DateTimeField(verbose_name="Last viewed at")
+
+    class Meta:
+        db_table = "category_leaderboard"
+        verbose_name = "Category leaderboard"
+        verbose_name_plural = "Category leaderboards"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["category", "location"],
+                name="unique location for category leaderboard",
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=["category", "-recent_reviews", "-location"],
+                name="leaderboard_recent_rank_idx",
+            )
+        ]
+
+    def __str__(self) -> str:
+        return f"[{self.category_id}] {self.location_id} ({self.total_reviews})"
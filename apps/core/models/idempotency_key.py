@@ -0,0 +1,57 @@
+# Third-party Libraries
+from django.db import models
+
+
+class IdempotencyKey(models.Model):
+    """
+    A model to represent the ``Idempotency-Key`` of a write request and
+    the response it got, replayed to the retries of the request.
+
+    A row is claimed, without a response, before the request runs and is
+    deleted by the ``prune_idempotency_keys`` management command once
+    expired.
+
+    Attributes:
+        scope (CharField): The route the key was sent to.
+        key (CharField): The ``Idempotency-Key`` header of the request.
+        request_hash (CharField): The SHA-256 digest of the request input;
+            a retry must send the same input.
+        status_code (PositiveSmallIntegerField): The status code of the
+            response, null while the request runs.
+        response (BinaryField): The serialized JSON body of the response.
+        created_at (DateTimeField): When the key was claimed.
+        expires_at (DateTimeField): When the key stops being replayed
+            (see ``IDEMPOTENCY_KEY_TTL``).
+    """
+
+    scope = models.CharField(verbose_name="Scope", max_length=64)
+    key = models.CharField(verbose_name="Key", max_length=255)
+    request_hash = models.CharField(verbose_name="Request hash", max_length=64)
+    status_code = models.PositiveSmallIntegerField(
+        verbose_name="Status code",
+        null=True,
+        blank=True,
+    )
+    response = models.BinaryField(verbose_name="Response", default=b"")
+    created_at = models.DateTimeField(verbose_name="Created at")
+    expires_at = models.DateTimeField(verbose_name="Expires at")
+
+    class Meta:
+        db_table = "idempotency_key"
+        verbose_name = "Idempotency key"
+        verbose_name_plural = "Idempotency keys"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["scope", "key"],
+                name="unique key for idempotency scope",
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=["expires_at"],
+                name="idempotency_key_expiry_idx",
+            )
+        ]
+
+    def __str__(self) -> str:
+        return f"[{self.scope}] {self.key} ({self.status_code})"
@@ -1,7 +1,10 @@
 # Third-party Libraries
 from django.db import models
+from django.db.models.signals import pre_save
 
 # Own Libraries
+from apps.utils.geohash import MAX_PRECISION as GEOHASH_PRECISION
+from apps.utils.geohash import encode as encode_geohash
 from apps.utils.models import AuditableMixin
 
 
@@ -17,6 +20,10 @@ class Location(AuditableMixin):
         address (TextField): The address of the location.
         latitude (DecimalField): The latitude coordinate of the location.
         longitude (DecimalField): The longitude coordinate of the location.
+        geohash (CharField): The geohash cell of the coordinates, kept in
+            sync on save (raw fixture loads included) and used for prefix
+            based proximity lookups. ``bulk_create`` and ``update`` skip
+            it: set it on the instances, or run ``backfill_geohash``.
 
     """
 
@@ -43,6 +50,13 @@ class Location(AuditableMixin):
         decimal_places=7,
         db_index=True,
     )
+    geohash = models.CharField(
+        verbose_name="Geohash",
+        max_length=GEOHASH_PRECISION,
+        blank=True,
+        default="",
+        db_index=True,
+    )
 
     class Meta:
         db_table = "location"
@@ -57,6 +71,40 @@ class Location(AuditableMixin):
                 ),
             )
         ]
+        indexes = [
+            models.Index(
+                fields=["city"],
+                name="location_live_city_idx",
+                condition=models.Q(is_deleted=False),
+            ),
+            # The soft-deleted rows waiting to be archived.
+            models.Index(
+                fields=["updated_at"],
+                name="location_deleted_updated_idx",
+                condition=models.Q(is_deleted=True),
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"[{self.id}] {self.address}"
+
+    def save(
+        self,
+        *args,
+        **kwargs,
+    ) -> None:
+        if update_fields := kwargs.get("update_fields"):
+            if {"latitude", "longitude"} & set(update_fields):
+                kwargs["update_fields"] = {*update_fields, "geohash"}
+        return super().save(*args, **kwargs)
+
+
+def set_geohash(sender, instance: Location, **kwargs) -> None:
+    """
+    Encode the geohash of a location before it is saved. A receiver
+    rather than ``save``, so the raw saves of ``loaddata`` also set it.
+    """
+    instance.geohash = encode_geohash(instance.latitude, instance.longitude)
+
+
+pre_save.connect(set_geohash, sender=Location, weak=False)
@@ -14,6 +14,10 @@ class LocationCategory(AuditableMixin):
             model, representing the location associated with the category.
         category (ForeignKey): A foreign key relationship to the Category
             model, representing the category associated with the location.
+        total_reviews (IntegerField): The all-time views of the location in
+            the category.
+        recent_reviews (IntegerField): The views within the trending
+            window, i.e. the sum of the live LocationCategoryViews buckets.
 
     """
 
@@ -32,6 +36,10 @@ class LocationCategory(AuditableMixin):
         default=0,
         db_index=True,
     )
+    recent_reviews = models.IntegerField(
+        verbose_name="Recent reviews",
+        default=0,
+    )
 
     class Meta:
         db_table = "location_category"
@@ -44,6 +52,25 @@ class LocationCategory(AuditableMixin):
                 violation_error_message="location and category cannot both be repeated",
             )
         ]
+        # Partial indexes: the lookups only read the live rows, and the
+        # archive the soft-deleted ones.
+        indexes = [
+            models.Index(
+                fields=["category", "-recent_reviews", "-location"],
+                name="loc_cat_live_recent_idx",
+                condition=models.Q(is_deleted=False),
+            ),
+            models.Index(
+                fields=["category", "updated_at", "total_reviews"],
+                name="loc_cat_live_updated_idx",
+                condition=models.Q(is_deleted=False),
+            ),
+            models.Index(
+                fields=["updated_at"],
+                name="loc_cat_deleted_updated_idx",
+                condition=models.Q(is_deleted=True),
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"[{self.id}] {self.location.address} ({self.category.name})"
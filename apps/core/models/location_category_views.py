@@ -0,0 +1,58 @@
+# Third-party Libraries
+from django.db import models
+
+
+class LocationCategoryViews(models.Model):
+    """
+    A model to represent the views of a location in a category during one
+    day (UTC).
+
+    The buckets inside the trending window add up to
+    ``LocationCategory.recent_reviews``; when a bucket leaves the window
+    its views are subtracted from that sum and it is marked as expired,
+    then it is deleted once older than ``VIEW_BUCKET_RETENTION_DAYS``.
+
+    Attributes:
+        location (ForeignKey): A foreign key relationship to the Location
+            model, representing the viewed location.
+        category (ForeignKey): A foreign key relationship to the Category
+            model, representing the category it was viewed in.
+        day (DateField): The day of the views.
+        views (IntegerField): The number of views during the day.
+        expired (BooleanField): Whether the views were already subtracted
+            from the rolling sum.
+    """
+
+    location = models.ForeignKey(
+        "Location",
+        on_delete=models.CASCADE,
+        related_name="views_set",
+    )
+    category = models.ForeignKey(
+        "Category",
+        on_delete=models.CASCADE,
+        related_name="views_set",
+    )
+    day = models.DateField(verbose_name="Day")
+    views = models.IntegerField(verbose_name="Views", default=0)
+    expired = models.BooleanField(verbose_name="Expired", default=False)
+
+    class Meta:
+        db_table = "location_category_views"
+        verbose_name = "Location category views"
+        verbose_name_plural = "Location category views"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["location", "category", "day"],
+                name="unique day for location category views",
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=["expired", "day"],
+                name="views_bucket_expiry_idx",
+            )
+        ]
+
+    def __str__(self) -> str:
+        return f"[{self.category_id}] {self.location_id} {self.day} ({self.views})"
@@ -0,0 +1,67 @@
+# Third-party Libraries
+from django.db import models
+
+
+class LocationCluster(models.Model):
+    """
+    A model to represent the precomputed aggregate of the locations inside
+    one cell of the clustering grid at one zoom level.
+
+    The grid is described in ``apps.utils.grid``. Rows are written by the
+    ``rebuild_clusters`` management command for every zoom up to
+    ``CLUSTER_MAX_ZOOM``, once for all the categories (``category_key``
+    0) and once per category.
+
+    Attributes:
+        zoom (PositiveSmallIntegerField): The map zoom level.
+        category_key (IntegerField): The ID of the aggregated category, or
+            0 for every category.
+        cell_x (IntegerField): The grid column, counted from -180.
+        cell_y (IntegerField): The grid row, counted from -90.
+        count (IntegerField): The number of locations in the cell.
+        latitude_sum (FloatField): The sum of their latitudes.
+        longitude_sum (FloatField): The sum of their longitudes.
+        top_category (ForeignKey): A foreign key relationship to the
+            Category model, representing the category with most locations
+            in the cell.
+    """
+
+    zoom = models.PositiveSmallIntegerField(verbose_name="Zoom")
+    category_key = models.IntegerField(verbose_name="Category key", default=0)
+    cell_x = models.IntegerField(verbose_name="Cell x")
+    cell_y = models.IntegerField(verbose_name="Cell y")
+    count = models.IntegerField(verbose_name="Count", default=0)
+    latitude_sum = models.FloatField(verbose_name="Latitude sum", default=0)
+    longitude_sum = models.FloatField(verbose_name="Longitude sum", default=0)
+    top_category = models.ForeignKey(
+        "Category",
+        on_delete=models.SET_NULL,
+        related_name="+",
+        blank=True,
+        null=True,
+    )
+
+    class Meta:
+        db_table = "location_cluster"
+        verbose_name = "Location cluster"
+        verbose_name_plural = "Location clusters"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["zoom", "category_key", "cell_y", "cell_x"],
+                name="unique cell for location cluster",
+            )
+        ]
+
+    def __str__(self) -> str:
+        return (
+            f"[{self.zoom}/{self.category_key}] "
+            f"({self.cell_x}, {self.cell_y}) {self.count}"
+        )
+
+    @property
+    def latitude(self) -> float:
+        return self.latitude_sum / self.count
+
+    @property
+    def longitude(self) -> float:
+        return self.longitude_sum / self.count
@@ -0,0 +1,49 @@
+# Third-party Libraries
+from django.db import models
+from django.db.models import Q
+
+
+class QueuedTask(models.Model):
+    """
+    A model to represent a background task waiting in the durable task
+    queue, run by the ``run_task_worker`` management command.
+
+    A claimed task is hidden from the other workers until
+    ``available_at``, so it runs again if its worker dies before
+    completing it. Completed tasks are deleted; a task failing
+    ``TASK_QUEUE_MAX_ATTEMPTS`` times is kept, marked as failed.
+
+    Attributes:
+        kind (CharField): The type of the task, which selects its handler.
+        payload (JSONField): The arguments of the task.
+        attempts (PositiveSmallIntegerField): The times it was claimed.
+        available_at (DateTimeField): When it can be claimed, pushed back
+            while it is claimed and after each failed attempt.
+        created_at (DateTimeField): When it was enqueued.
+        failed_at (DateTimeField): When its last attempt failed, once it
+            is given up.
+        last_error (TextField): The error of its last failed attempt.
+    """
+
+    kind = models.CharField(verbose_name="Kind", max_length=64)
+    payload = models.JSONField(verbose_name="Payload", default=dict)
+    attempts = models.PositiveSmallIntegerField(verbose_name="Attempts", default=0)
+    available_at = models.DateTimeField(verbose_name="Available at")
+    created_at = models.DateTimeField(verbose_name="Created at")
+    failed_at = models.DateTimeField(verbose_name="Failed at", null=True, blank=True)
+    last_error = models.TextField(verbose_name="Last error", blank=True, default="")
+
+    class Meta:
+        db_table = "task_queue"
+        verbose_name = "Queued task"
+        verbose_name_plural = "Queued tasks"
+        indexes = [
+            models.Index(
+                fields=["available_at", "id"],
+                condition=Q(failed_at__isnull=True),
+                name="task_queue_ready_idx",
+            )
+        ]
+
+    def __str__(self) -> str:
+        return f"[{self.kind}] {self.id} ({self.attempts} attempts)"
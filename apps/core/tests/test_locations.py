@@ -0,0 +1,182 @@
+# Standard Libraries
+import json
+import os
+import tempfile
+
+# Third-party Libraries
+from django.conf import settings
+from django.core.management import call_command
+from django.test import TransactionTestCase
+from fastapi.testclient import TestClient
+
+# Own Libraries
+from apps.core.models import Location as LocationModel
+from apps.location.process.location import backfill_geohash
+from apps.utils.geohash import encode as encode_geohash
+from config.asgi import fastapp
+
+FIXTURES_DIR = os.path.join(settings.BASE_DIR, "apps", "utils", "fixtures", "json")
+FIXTURES = [
+    os.path.join(FIXTURES_DIR, f"{name}.json")
+    for name in ("Country", "City", "Category", "Location", "LocationCategory")
+]
+# 1 cm east of the fixture location 1, in the same city.
+NEAR_DUPLICATE_INPUT = {
+    "category_id_list": [1],
+    "location": {
+        "country_id": 1,
+        "city_id": 1,
+        "address": "House",
+        "latitude": 10.0001,
+        "longitude": -75.0001001,
+    },
+}
+
+
+class FixtureLocationsTestCase(TransactionTestCase):
+    """
+    Queries the locations loaded from the fixtures (``make bulk-loaddata``)
+    through the API. A TransactionTestCase, since the routes read from the
+    ``async_database`` threads.
+    """
+
+    fixtures = FIXTURES
+
+    def setUp(self) -> None:
+        self.client = TestClient(fastapp)
+
+    def test_nearby_finds_the_location_at_its_coordinates(self):
+        location = LocationModel.objects.get(id=1)
+
+        response = self.client.get(
+            "/api/rest/nearby-locations",
+            params={
+                "lat": location.latitude,
+                "lon": location.longitude,
+                "radius_m": 500,
+            },
+        )
+
+        self.assertEqual(response.status_code, 200)
+        items = response.json()["items"]
+        self.assertEqual(items[0]["id"], location.id)
+        self.assertEqual(items[0]["distance_m"], 0)
+
+    def test_add_location_rejects_a_near_duplicate(self):
+        count = LocationModel.objects.count()
+
+        with self.assertLogs("apps.utils.decorator", "WARNING"):
+            response = self.client.post(
+                "/api/rest/add-locations", json=NEAR_DUPLICATE_INPUT
+            )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("as location 1 ", response.json()["response"]["message"])
+        self.assertEqual(LocationModel.objects.count(), count)
+
+
+class LocationGeohashTestCase(TransactionTestCase):
+    fixtures = FIXTURES[:3]
+
+    def test_loaddata_sets_the_geohash(self):
+        fixture = [
+            {
+                "model": "core.location",
+                "pk": 1,
+                "fields": {
+                    "created_at": "2024-05-16T18:53:58.461Z",
+                    "updated_at": "2024-05-16T19:34:37.890Z",
+                    "country": 1,
+                    "city": 1,
+                    "address": "House",
+                    "latitude": "10.0001000",
+                    "longitude": "-75.0001000",
+                },
+            }
+        ]
+        with tempfile.TemporaryDirectory() as fixture_dir:
+            path = os.path.join(fixture_dir, "location.json")
+            with open(path, "w") as file:
+                json.dump(fixture, file)
+            call_command("loaddata", path, verbosity=0)
+
+        self.assertEqual(
+            LocationModel.objects.get(id=1).geohash,
+            encode_geohash(10.0001, -75.0001),
+        )
+
+    def test_backfill_sets_the_geohash_of_bulk_created_rows(self):
+        LocationModel.objects.bulk_create(
+            [
+                LocationModel(
+                    country_id=1,
+                    city_id=1,
+                    address=f"House {number}",
+                    latitude=10 + number / 1000,
+                    longitude=-75,
+                )
+                for number in range(3)
+            ]
+        )
+
+        self.assertEqual(backfill_geohash(batch_size=2), 3)
+        self.assertFalse(LocationModel.all_objects.filter(geohash="").exists())
+        self.assertEqual(backfill_geohash(), 0)
+
+    def test_add_location_rejects_a_near_duplicate_without_geohash(self):
+        location = LocationModel.objects.bulk_create(
+            [
+                LocationModel(
+                    country_id=1,
+                    city_id=1,
+                    address="House",
+                    latitude="10.0001000",
+                    longitude="-75.0001000",
+                )
+            ]
+        )[0]
+
+        with (
+            self.assertLogs("apps.location.process.dedupe", "WARNING"),
+            self.assertLogs("apps.utils.decorator", "WARNING"),
+        ):
+            response = TestClient(fastapp).post(
+                "/api/rest/add-locations", json=NEAR_DUPLICATE_INPUT
+            )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn(
+            f"as location {location.id} ", response.json()["response"]["message"]
+        )
+
+    def test_bulk_add_reports_unknown_cities_and_countries_per_row(self):
+        rows = [
+            {"country_id": 1, "city_id": 1, "latitude": 11.5},
+            {"country_id": 1, "city_id": 999999, "latitude": 11.6},
+            {"country_id": 999999, "city_id": 1, "latitude": 11.7},
+        ]
+        body = "\n".join(
+            json.dumps(
+                {
+                    "category_id_list": [1],
+                    "location": {"address": "House", "longitude": -75.5, **row},
+                }
+            )
+            for row in rows
+        )
+
+        response = TestClient(fastapp).post(
+            "/api/rest/locations/bulk",
+            content=body,
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+
+        self.assertEqual(response.status_code, 201)
+        results = response.json()["results"]
+        self.assertEqual(
+            [result["status"] for result in results],
+            ["created", "invalid", "invalid"],
+        )
+        self.assertEqual(results[1]["message"], "City with ID 999999, not found.")
+        self.assertEqual(results[2]["message"], "Country with ID 999999, not found.")
+        self.assertEqual(LocationModel.objects.count(), 1)
@@ -0,0 +1,121 @@
+# Standard Libraries
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+# Third-party Libraries
+from django.test import TransactionTestCase
+
+# Own Libraries
+from apps.core.models import Location as LocationModel
+from apps.core.models import LocationCategory as LocationCategoryModel
+from apps.core.models import LocationCategoryViews as LocationCategoryViewsModel
+from apps.core.models import QueuedTask as QueuedTaskModel
+from apps.core.tests.test_locations import FIXTURES
+from apps.location.bg_tasks.task_worker import TaskWorker
+from apps.location.bg_tasks.view_counter import ViewCounter, write_views
+from config.env_vars import settings
+
+
+class LocationViewsTestCase(TransactionTestCase):
+    fixtures = FIXTURES[:3]
+
+    def setUp(self) -> None:
+        self.keys = []
+        for number in range(2):
+            location = LocationModel.objects.create(
+                country_id=1,
+                city_id=1,
+                address=f"House {number}",
+                latitude=10 + number / 1000,
+                longitude=-75,
+            )
+            LocationCategoryModel.objects.create(location=location, category_id=1)
+            self.keys.append((location.id, 1))
+
+    def get_total_reviews(self) -> list[int]:
+        return [
+            LocationCategoryModel.all_objects.get(
+                location_id=location_id, category_id=category_id
+            ).total_reviews
+            for location_id, category_id in self.keys
+        ]
+
+    def test_flush_queues_the_views_as_one_task(self):
+        counter = ViewCounter(flush_interval=3600.0, flush_size=1000)
+
+        async def register() -> None:
+            for _ in range(3):
+                await counter.add(*self.keys[0])
+            await counter.add_many(keys=self.keys)
+            await counter.close()
+
+        with mock.patch.object(settings, "TASK_QUEUE_ENABLED", True):
+            asyncio.run(register())
+
+        task = QueuedTaskModel.objects.get()
+        self.assertCountEqual(
+            task.payload["increments"],
+            [[*self.keys[0], 4], [*self.keys[1], 1]],
+        )
+        self.assertEqual(self.get_total_reviews(), [0, 0])
+
+        worker = TaskWorker(batch_size=10, poll_interval=0.0, lease=60.0)
+        self.assertEqual(asyncio.run(worker.run_once()), 1)
+        self.assertEqual(self.get_total_reviews(), [4, 1])
+        self.assertFalse(QueuedTaskModel.objects.exists())
+
+    def test_write_views_skips_the_keys_without_a_live_row(self):
+        # Deleted as the archive does, once the views were registered.
+        archived_key = self.keys.pop()
+        LocationCategoryModel.all_objects.filter(location_id=archived_key[0]).delete()
+        LocationModel.all_objects.filter(id=archived_key[0]).delete()
+
+        updated = asyncio.run(
+            write_views(increments={self.keys[0]: 2, archived_key: 5, (0, 1): 1})
+        )
+
+        self.assertEqual(updated, 1)
+        self.assertEqual(self.get_total_reviews(), [2])
+        self.assertEqual(
+            list(
+                LocationCategoryViewsModel.objects.values_list("location_id", "views")
+            ),
+            [(self.keys[0][0], 2)],
+        )
+
+    def test_worker_rolls_the_view_buckets_once_per_interval(self):
+        location_id, category_id = self.keys[0]
+        LocationCategoryModel.objects.filter(location_id=location_id).update(
+            recent_reviews=3
+        )
+        old_day = datetime.now(timezone.utc).date() - timedelta(
+            days=settings.LEADERBOARD_WINDOW_DAYS
+        )
+
+        def add_old_bucket(day_offset: int) -> LocationCategoryViewsModel:
+            return LocationCategoryViewsModel.objects.create(
+                location_id=location_id,
+                category_id=category_id,
+                day=old_day - timedelta(days=day_offset),
+                views=1,
+            )
+
+        first_bucket = add_old_bucket(day_offset=0)
+        worker = TaskWorker(
+            batch_size=10, poll_interval=0.0, lease=60.0, roll_interval=3600.0
+        )
+        asyncio.run(worker.roll_views_if_due())
+
+        first_bucket.refresh_from_db()
+        self.assertTrue(first_bucket.expired)
+        self.assertEqual(
+            LocationCategoryModel.objects.get(location_id=location_id).recent_reviews,
+            2,
+        )
+
+        second_bucket = add_old_bucket(day_offset=1)
+        asyncio.run(worker.roll_views_if_due())
+
+        second_bucket.refresh_from_db()
+        self.assertFalse(second_bucket.expired)
@@ -1,9 +1,9 @@
 # Standard Libraries
 import logging
-from datetime import datetime, timezone
+from collections import Counter
 
 # Own Libraries
-from apps.location.process.location_category import LocationCategoryProcess
+from apps.location.bg_tasks.view_counter import view_counter, write_views
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +13,12 @@ async def register_views(location_id: int, category_id: int):
     Asynchronous function for registering views for a location in a
     specific category.
 
+    The view is accumulated in the worker's ``view_counter``, whose
+    flushes store the views of many requests at once: as one task of the
+    durable task queue, written by ``run_task_worker``, with
+    ``TASK_QUEUE_ENABLED``, otherwise straight to the database, see
+    ``ViewCounter``.
+
     Args:
         location_id (int): The ID of the location.
         category_id (int): The ID of the category.
@@ -21,21 +27,35 @@ async def register_views(location_id: int, category_id: int):
     log_tag = "register_views"
     logger.debug(f"***BACKGROUND TASK: {log_tag}***")
 
-    process = LocationCategoryProcess()
+    await view_counter.add(location_id=location_id, category_id=category_id)
+
+
+async def register_batch_views(keys: list[tuple[int, int]]):
+    """
+    Asynchronous function for registering one view for each of many
+    locations in a category.
+
+    The views join the pending ones of the worker's ``view_counter``, see
+    ``register_views``.
+
+    Args:
+        keys (list[tuple[int, int]]): The (location_id, category_id) pairs.
+    """
+
+    log_tag = "register_batch_views"
+    logger.debug(f"***BACKGROUND TASK: {log_tag}***")
 
-    if instance := await process.get_object(
-        location_id=location_id,
-        category_id=category_id,
-        is_deleted=False,
-    ):
+    await view_counter.add_many(keys=keys)
 
-        instance.total_reviews += 1
-        instance.updated_at = datetime.now(timezone.utc)
 
-        await process.save_instance(
-            instance_to_save=instance,
-            update_fields=[
-                "updated_at",
-                "total_reviews",
-            ],
-        )
+async def run_register_views(payloads: list[dict]) -> None:
+    """
+    Task handler writing the views of many ``register_views`` tasks, each
+    one holding the increments of a ``view_counter`` flush, with a single
+    bulk UPDATE, see ``write_views``.
+    """
+    increments: Counter[tuple[int, int]] = Counter()
+    for payload in payloads:
+        for location_id, category_id, views in payload["increments"]:
+            increments[(location_id, category_id)] += views
+    await write_views(increments=dict(increments))
@@ -0,0 +1,165 @@
+# Standard Libraries
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from itertools import groupby
+from operator import attrgetter
+from typing import Awaitable, Callable
+
+# Own Libraries
+from apps.core.models import QueuedTask as QueuedTaskModel
+from apps.location.bg_tasks.register_location_view import run_register_views
+from apps.location.bg_tasks.view_counter import REGISTER_VIEWS_TASK
+from apps.location.process.leaderboard import rebuild_leaderboard
+from apps.location.process.location_category_views import roll_view_buckets
+from apps.location.process.task_queue import TaskQueueProcess
+from apps.utils.decorator import async_database
+from apps.utils.metrics import TASK_QUEUE_DEPTH, TASK_QUEUE_LATENCY, TASK_QUEUE_TASKS
+
+logger = logging.getLogger(__name__)
+
+TaskHandler = Callable[[list[dict]], Awaitable[None]]
+
+# The handler of each kind of task gets the payloads of a whole batch.
+TASK_HANDLERS: dict[str, TaskHandler] = {
+    REGISTER_VIEWS_TASK: run_register_views,
+}
+
+
+@async_database()
+def roll_views() -> tuple[int, int]:
+    """
+    Roll the daily view buckets, see ``roll_view_buckets``, and rebuild
+    the leaderboards when some bucket left the trending window.
+
+    Returns:
+        tuple[int, int]: The number of buckets expired and deleted.
+    """
+    expired, deleted = roll_view_buckets()
+    if expired:
+        rebuild_leaderboard()
+    return expired, deleted
+
+
+class TaskWorker:
+    """
+    Runs the tasks of the durable task queue, in a process of its own
+    (see the ``run_task_worker`` management command).
+
+    Each round claims a batch of ready tasks and runs them grouped by
+    kind, one handler call per kind. The tasks of a successful call are
+    deleted; those of a failing one are retried with backoff, see
+    ``TaskQueueProcess.retry``. A worker dying mid-batch leaves its tasks
+    claimed until their lease ends, so they run at least once.
+
+    Between rounds it also rolls the daily view buckets every
+    ``roll_interval`` seconds, so the trending window moves without a
+    scheduled ``roll_view_buckets``.
+
+    Attributes:
+        batch_size (int): Maximum number of tasks claimed per round.
+        poll_interval (float): Seconds to wait when the queue is empty.
+        lease (float): Seconds a claimed task is hidden from the other
+            workers.
+        roll_interval (float): Seconds between view bucket rolls, 0 to
+            never roll them.
+    """
+
+    def __init__(
+        self,
+        batch_size: int,
+        poll_interval: float,
+        lease: float,
+        roll_interval: float = 0.0,
+    ) -> None:
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.lease = lease
+        self.roll_interval = roll_interval
+        self.process = TaskQueueProcess()
+        self._next_roll_at = 0.0
+
+    async def run_once(self) -> int:
+        """
+        Claim and run one batch of tasks.
+
+        Returns:
+            int: The number of tasks claimed.
+        """
+        tasks = await self.process.claim(batch_size=self.batch_size, lease=self.lease)
+        by_kind = groupby(sorted(tasks, key=attrgetter("kind")), key=attrgetter("kind"))
+        for kind, kind_tasks in by_kind:
+            await self.run_tasks(kind=kind, tasks=list(kind_tasks))
+        return len(tasks)
+
+    async def run_tasks(self, kind: str, tasks: list[QueuedTaskModel]) -> None:
+        started_at = time.perf_counter()
+        try:
+            if (handler := TASK_HANDLERS.get(kind)) is None:
+                raise LookupError(f"No handler for the {kind} tasks")
+            await handler([task.payload for task in tasks])
+        except Exception as exp:
+            logger.error(f"***TaskWorker, {kind}, {repr(exp)}", exc_info=True)
+            failed = await self.process.retry(tasks=tasks, error=repr(exp))
+            TASK_QUEUE_TASKS.labels(kind=kind, outcome="retried").inc(
+                len(tasks) - failed
+            )
+            TASK_QUEUE_TASKS.labels(kind=kind, outcome="failed").inc(failed)
+            return
+
+        await self.process.complete(tasks=tasks)
+        now = datetime.now(timezone.utc)
+        latency = TASK_QUEUE_LATENCY.labels(kind=kind)
+        for task in tasks:
+            latency.observe((now - task.created_at).total_seconds())
+        TASK_QUEUE_TASKS.labels(kind=kind, outcome="completed").inc(len(tasks))
+        logger.info(
+            f"***TaskWorker, {kind}, {len(tasks)} tasks in "
+            f"{time.perf_counter() - started_at:.3f}s"
+        )
+
+    async def report_depth(self) -> None:
+        depth = await self.process.get_depth()
+        for kind in {*TASK_HANDLERS, *(kind for kind, _ in depth)}:
+            for state in ("ready", "failed"):
+                TASK_QUEUE_DEPTH.labels(kind=kind, state=state).set(
+                    depth.get((kind, state), 0)
+                )
+
+    async def roll_views_if_due(self) -> None:
+        """Roll the view buckets when ``roll_interval`` seconds have passed."""
+        if not self.roll_interval or time.monotonic() < self._next_roll_at:
+            return
+
+        # A failed roll is retried on the next interval too.
+        self._next_roll_at = time.monotonic() + self.roll_interval
+        try:
+            await roll_views()
+        except Exception as exp:
+            logger.error(
+                f"***TaskWorker, Roll View Buckets Error, {repr(exp)}",
+                exc_info=True,
+            )
+
+    async def run(self, stop: asyncio.Event) -> None:
+        """
+        Run batches until ``stop`` is set, polling while the queue is empty,
+        and roll the view buckets when due.
+        """
+        while not stop.is_set():
+            await self.roll_views_if_due()
+            try:
+                claimed = await self.run_once()
+                await self.report_depth()
+            except Exception as exp:
+                # E.g. the database is unreachable; try again after a pause.
+                logger.error(
+                    f"***TaskWorker, Internal Error, {repr(exp)}", exc_info=True
+                )
+                claimed = 0
+            if claimed < self.batch_size:
+                try:
+                    await asyncio.wait_for(stop.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
@@ -0,0 +1,179 @@
+# Standard Libraries
+import asyncio
+import logging
+from collections import Counter
+from typing import Iterable
+
+# Own Libraries
+from apps.location.process.leaderboard import LeaderboardProcess
+from apps.location.process.location_category import LocationCategoryProcess
+from apps.location.process.task_queue import TaskQueueProcess
+from apps.utils.db_router import use_primary
+from config.env_vars import settings
+
+logger = logging.getLogger(__name__)
+
+REGISTER_VIEWS_TASK = "register_views"
+
+
+async def write_views(increments: dict[tuple[int, int], int]) -> int:
+    """
+    Add views to the location categories with one bulk UPDATE, then
+    refresh the category leaderboards.
+
+    Args:
+        increments (dict[tuple[int, int], int]): Number of views to add
+            keyed by (location_id, category_id).
+
+    Returns:
+        int: The number of LocationCategory rows updated.
+    """
+    updated = await LocationCategoryProcess().bulk_increment_reviews(
+        increments=increments,
+    )
+    try:
+        # Read the counts just written from the primary.
+        with use_primary():
+            await LeaderboardProcess().refresh_entries(keys=list(increments))
+    except Exception as exp:
+        # The counts are already saved; the next rebuild fixes the board.
+        logger.error(
+            f"***write_views, Leaderboard Error, {repr(exp)}",
+            exc_info=True,
+        )
+    return updated
+
+
+async def store_views(increments: dict[tuple[int, int], int]) -> int:
+    """
+    Store the views flushed by a ``ViewCounter``: with ``TASK_QUEUE_ENABLED``
+    as a single task of the durable task queue, written by
+    ``run_task_worker``, otherwise right away with ``write_views``.
+
+    Args:
+        increments (dict[tuple[int, int], int]): Number of views to add
+            keyed by (location_id, category_id).
+
+    Returns:
+        int: The number of LocationCategory rows updated, 0 when queued.
+    """
+    if not settings.TASK_QUEUE_ENABLED:
+        return await write_views(increments=increments)
+
+    await TaskQueueProcess().enqueue(
+        kind=REGISTER_VIEWS_TASK,
+        payload={
+            "increments": [
+                [location_id, category_id, views]
+                for (location_id, category_id), views in increments.items()
+            ]
+        },
+    )
+    return 0
+
+
+class ViewCounter:
+    """
+    In-process write-behind accumulator for location views.
+
+    Views are coalesced per (location_id, category_id) and stored with
+    ``store_views``, as one task of the durable task queue or as a single
+    bulk ``total_reviews = total_reviews + n`` UPDATE plus the matching
+    increment of the daily view buckets, followed by an incremental
+    refresh of the category leaderboards, either every
+    ``flush_interval`` seconds, as soon as ``flush_size`` views are
+    pending, or when the worker shuts down.
+
+    Attributes:
+        flush_interval (float): Seconds between periodic flushes.
+        flush_size (int): Number of pending views that triggers a flush.
+    """
+
+    def __init__(self, flush_interval: float, flush_size: int) -> None:
+        self.flush_interval = flush_interval
+        self.flush_size = flush_size
+        self._pending: Counter[tuple[int, int]] = Counter()
+        self._pending_views = 0
+        self._flush_lock = asyncio.Lock()
+        self._periodic_task: asyncio.Task | None = None
+
+    @property
+    def pending_views(self) -> int:
+        return self._pending_views
+
+    async def add(self, location_id: int, category_id: int, views: int = 1) -> None:
+        """
+        Register ``views`` views for a location in a category, flushing
+        when the size threshold is reached.
+        """
+        self._pending[(location_id, category_id)] += views
+        self._pending_views += views
+        self._ensure_periodic_flush()
+
+        if self._pending_views >= self.flush_size:
+            await self.flush()
+
+    async def add_many(self, keys: Iterable[tuple[int, int]]) -> None:
+        """
+        Register one view for each (location_id, category_id) of ``keys``,
+        checking the size threshold once for all of them.
+        """
+        for key in keys:
+            self._pending[key] += 1
+            self._pending_views += 1
+        self._ensure_periodic_flush()
+
+        if self._pending_views >= self.flush_size:
+            await self.flush()
+
+    async def flush(self) -> int:
+        """
+        Store every pending increment at once, see ``store_views``.
+
+        Returns:
+            int: The number of LocationCategory rows updated, 0 when queued.
+        """
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+
+            increments, self._pending = self._pending, Counter()
+            self._pending_views = 0
+
+            try:
+                return await store_views(increments=dict(increments))
+            except Exception as exp:
+                # Put the increments back so they are retried on the next flush.
+                self._pending.update(increments)
+                self._pending_views += sum(increments.values())
+                logger.error(
+                    f"***ViewCounter.flush, Internal Error, {repr(exp)}",
+                    exc_info=True,
+                )
+                return 0
+
+    async def close(self) -> None:
+        """Stop the periodic flush and write the remaining increments."""
+        if task := self._periodic_task:
+            self._periodic_task = None
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await self.flush()
+
+    def _ensure_periodic_flush(self) -> None:
+        if self._periodic_task is None or self._periodic_task.done():
+            self._periodic_task = asyncio.create_task(self._periodic_flush())
+
+    async def _periodic_flush(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+
+view_counter = ViewCounter(
+    flush_interval=settings.VIEW_COUNTER_FLUSH_INTERVAL,
+    flush_size=settings.VIEW_COUNTER_FLUSH_SIZE,
+)
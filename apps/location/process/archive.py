@@ -0,0 +1,150 @@
+# Standard Libraries
+import logging
+from datetime import datetime, timedelta, timezone
+
+# Third-party Libraries
+from django.db import models, transaction
+
+# Own Libraries
+from apps.core.models import ArchivedLocation as ArchivedLocationModel
+from apps.core.models import ArchivedLocationCategory as ArchivedLocationCategoryModel
+from apps.core.models import Location as LocationModel
+from apps.core.models import LocationCategory as LocationCategoryModel
+from config.env_vars import settings
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 1000
+
+
+def copy_to_archive(
+    archive_model: type[models.Model],
+    instances: list[models.Model],
+    archived_at: datetime,
+) -> None:
+    """Insert a copy of ``instances`` in their archive table."""
+    field_names = [
+        field.attname
+        for field in archive_model._meta.concrete_fields
+        if field.attname != "archived_at"
+    ]
+    archive_model.objects.bulk_create(
+        [
+            archive_model(
+                archived_at=archived_at,
+                **{name: getattr(instance, name) for name in field_names},
+            )
+            for instance in instances
+        ]
+    )
+
+
+def archive_deleted_locations(
+    deleted_before: datetime,
+    batch_size: int,
+) -> tuple[int, int]:
+    """
+    Move the locations soft-deleted before ``deleted_before``, with all
+    their categories, to the archive tables, in batches of ``batch_size``
+    locations. Their view buckets and leaderboard entries are deleted.
+
+    Returns:
+        tuple[int, int]: The number of locations and location categories
+        archived.
+    """
+    archived = archived_categories = 0
+    while True:
+        with transaction.atomic():
+            locations = list(
+                LocationModel.all_objects.select_for_update(skip_locked=True)
+                .filter(is_deleted=True, updated_at__lt=deleted_before)
+                .order_by("id")[:batch_size]
+            )
+            if not locations:
+                return archived, archived_categories
+
+            location_id_list = [location.id for location in locations]
+            locations_categories = list(
+                LocationCategoryModel.all_objects.filter(
+                    location_id__in=location_id_list
+                )
+            )
+            archived_at = datetime.now(timezone.utc)
+            copy_to_archive(
+                ArchivedLocationCategoryModel,
+                instances=locations_categories,
+                archived_at=archived_at,
+            )
+            copy_to_archive(
+                ArchivedLocationModel,
+                instances=locations,
+                archived_at=archived_at,
+            )
+            LocationCategoryModel.all_objects.filter(
+                location_id__in=location_id_list
+            ).delete()
+            LocationModel.all_objects.filter(id__in=location_id_list).delete()
+        archived += len(locations)
+        archived_categories += len(locations_categories)
+
+
+def archive_deleted_locations_categories(
+    deleted_before: datetime,
+    batch_size: int,
+) -> int:
+    """
+    Move the location categories soft-deleted before ``deleted_before``
+    to the archive table, in batches of ``batch_size`` rows.
+
+    Returns:
+        int: The number of location categories archived.
+    """
+    archived = 0
+    while True:
+        with transaction.atomic():
+            locations_categories = list(
+                LocationCategoryModel.all_objects.select_for_update(skip_locked=True)
+                .filter(is_deleted=True, updated_at__lt=deleted_before)
+                .order_by("id")[:batch_size]
+            )
+            if not locations_categories:
+                return archived
+
+            copy_to_archive(
+                ArchivedLocationCategoryModel,
+                instances=locations_categories,
+                archived_at=datetime.now(timezone.utc),
+            )
+            LocationCategoryModel.all_objects.filter(
+                id__in=[instance.id for instance in locations_categories]
+            ).delete()
+        archived += len(locations_categories)
+
+
+def archive_deleted_rows(
+    days: int | None = None,
+    batch_size: int = BATCH_SIZE,
+) -> tuple[int, int]:
+    """
+    Archive the locations and location categories soft-deleted more than
+    ``days`` (defaults to ``ARCHIVE_AFTER_DAYS``) ago, i.e. not modified
+    since, so the hot tables and their indexes only grow with live rows.
+
+    Returns:
+        tuple[int, int]: The number of locations and location categories
+        archived, the categories of the archived locations included.
+    """
+    days = settings.ARCHIVE_AFTER_DAYS if days is None else days
+    deleted_before = datetime.now(timezone.utc) - timedelta(days=days)
+
+    locations, locations_categories = archive_deleted_locations(
+        deleted_before, batch_size=batch_size
+    )
+    locations_categories += archive_deleted_locations_categories(
+        deleted_before, batch_size=batch_size
+    )
+    logger.info(
+        f"***Archive deleted rows, {locations} locations, "
+        f"{locations_categories} location categories"
+    )
+    return locations, locations_categories
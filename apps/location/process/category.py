@@ -53,10 +53,11 @@ class EditionCategoryProcess:
     def get_or_create(self, **kwargs) -> CategoryModel:
         """
         Retrieve a CategoryModel object based on the provided filters or
-        create it if it doesn't exist.
+        create it if it doesn't exist. Soft-deleted categories are matched
+        too, their slug being unique.
 
         """
-        obj, _ = CategoryModel.objects.get_or_create(**kwargs)
+        obj, _ = CategoryModel.all_objects.get_or_create(**kwargs)
         return obj
 
 
@@ -1,13 +1,58 @@
 # Standard Libraries
 import logging
 
+# Third-party Libraries
+from django.db.models.signals import post_delete, post_save
+
 # Own Libraries
 from apps.core.models import City as CityModel
 from apps.core.models import Country as CountryModel
+from apps.location.schema.types.city import CityRecord, CountryRecord
+from apps.utils.cache import VersionedCache
 from apps.utils.decorator import async_database
+from config.env_vars import settings
 
 logger = logging.getLogger(__name__)
 
+CityCountryIndex = dict[int, tuple[CityRecord, CountryRecord]]
+
+
+def load_city_and_country() -> CityCountryIndex:
+    """
+    Build the index of city and country records by city_id with a single
+    joined query.
+    """
+    queryset = CityModel.objects.filter(is_deleted=False).values_list(
+        "id",
+        "name",
+        "country_id",
+        "country__name",
+        "country__code",
+    )
+    countries: dict[int, CountryRecord] = {}
+    index = {}
+    for city_id, name, country_id, country_name, country_code in queryset:
+        if (country := countries.get(country_id)) is None:
+            country = countries[country_id] = CountryRecord(
+                id=country_id,
+                name=country_name,
+                code=country_code,
+            )
+        city = CityRecord(id=city_id, name=name, country_id=country_id)
+        index[city_id] = (city, country)
+    return index
+
+
+city_cache: VersionedCache[CityCountryIndex] = VersionedCache(
+    name="city_and_country",
+    loader=load_city_and_country,
+    ttl=settings.REFERENCE_CACHE_TTL,
+)
+
+for sender in (CityModel, CountryModel):
+    post_save.connect(city_cache.invalidate, sender=sender, weak=False)
+    post_delete.connect(city_cache.invalidate, sender=sender, weak=False)
+
 
 class QueryCityProcess:
     """
@@ -15,11 +60,20 @@ class QueryCityProcess:
 
     """
 
+    async def get_city_and_country(self) -> CityCountryIndex:
+        """
+        Return index dict with tuple CityRecord and CountryRecord by city_id.
+
+        The index is served from the process-wide ``city_cache``; the
+        database is only queried when the cache has been invalidated.
+        """
+        if (index := city_cache.peek()) is not None:
+            return index
+        return await self._load_city_and_country()
+
     @async_database()
-    def get_city_and_country(self) -> dict[int, tuple[CityModel, CountryModel]]:
-        """Return index dict with tuple CityModel and CountryModel by city_id"""
-        queryset = CityModel.objects.filter(is_deleted=False)
-        return {city.id: (city, city.country) for city in queryset}
+    def _load_city_and_country(self) -> CityCountryIndex:
+        return city_cache.get()
 
 
 class EditionCityProcess:
@@ -0,0 +1,204 @@
+# Standard Libraries
+import logging
+
+# Third-party Libraries
+from django.db import transaction
+from django.db.models import Count, FloatField, IntegerField, QuerySet, Sum, Value
+from django.db.models.functions import Cast, Floor
+
+# Own Libraries
+from apps.core.models import Location as LocationModel
+from apps.core.models import LocationCategory as LocationCategoryModel
+from apps.core.models import LocationCluster as ClusterModel
+from apps.utils.decorator import async_database
+from apps.utils.grid import cell_range, cell_size_degrees
+from config.env_vars import settings
+
+logger = logging.getLogger(__name__)
+
+ALL_CATEGORIES = 0
+BATCH_SIZE = 1000
+
+
+def aggregate_cells(
+    queryset: QuerySet,
+    zoom: int,
+    prefix: str = "",
+    group_by: tuple[str, ...] = (),
+) -> QuerySet:
+    """
+    Group ``queryset`` by grid cell at ``zoom`` (and ``group_by``) with
+    the count and coordinate sums of each cell.
+
+    Args:
+        queryset (QuerySet): Location rows, or rows reaching them through
+            ``prefix``.
+        zoom (int): The zoom level of the grid.
+        prefix (str): The lookup path to the location, e.g. "location__".
+        group_by (tuple[str, ...]): Extra fields to group by.
+    """
+    size = cell_size_degrees(zoom)
+    latitude = Cast(f"{prefix}latitude", FloatField())
+    longitude = Cast(f"{prefix}longitude", FloatField())
+    return (
+        queryset.annotate(
+            cell_x=Cast(
+                Floor((longitude + Value(180.0)) / Value(size)), IntegerField()
+            ),
+            cell_y=Cast(Floor((latitude + Value(90.0)) / Value(size)), IntegerField()),
+        )
+        .values("cell_x", "cell_y", *group_by)
+        .annotate(
+            count=Count("id"),
+            latitude_sum=Sum(latitude),
+            longitude_sum=Sum(longitude),
+        )
+        .order_by()
+    )
+
+
+def rebuild_zoom(zoom: int) -> int:
+    """
+    Replace the cluster aggregates of ``zoom``: one row per non-empty cell
+    for all the categories, tagged with its top category, plus one row per
+    category present in the cell.
+
+    Returns:
+        int: The number of rows written.
+    """
+    clusters = []
+    top_categories: dict[tuple[int, int], tuple[int, int]] = {}
+    for cell in aggregate_cells(
+        LocationCategoryModel.objects.filter(
+            is_deleted=False,
+            location__is_deleted=False,
+        ),
+        zoom=zoom,
+        prefix="location__",
+        group_by=("category_id",),
+    ).iterator(chunk_size=BATCH_SIZE):
+        key = (cell["cell_x"], cell["cell_y"])
+        category_id, count = cell["category_id"], cell["count"]
+        clusters.append(
+            ClusterModel(
+                zoom=zoom,
+                category_key=category_id,
+                cell_x=cell["cell_x"],
+                cell_y=cell["cell_y"],
+                count=count,
+                latitude_sum=cell["latitude_sum"],
+                longitude_sum=cell["longitude_sum"],
+                top_category_id=category_id,
+            )
+        )
+        top_count, top_category_id = top_categories.get(key, (0, 0))
+        if (count, -category_id) > (top_count, -top_category_id):
+            top_categories[key] = (count, category_id)
+
+    for cell in aggregate_cells(
+        LocationModel.objects.filter(is_deleted=False),
+        zoom=zoom,
+    ).iterator(chunk_size=BATCH_SIZE):
+        key = (cell["cell_x"], cell["cell_y"])
+        clusters.append(
+            ClusterModel(
+                zoom=zoom,
+                category_key=ALL_CATEGORIES,
+                cell_x=cell["cell_x"],
+                cell_y=cell["cell_y"],
+                count=cell["count"],
+                latitude_sum=cell["latitude_sum"],
+                longitude_sum=cell["longitude_sum"],
+                top_category_id=top_categories.get(key, (0, None))[1],
+            )
+        )
+
+    with transaction.atomic():
+        ClusterModel.objects.filter(zoom=zoom).delete()
+        ClusterModel.objects.bulk_create(clusters, batch_size=BATCH_SIZE)
+    return len(clusters)
+
+
+def rebuild_clusters(max_zoom: int | None = None) -> dict[int, int]:
+    """
+    Rebuild the cluster aggregates of every zoom level up to ``max_zoom``
+    (``CLUSTER_MAX_ZOOM`` by default).
+
+    Returns:
+        dict[int, int]: The number of rows written by zoom level.
+    """
+    max_zoom = settings.CLUSTER_MAX_ZOOM if max_zoom is None else max_zoom
+    written = {}
+    for zoom in range(max_zoom + 1):
+        written[zoom] = rebuild_zoom(zoom=zoom)
+        logger.info(f"***Rebuild clusters, zoom {zoom}, {written[zoom]} rows")
+    return written
+
+
+class QueryClusterProcess:
+    """
+    A class to handle querying operations for ClusterModel objects
+    asynchronously.
+
+    """
+
+    @async_database()
+    def get_clusters(
+        self,
+        zoom: int,
+        min_latitude: float,
+        min_longitude: float,
+        max_latitude: float,
+        max_longitude: float,
+        category_id: int | None = None,
+    ) -> list[ClusterModel]:
+        """
+        Retrieve the non-empty cells of ``zoom`` overlapping a bounding
+        box, with their top category.
+
+        Args:
+            zoom (int): The zoom level.
+            min_latitude (float): South edge of the bounding box.
+            min_longitude (float): West edge of the bounding box.
+            max_latitude (float): North edge of the bounding box.
+            max_longitude (float): East edge of the bounding box.
+            category_id (int | None): Optional. Count only the locations
+                of this category.
+
+        Returns:
+            list[ClusterModel]: The clusters, one per cell.
+
+        Raises:
+            AssertionError: If the bounding box spans more than
+                ``VIEWPORT_MAX_CELLS`` cells at this zoom.
+        """
+        min_x, min_y, max_x, max_y = cell_range(
+            min_latitude, min_longitude, max_latitude, max_longitude, zoom
+        )
+        cells = (max_x - min_x + 1) * (max_y - min_y + 1)
+        if cells > settings.VIEWPORT_MAX_CELLS:
+            raise AssertionError(
+                f"The viewport spans {cells} cells at zoom {zoom}; zoom in or "
+                "reduce the bounding box."
+            )
+
+        return list(
+            ClusterModel.objects.select_related("top_category")
+            .filter(
+                zoom=zoom,
+                category_key=category_id or ALL_CATEGORIES,
+                cell_y__range=(min_y, max_y),
+                cell_x__range=(min_x, max_x),
+                count__gt=0,
+            )
+            .order_by("cell_y", "cell_x")
+        )
+
+
+class ClusterProcess(QueryClusterProcess):
+    """
+    A combined class inheriting querying operations for ClusterModel
+    objects asynchronously.
+    """
+
+    pass
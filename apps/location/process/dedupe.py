@@ -0,0 +1,195 @@
+# Standard Libraries
+import bisect
+import logging
+import math
+from decimal import Decimal
+from itertools import groupby
+from operator import attrgetter
+from typing import Iterable, Iterator, NamedTuple
+
+# Third-party Libraries
+from django.db import router
+from django.db.models import Q
+
+# Own Libraries
+from apps.core.models import Location as LocationModel
+from apps.utils import geohash
+
+logger = logging.getLogger(__name__)
+
+# Prefix lookups of a single candidates query; more cells are merged into
+# their common prefixes.
+MAX_PROBE_PREFIXES = 64
+
+
+class LocationPoint(NamedTuple):
+    """The values of a location compared by the duplicate detection."""
+
+    id: int | None
+    country_id: int
+    city_id: int
+    latitude: Decimal
+    longitude: Decimal
+    is_deleted: bool = False
+
+
+POINT_FIELDS = LocationPoint._fields
+
+
+class GeohashIndex:
+    """
+    In-memory spatial index of location points.
+
+    The points are kept sorted by their geohash, so the points of a cell
+    are the contiguous range of hashes starting with it, found by
+    bisection.
+    """
+
+    def __init__(self, points: Iterable[LocationPoint] = ()) -> None:
+        pairs = sorted(
+            (geohash.encode(point.latitude, point.longitude), point) for point in points
+        )
+        self._hashes = [point_hash for point_hash, _ in pairs]
+        self._points = [point for _, point in pairs]
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def add(self, point: LocationPoint) -> None:
+        point_hash = geohash.encode(point.latitude, point.longitude)
+        index = bisect.bisect_right(self._hashes, point_hash)
+        self._hashes.insert(index, point_hash)
+        self._points.insert(index, point)
+
+    def candidates(
+        self,
+        latitude: Decimal,
+        longitude: Decimal,
+        radius_m: float,
+    ) -> Iterator[LocationPoint]:
+        """Yield the points of the cells around a coordinate (see ``cells_around``)."""
+        for cell in geohash.cells_around(latitude, longitude, radius_m):
+            start = bisect.bisect_left(self._hashes, cell)
+            # "~" sorts after every geohash character.
+            end = bisect.bisect_left(self._hashes, cell + "~", lo=start)
+            yield from self._points[start:end]
+
+
+def find_duplicate(
+    point: LocationPoint,
+    candidates: Iterable[LocationPoint],
+    radius_m: float,
+) -> tuple[LocationPoint, float] | None:
+    """
+    Return the closest of ``candidates`` that duplicates ``point``, with
+    its distance in metres: a live location of the same country and city
+    within ``radius_m`` metres, or one with the same coordinates, even
+    soft-deleted, which the unique constraint would reject.
+    """
+    duplicate = None
+    for candidate in candidates:
+        if candidate.id is not None and candidate.id == point.id:
+            continue
+        if (candidate.country_id, candidate.city_id) != (
+            point.country_id,
+            point.city_id,
+        ):
+            continue
+        distance = geohash.haversine_m(
+            point.latitude, point.longitude, candidate.latitude, candidate.longitude
+        )
+        same_key = (candidate.latitude, candidate.longitude) == (
+            point.latitude,
+            point.longitude,
+        )
+        if (same_key or (not candidate.is_deleted and distance <= radius_m)) and (
+            duplicate is None or distance < duplicate[1]
+        ):
+            duplicate = (candidate, distance)
+    return duplicate
+
+
+def load_candidates(
+    points: Iterable[LocationPoint],
+    radius_m: float,
+) -> list[LocationPoint]:
+    """
+    Read the registered locations that may duplicate ``points`` with one
+    query: a prefix lookup on the geohash index per cell around them, plus
+    the locations without a geohash (written by ``bulk_create`` or
+    ``update``, until ``backfill_geohash`` runs) inside the bounding box
+    of the points.
+
+    They are read from the database written to, so a replica lagging
+    behind does not hide a location just registered.
+    """
+    points = list(points)
+    if not points:
+        return []
+    cells = {
+        cell
+        for point in points
+        for cell in geohash.cells_around(point.latitude, point.longitude, radius_m)
+    }
+    cells_filter = Q()
+    for prefix in geohash.covering_prefixes(cells, max_prefixes=MAX_PROBE_PREFIXES):
+        cells_filter |= Q(geohash__startswith=prefix)
+
+    latitudes = [float(point.latitude) for point in points]
+    longitudes = [float(point.longitude) for point in points]
+    latitude_margin = radius_m / geohash.METERS_PER_DEGREE
+    max_latitude = min(90.0, max(map(abs, latitudes)) + latitude_margin)
+    longitude_margin = latitude_margin / max(math.cos(math.radians(max_latitude)), 1e-6)
+    cells_filter |= Q(
+        geohash="",
+        latitude__range=(
+            min(latitudes) - latitude_margin,
+            max(latitudes) + latitude_margin,
+        ),
+        longitude__range=(
+            min(longitudes) - longitude_margin,
+            max(longitudes) + longitude_margin,
+        ),
+    )
+
+    rows = (
+        LocationModel.all_objects.using(router.db_for_write(LocationModel))
+        .filter(cells_filter, city_id__in={point.city_id for point in points})
+        .values_list(*POINT_FIELDS, "geohash")
+    )
+    candidates = []
+    without_geohash = 0
+    for *values, point_hash in rows:
+        candidates.append(LocationPoint._make(values))
+        without_geohash += not point_hash
+    if without_geohash:
+        logger.warning(
+            f"***Load candidates, {without_geohash} locations without geohash; "
+            "run backfill_geohash"
+        )
+    return candidates
+
+
+def find_duplicate_locations(
+    radius_m: float,
+    chunk_size: int = 2000,
+) -> Iterator[tuple[LocationPoint, LocationPoint, float]]:
+    """
+    Scan the live locations city by city, streamed in chunks of
+    ``chunk_size`` rows, and yield each one that duplicates an earlier
+    one of its city, with that one and their distance in metres.
+
+    Only the locations of one city are held in memory at a time.
+    """
+    rows = (
+        LocationModel.objects.order_by("city_id", "id")
+        .values_list(*POINT_FIELDS)
+        .iterator(chunk_size=chunk_size)
+    )
+    for _, points in groupby(map(LocationPoint._make, rows), key=attrgetter("city_id")):
+        index = GeohashIndex()
+        for point in points:
+            candidates = index.candidates(point.latitude, point.longitude, radius_m)
+            if duplicate := find_duplicate(point, candidates, radius_m):
+                yield (point, *duplicate)
+            index.add(point)
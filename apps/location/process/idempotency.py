@@ -0,0 +1,232 @@
+# Standard Libraries
+import functools
+import hashlib
+import logging
+from datetime import datetime, timedelta, timezone
+
+# Third-party Libraries
+from django.db import transaction
+from fastapi import responses, status
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+# Own Libraries
+from apps.core.models import IdempotencyKey as IdempotencyKeyModel
+from apps.location.schema.response.interface import Response
+from apps.utils.decorator import PayloadClass, async_database
+from apps.utils.metrics import IDEMPOTENCY_OUTCOMES
+from apps.utils.responses import PayloadResponse
+from config.env_vars import settings
+
+logger = logging.getLogger(__name__)
+
+# A key still claimed this long after its request started belongs to a
+# request that never answered (its worker died, or it was cancelled) and
+# can be claimed again.
+CLAIM_TIMEOUT = timedelta(seconds=60)
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+
+def get_request_hash(input: BaseModel) -> str:
+    """Return the SHA-256 digest of the validated input of a request."""
+    return hashlib.sha256(input.model_dump_json().encode()).hexdigest()
+
+
+class IdempotencyProcess:
+    """
+    A class to claim the ``Idempotency-Key`` of a request and store its
+    response asynchronously.
+    """
+
+    @async_database()
+    def claim(
+        self,
+        scope: str,
+        key: str,
+        request_hash: str,
+    ) -> tuple[IdempotencyKeyModel, bool]:
+        """
+        Return the record of a key, with one lookup on its unique index,
+        and whether it was claimed for this request: it did not exist, it
+        expired or its claim was abandoned.
+
+        Args:
+            scope (str): The route the key was sent to.
+            key (str): The ``Idempotency-Key`` header of the request.
+            request_hash (str): The digest of the request input.
+        """
+        now = datetime.now(timezone.utc)
+        claim = {
+            "request_hash": request_hash,
+            "status_code": None,
+            "response": b"",
+            "created_at": now,
+            "expires_at": now + timedelta(seconds=settings.IDEMPOTENCY_KEY_TTL),
+        }
+        records = IdempotencyKeyModel.objects.select_for_update()
+        with transaction.atomic():
+            record, created = records.get_or_create(
+                scope=scope,
+                key=key,
+                defaults=claim,
+            )
+            if created:
+                return record, True
+
+            if record.expires_at <= now or (
+                record.status_code is None and record.created_at <= now - CLAIM_TIMEOUT
+            ):
+                for field, value in claim.items():
+                    setattr(record, field, value)
+                record.save(update_fields=list(claim))
+                return record, True
+
+        return record, False
+
+    @async_database()
+    def save_response(
+        self,
+        record: IdempotencyKeyModel,
+        status_code: int,
+        body: bytes,
+    ) -> None:
+        record.status_code = status_code
+        record.response = body
+        record.save(update_fields=["status_code", "response"])
+
+    @async_database()
+    def release(self, record: IdempotencyKeyModel) -> None:
+        """Delete a claim, so the retries of the request run it again."""
+        record.delete()
+
+
+def replay_response(
+    record: IdempotencyKeyModel,
+    request_hash: str,
+    payload_class: PayloadClass,
+) -> tuple[responses.Response, str]:
+    """
+    Return the response to a request whose key was claimed before, with
+    its outcome: the stored response, or an error when the key was sent
+    with another input or its first request is still running.
+    """
+    if record.request_hash != request_hash:
+        status_code, outcome = status.HTTP_422_UNPROCESSABLE_ENTITY, "mismatch"
+        message = "This Idempotency-Key was already used for another request"
+    elif record.status_code is None:
+        status_code, outcome = status.HTTP_409_CONFLICT, "in_progress"
+        message = "A request with this Idempotency-Key is still in progress"
+    else:
+        return (
+            responses.Response(
+                content=bytes(record.response),
+                status_code=record.status_code,
+                media_type="application/json",
+                headers={REPLAYED_HEADER: "true"},
+            ),
+            "replayed",
+        )
+
+    content = payload_class.empty_state(
+        response=Response(
+            status_code=status_code,
+            type="Idempotency Error",
+            message=message,
+        )
+    )
+    return (
+        JSONResponse(content=content.model_dump(), status_code=status_code),
+        outcome,
+    )
+
+
+def idempotent(scope: str, payload_class: PayloadClass):
+    """
+    Decorator answering the retries of a write route, sent with the same
+    ``Idempotency-Key`` header, with the response stored for their first
+    request, without running the route again.
+
+    The route declares an ``input`` body and an ``idempotency_key``
+    header parameter. Placed above ``handler_exception``, so validation
+    errors are stored as well; server errors are not, and the key is
+    released for the retries.
+
+    Args:
+        scope (str): Name of the route the keys are scoped to.
+        payload_class (PayloadClass): The class for generating empty
+            states of payload.
+    """
+
+    def decorator(func):
+        process = IdempotencyProcess()
+        outcomes = {
+            outcome: IDEMPOTENCY_OUTCOMES.labels(scope=scope, outcome=outcome)
+            for outcome in ("executed", "replayed", "in_progress", "mismatch")
+        }
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            if not (key := kwargs.get("idempotency_key")):
+                return await func(*args, **kwargs)
+
+            request_hash = get_request_hash(kwargs["input"])
+            record, claimed = await process.claim(
+                scope=scope,
+                key=key,
+                request_hash=request_hash,
+            )
+            if not claimed:
+                response, outcome = replay_response(
+                    record,
+                    request_hash=request_hash,
+                    payload_class=payload_class,
+                )
+                outcomes[outcome].inc()
+                return response
+
+            result = await func(*args, **kwargs)
+            response = (
+                result
+                if isinstance(result, responses.Response)
+                else PayloadResponse(
+                    content=result,
+                    status_code=result.response.status_code,
+                )
+            )
+            # The route already ran: its response is returned even if it
+            # cannot be stored, and the claim then expires after
+            # CLAIM_TIMEOUT.
+            try:
+                if response.status_code >= status.HTTP_500_INTERNAL_SERVER_ERROR:
+                    await process.release(record)
+                else:
+                    await process.save_response(
+                        record,
+                        status_code=response.status_code,
+                        body=bytes(response.body),
+                    )
+            except Exception as exp:
+                logger.error(
+                    f"***{scope} idempotency, store response failed, {repr(exp)}",
+                    exc_info=True,
+                )
+            outcomes["executed"].inc()
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def prune_idempotency_keys() -> int:
+    """
+    Delete the expired idempotency keys.
+
+    Returns:
+        int: The number of keys deleted.
+    """
+    deleted, _ = IdempotencyKeyModel.objects.filter(
+        expires_at__lte=datetime.now(timezone.utc)
+    ).delete()
+    logger.info(f"***Prune idempotency keys, {deleted} keys")
+    return deleted
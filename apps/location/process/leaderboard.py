@@ -0,0 +1,260 @@
+# Standard Libraries
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Iterable
+
+# Third-party Libraries
+from django.db import transaction
+from django.db.models import Count, Max, Q, QuerySet, Sum
+
+# Own Libraries
+from apps.core.models import Category as CategoryModel
+from apps.core.models import CategoryLeaderboard as LeaderboardModel
+from apps.core.models import Location as LocationModel
+from apps.core.models import LocationCategory as LocationCategoryModel
+from apps.utils.decorator import async_database
+from config.env_vars import settings
+
+logger = logging.getLogger(__name__)
+
+
+def get_window_start() -> datetime:
+    """Return the start of the trending window."""
+    return datetime.now(timezone.utc) - timedelta(days=settings.LEADERBOARD_WINDOW_DAYS)
+
+
+def rebuild_category(category_id: int, size: int, since: datetime) -> int:
+    """
+    Replace the leaderboard of a category with its current top ``size``
+    locations by views within the trending window, last viewed since
+    ``since``.
+
+    Returns:
+        int: The number of leaderboard rows written.
+    """
+    top_rows = (
+        LocationCategoryModel.objects.filter(
+            category_id=category_id,
+            is_deleted=False,
+            location__is_deleted=False,
+            recent_reviews__gt=0,
+            updated_at__gte=since,
+        )
+        .order_by("-recent_reviews", "-location_id")
+        .values_list("location_id", "total_reviews", "recent_reviews", "updated_at")[
+            :size
+        ]
+    )
+    entries = [
+        LeaderboardModel(
+            category_id=category_id,
+            location_id=location_id,
+            total_reviews=total_reviews,
+            recent_reviews=recent_reviews,
+            last_viewed_at=updated_at,
+        )
+        for location_id, total_reviews, recent_reviews, updated_at in top_rows
+    ]
+    with transaction.atomic():
+        LeaderboardModel.objects.filter(category_id=category_id).delete()
+        LeaderboardModel.objects.bulk_create(entries)
+    return len(entries)
+
+
+def rebuild_leaderboard(size: int | None = None) -> dict[int, int]:
+    """
+    Rebuild the leaderboard of every live category.
+
+    Returns:
+        dict[int, int]: The number of rows written by category ID.
+    """
+    size = size or settings.LEADERBOARD_SIZE
+    since = get_window_start()
+    category_id_list = CategoryModel.objects.filter(is_deleted=False).values_list(
+        "id", flat=True
+    )
+    return {
+        category_id: rebuild_category(
+            category_id=category_id,
+            size=size,
+            since=since,
+        )
+        for category_id in category_id_list
+    }
+
+
+class QueryLeaderboardProcess:
+    """
+    A class to handle querying operations for LeaderboardModel objects
+    asynchronously.
+
+    """
+
+    def _get_ranked(self, category_id: int) -> QuerySet[LeaderboardModel]:
+        return LeaderboardModel.objects.filter(
+            category_id=category_id,
+            recent_reviews__gt=0,
+            last_viewed_at__gte=get_window_start(),
+            location__is_deleted=False,
+        )
+
+    @async_database()
+    def get_page(
+        self,
+        category_id: int,
+        limit: int,
+        after: tuple[int, int] | None = None,
+    ) -> list[LocationModel]:
+        """
+        Retrieve a page of the leaderboard of a category as LocationModel
+        objects annotated with ``total_reviews`` and ``recent_reviews``.
+
+        Args:
+            category_id (int): The ID of the category.
+            limit (int): The maximum number of objects to retrieve.
+            after (tuple[int, int] | None): Optional. The
+                (recent_reviews, location_id) of the last item of the
+                previous page.
+
+        Returns:
+            list[LocationModel]: Up to ``limit + 1`` objects, most viewed
+            within the window first; the extra one tells the caller whether
+            a next page exists.
+        """
+        queryset = self._get_ranked(category_id=category_id).select_related("location")
+        if after:
+            recent_reviews, location_id = after
+            queryset = queryset.filter(
+                Q(recent_reviews__lt=recent_reviews)
+                | Q(recent_reviews=recent_reviews, location_id__lt=location_id)
+            )
+
+        locations = []
+        for entry in queryset.order_by("-recent_reviews", "-location_id")[: limit + 1]:
+            location = entry.location
+            location.total_reviews = entry.total_reviews
+            location.recent_reviews = entry.recent_reviews
+            locations.append(location)
+        return locations
+
+    @async_database()
+    def get_version(self, category_id: int) -> tuple:
+        """
+        Return values that change whenever the ranked locations of a
+        category change, to derive ETags without building the page.
+        """
+        version = self._get_ranked(category_id=category_id).aggregate(
+            count=Count("id"),
+            total_reviews=Sum("total_reviews"),
+            recent_reviews=Sum("recent_reviews"),
+            last_viewed_at=Max("last_viewed_at"),
+            location_updated_at=Max("location__updated_at"),
+        )
+        return tuple(version.values())
+
+    @async_database()
+    def count(self, category_id: int) -> int:
+        """
+        Return the number of ranked locations of a category; at most
+        ``LEADERBOARD_SIZE``.
+        """
+        return self._get_ranked(category_id=category_id).count()
+
+
+class EditionLeaderboardProcess:
+    """
+    A class to handle editing operations for LeaderboardModel objects
+    asynchronously.
+
+    """
+
+    @async_database()
+    def refresh_entries(self, keys: Iterable[tuple[int, int]]) -> int:
+        """
+        Incrementally update the leaderboards after the view counts of some
+        (location_id, category_id) pairs changed.
+
+        Pairs that reach the top ``LEADERBOARD_SIZE`` of their category are
+        upserted and the rows pushed below it are removed, along with the
+        rows hidden from the board: last viewed before the trending window
+        or of a deleted location.
+
+        Args:
+            keys (Iterable[tuple[int, int]]): The (location_id, category_id)
+                pairs whose counts changed.
+
+        Returns:
+            int: The number of leaderboard rows upserted.
+        """
+        rows_filter = Q()
+        for location_id, category_id in keys:
+            rows_filter |= Q(location_id=location_id, category_id=category_id)
+        if not rows_filter:
+            return 0
+
+        rows = LocationCategoryModel.objects.filter(
+            rows_filter,
+            is_deleted=False,
+            location__is_deleted=False,
+        ).values_list(
+            "location_id",
+            "category_id",
+            "total_reviews",
+            "recent_reviews",
+            "updated_at",
+        )
+        candidates: dict[int, list[LeaderboardModel]] = {}
+        for location_id, category_id, total_reviews, recent_reviews, updated_at in rows:
+            candidates.setdefault(category_id, []).append(
+                LeaderboardModel(
+                    category_id=category_id,
+                    location_id=location_id,
+                    total_reviews=total_reviews,
+                    recent_reviews=recent_reviews,
+                    last_viewed_at=updated_at,
+                )
+            )
+
+        size = settings.LEADERBOARD_SIZE
+        since = get_window_start()
+        upserted = 0
+        for category_id, entries in candidates.items():
+            board = LeaderboardModel.objects.filter(category_id=category_id)
+            ranked = board.filter(
+                last_viewed_at__gte=since,
+                location__is_deleted=False,
+            ).order_by("-recent_reviews", "-location_id")
+            ranked_reviews = ranked.values_list("recent_reviews", flat=True)
+            if cutoff := list(ranked_reviews[size - 1 : size]):
+                entries = [
+                    entry for entry in entries if entry.recent_reviews >= cutoff[0]
+                ]
+            if not entries:
+                continue
+
+            with transaction.atomic():
+                board.filter(
+                    Q(last_viewed_at__lt=since) | Q(location__is_deleted=True)
+                ).delete()
+                LeaderboardModel.objects.bulk_create(
+                    entries,
+                    update_conflicts=True,
+                    unique_fields=["category", "location"],
+                    update_fields=["total_reviews", "recent_reviews", "last_viewed_at"],
+                )
+                overflow = list(ranked.values_list("id", flat=True)[size:])
+                LeaderboardModel.objects.filter(id__in=overflow).delete()
+            upserted += len(entries)
+        return upserted
+
+
+class LeaderboardProcess(
+    QueryLeaderboardProcess,
+    EditionLeaderboardProcess,
+):
+    """
+    A combined class inheriting querying and editing operations for
+    LeaderboardModel objects asynchronously.
+    """
+
+    pass
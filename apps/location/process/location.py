@@ -1,19 +1,101 @@
 # Standard Libraries
-from datetime import datetime, timedelta, timezone
+import asyncio
+import logging
+import time
+from decimal import Decimal
+from typing import AsyncIterable
 
 # Third-party Libraries
 from django.db import DatabaseError, IntegrityError, transaction
-from django.db.models import F, QuerySet
-
-from apps.location.process.city import CityProcess
+from django.db.models import Count, F, Max, Q, QuerySet
+from fastapi import status
 
 # Own Libraries
+from apps.location.process.city import CityProcess
+from apps.location.process.cluster import ClusterProcess
+from apps.location.process.dedupe import (
+    GeohashIndex,
+    LocationPoint,
+    find_duplicate,
+    load_candidates,
+)
+from apps.location.process.leaderboard import LeaderboardProcess
 from apps.location.process.location_category import LocationCategoryProcess
+from apps.location.process.search import SearchProcess
+from apps.location.schema.enums.location import (
+    BulkLocationStatusEnum,
+    ViewportModeEnum,
+)
 from apps.location.schema.inputs.location import LocationAddInput
-from apps.location.schema.types.location import LocationType
+from apps.location.schema.response.interface import Response
+from apps.location.schema.response.location import (
+    BatchLocationDetailPayload,
+    BulkCreateLocationPayload,
+    BulkLocationMetadata,
+    BulkLocationResult,
+    LocationListPayload,
+    LocationMetadata,
+    ViewportMetadata,
+    ViewportPayload,
+)
+from apps.location.schema.types.cluster import ClusterType
+from apps.location.schema.types.location import (
+    LocationDetailKeyType,
+    LocationType,
+    NearbyLocationType,
+    SearchLocationType,
+)
 from apps.core.models import Category as CategoryModel
+from apps.core.models import City as CityModel
+from apps.core.models import Country as CountryModel
 from apps.core.models import Location as LocationModel
+from apps.core.models import LocationCategory as LocationCategoryModel
+from apps.utils import geohash
 from apps.utils.decorator import async_database
+from apps.utils.pagination import decode_cursor, encode_cursor
+from apps.utils.single_flight import SingleFlight
+from config.env_vars import settings
+
+logger = logging.getLogger(__name__)
+
+COORDINATE_QUANTUM = Decimal("0.0000001")
+
+# Shared by the concurrent identical recommend-locations requests of the
+# worker, and reused for RECOMMEND_MICRO_CACHE_TTL seconds.
+recommend_locations_flight = SingleFlight(
+    name="recommend_locations",
+    ttl=settings.RECOMMEND_MICRO_CACHE_TTL,
+    stale_ttl=settings.RECOMMEND_STALE_TTL,
+)
+
+
+def backfill_geohash(batch_size: int = 2000, all_rows: bool = False) -> int:
+    """
+    Set the geohash of the locations written without ``save`` (by
+    ``bulk_create`` or ``update``), soft-deleted ones included.
+
+    Args:
+        batch_size (int): Rows read and updated per round trip.
+        all_rows (bool): Recompute every geohash, not only the empty ones,
+            e.g. after coordinates were changed with ``update``.
+
+    Returns:
+        int: The number of locations updated.
+    """
+    queryset = LocationModel.all_objects.only("id", "latitude", "longitude")
+    if not all_rows:
+        queryset = queryset.filter(geohash="")
+
+    updated = 0
+    last_id = 0
+    while batch := list(queryset.filter(id__gt=last_id).order_by("id")[:batch_size]):
+        for location in batch:
+            location.geohash = geohash.encode(location.latitude, location.longitude)
+        LocationModel.all_objects.bulk_update(batch, ["geohash"])
+        updated += len(batch)
+        last_id = batch[-1].id
+    logger.info(f"***Backfill geohash, {updated} locations")
+    return updated
 
 
 class QueryLocationProcess:
@@ -81,6 +163,153 @@ class QueryLocationProcess:
         queryset = self._annotate_total_reviews(queryset=queryset)
         return queryset.first()
 
+    @async_database()
+    def get_detail_version(self, location_id: int, category_id: int) -> tuple | None:
+        """
+        Return values that change whenever the detail of a location in a
+        category changes (the location, its city and country, and its
+        LocationCategory rows), to derive ETags without building it.
+
+        Returns:
+            tuple | None: The version, or None if the location is not
+            found in the category.
+        """
+        version = LocationCategoryModel.objects.filter(
+            location_id=location_id,
+            location__is_deleted=False,
+            is_deleted=False,
+        ).aggregate(
+            categories=Count("id"),
+            in_category=Count("id", filter=Q(category_id=category_id)),
+            updated_at=Max("updated_at"),
+            location_updated_at=Max("location__updated_at"),
+            city_updated_at=Max("location__city__updated_at"),
+            country_updated_at=Max("location__city__country__updated_at"),
+        )
+        if not version["in_category"]:
+            return None
+        return tuple(version.values())
+
+    @async_database()
+    def get_detail_objects(
+        self,
+        keys: list[tuple[int, int]],
+    ) -> dict[tuple[int, int], LocationModel]:
+        """
+        Retrieve the LocationModel objects of many (location_id,
+        category_id) pairs with a single query, each annotated with its
+        ``total_reviews`` in the category.
+
+        Args:
+            keys (list[tuple[int, int]]): The (location_id, category_id)
+                pairs.
+
+        Returns:
+            dict[tuple[int, int], LocationModel]: The objects by pair; the
+            pairs whose location is not found in the category are missing.
+        """
+        keys_set = set(keys)
+        queryset = LocationCategoryModel.objects.select_related("location").filter(
+            location_id__in={location_id for location_id, _ in keys_set},
+            category_id__in={category_id for _, category_id in keys_set},
+            is_deleted=False,
+            location__is_deleted=False,
+        )
+
+        locations = {}
+        for location_category in queryset:
+            key = (location_category.location_id, location_category.category_id)
+            if key in keys_set:
+                location = location_category.location
+                location.total_reviews = location_category.total_reviews
+                locations[key] = location
+        return locations
+
+    @async_database()
+    def get_nearby_objects(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_m: float,
+        limit: int = 20,
+        **kwargs,
+    ) -> list[tuple[LocationModel, float]]:
+        """
+        Retrieve the LocationModel objects within ``radius_m`` metres of a
+        coordinate, closest first.
+
+        The candidates are read with one prefix lookup per geohash cell of
+        the 3x3 block around the coordinate, then re-ranked by their exact
+        haversine distance.
+
+        Args:
+            latitude (float): Latitude of the search center.
+            longitude (float): Longitude of the search center.
+            radius_m (float): The search radius in metres.
+            limit (int): The maximum number of objects to retrieve.
+            **kwargs: Arbitrary keyword arguments to filter the query.
+
+        Returns:
+            list[tuple[LocationModel, float]]: The matching objects with
+            their distance in metres.
+        """
+        cells_filter = Q()
+        for cell in geohash.cells_around(latitude, longitude, radius_m):
+            cells_filter |= Q(geohash__startswith=cell)
+
+        queryset = LocationModel.objects.filter(cells_filter, **kwargs)
+        if "locations_categories_set__category_id" in kwargs:
+            queryset = self._annotate_total_reviews(queryset=queryset)
+
+        nearby = []
+        for location in queryset:
+            distance = geohash.haversine_m(
+                latitude, longitude, location.latitude, location.longitude
+            )
+            if distance <= radius_m:
+                nearby.append((location, distance))
+
+        nearby.sort(key=lambda item: (item[1], item[0].id))
+        return nearby[:limit]
+
+    @async_database()
+    def get_viewport_objects(
+        self,
+        min_latitude: float,
+        min_longitude: float,
+        max_latitude: float,
+        max_longitude: float,
+        limit: int,
+        **kwargs,
+    ) -> tuple[list[LocationModel], int]:
+        """
+        Retrieve up to ``limit`` LocationModel objects inside a bounding
+        box, with the number of objects inside it.
+
+        Args:
+            min_latitude (float): South edge of the bounding box.
+            min_longitude (float): West edge of the bounding box.
+            max_latitude (float): North edge of the bounding box.
+            max_longitude (float): East edge of the bounding box.
+            limit (int): The maximum number of objects to retrieve.
+            **kwargs: Arbitrary keyword arguments to filter the query.
+
+        Returns:
+            tuple[list[LocationModel], int]: The objects, oldest first, and
+            the total count, only queried when it exceeds ``limit``.
+        """
+        queryset = LocationModel.objects.filter(
+            latitude__range=(min_latitude, max_latitude),
+            longitude__range=(min_longitude, max_longitude),
+            **kwargs,
+        )
+        if "locations_categories_set__category_id" in kwargs:
+            queryset = self._annotate_total_reviews(queryset=queryset)
+        locations = list(queryset.order_by("id")[: limit + 1])
+        if len(locations) <= limit:
+            return locations, len(locations)
+        return locations[:limit], queryset.count()
+
 
 class EditionLocationProcess:
     """
@@ -111,6 +340,197 @@ class EditionLocationProcess:
         except (DatabaseError, IntegrityError) as exp:
             raise DatabaseError(repr(exp)) from exp
 
+    @staticmethod
+    def _get_location_key(
+        country_id: int,
+        city_id: int,
+        latitude: float | Decimal,
+        longitude: float | Decimal,
+    ) -> tuple[int, int, Decimal, Decimal]:
+        """
+        Return the values of the unique (country, city, latitude, longitude)
+        constraint, with the coordinates rounded as the database stores them.
+        """
+        latitude_field = LocationModel._meta.get_field("latitude")
+        longitude_field = LocationModel._meta.get_field("longitude")
+        return (
+            country_id,
+            city_id,
+            latitude_field.to_python(latitude).quantize(COORDINATE_QUANTUM),
+            longitude_field.to_python(longitude).quantize(COORDINATE_QUANTUM),
+        )
+
+    @classmethod
+    def _get_location_point(cls, input: LocationAddInput) -> LocationPoint:
+        return LocationPoint(
+            None,
+            *cls._get_location_key(**input.location.model_dump(exclude={"address"})),
+        )
+
+    @staticmethod
+    def _get_duplicate_message(location: LocationPoint | None, distance: float) -> str:
+        if location is None:
+            return "This location is already registered"
+        if location.id is None:
+            return f"This location repeats an earlier row ({distance:.1f} m away)"
+        return (
+            f"This location is already registered as location {location.id} "
+            f"({distance:.1f} m away)"
+        )
+
+    @async_database()
+    def insert_location(
+        self,
+        input: LocationAddInput,
+        categories_list: list[CategoryModel],
+    ) -> LocationModel:
+        """
+        Insert a location with its categories unless it duplicates a
+        registered one (see ``find_duplicate``), with one probe of the
+        geohash index and the inserts in a single transaction.
+
+        Args:
+            input (LocationAddInput): The input data for the new location.
+            categories_list (list[CategoryModel]): The categories to
+                associate with the location.
+
+        Raises:
+            AssertionError: If the location is a duplicate.
+        """
+        radius_m = settings.LOCATION_DUPLICATE_RADIUS_M
+        point = self._get_location_point(input)
+        try:
+            with transaction.atomic():
+                candidates = load_candidates([point], radius_m=radius_m)
+                if duplicate := find_duplicate(point, candidates, radius_m):
+                    raise AssertionError(self._get_duplicate_message(*duplicate))
+
+                location = LocationModel(**input.location.model_dump())
+                location.save()
+                LocationCategoryModel.objects.bulk_create(
+                    [
+                        LocationCategoryModel(location=location, category=category)
+                        for category in categories_list
+                    ]
+                )
+            return location
+        except IntegrityError as exp:
+            # A concurrent request registered the same coordinates.
+            raise AssertionError(self._get_duplicate_message(None, 0)) from exp
+
+    @async_database()
+    def bulk_import(
+        self,
+        rows: list[tuple[int, LocationAddInput]],
+    ) -> list[BulkLocationResult]:
+        """
+        Insert a batch of validated locations with their categories.
+
+        Rows referencing unknown categories, cities or countries are
+        reported as invalid, and
+        rows repeating an existing location (or an earlier row of the
+        batch) as duplicated. The remaining rows are inserted with one
+        ``bulk_create`` for the locations and one for their categories,
+        inside a single transaction.
+
+        Args:
+            rows (list[tuple[int, LocationAddInput]]): The line number and
+                validated input of each row.
+
+        Returns:
+            list[BulkLocationResult]: One result per row.
+        """
+        category_id_set = {
+            category_id for _, input in rows for category_id in input.category_id_list
+        }
+        existing_category_ids = set(
+            CategoryModel.objects.filter(
+                id__in=category_id_set,
+                is_deleted=False,
+            ).values_list("id", flat=True)
+        )
+        existing_city_ids = set(
+            CityModel.objects.filter(
+                id__in={input.location.city_id for _, input in rows},
+            ).values_list("id", flat=True)
+        )
+        existing_country_ids = set(
+            CountryModel.objects.filter(
+                id__in={input.location.country_id for _, input in rows},
+            ).values_list("id", flat=True)
+        )
+
+        radius_m = settings.LOCATION_DUPLICATE_RADIUS_M
+        points = {line: self._get_location_point(input) for line, input in rows}
+        index = GeohashIndex(load_candidates(points.values(), radius_m=radius_m))
+
+        results: dict[int, BulkLocationResult] = {}
+        to_create: list[tuple[int, LocationAddInput, LocationModel]] = []
+        for line, input in rows:
+            if missing := set(input.category_id_list) - existing_category_ids:
+                invalid = f"Categories with ID's {sorted(missing)}, not found."
+            elif (country_id := input.location.country_id) not in existing_country_ids:
+                invalid = f"Country with ID {country_id}, not found."
+            elif (city_id := input.location.city_id) not in existing_city_ids:
+                invalid = f"City with ID {city_id}, not found."
+            else:
+                invalid = None
+            if invalid:
+                results[line] = BulkLocationResult(
+                    line=line,
+                    status=BulkLocationStatusEnum.INVALID,
+                    message=invalid,
+                )
+                continue
+            point = points[line]
+            candidates = index.candidates(point.latitude, point.longitude, radius_m)
+            if duplicate := find_duplicate(point, candidates, radius_m):
+                results[line] = BulkLocationResult(
+                    line=line,
+                    status=BulkLocationStatusEnum.DUPLICATED,
+                    message=self._get_duplicate_message(*duplicate),
+                )
+                continue
+
+            index.add(point)
+            location = LocationModel(**input.location.model_dump())
+            location.geohash = geohash.encode(location.latitude, location.longitude)
+            to_create.append((line, input, location))
+
+        if not to_create:
+            return [results[line] for line, _ in rows]
+
+        try:
+            with transaction.atomic():
+                LocationModel.objects.bulk_create(
+                    [location for _, _, location in to_create]
+                )
+                LocationCategoryModel.objects.bulk_create(
+                    [
+                        LocationCategoryModel(
+                            location=location,
+                            category_id=category_id,
+                        )
+                        for _, input, location in to_create
+                        for category_id in dict.fromkeys(input.category_id_list)
+                    ]
+                )
+            for line, _, location in to_create:
+                results[line] = BulkLocationResult(
+                    line=line,
+                    status=BulkLocationStatusEnum.CREATED,
+                    location_id=location.id,
+                )
+        except (DatabaseError, IntegrityError) as exp:
+            for line, _, _ in to_create:
+                results[line] = BulkLocationResult(
+                    line=line,
+                    status=BulkLocationStatusEnum.FAILED,
+                    message=repr(exp),
+                )
+
+        return [results[line] for line, _ in rows]
+
 
 class LocationProcess(
     QueryLocationProcess,
@@ -125,53 +545,472 @@ class LocationProcess(
         self,
         category_process: LocationCategoryProcess,
         city_process: CityProcess,
+        leaderboard_process: LeaderboardProcess,
         category_id: int,
-    ) -> list[LocationType | None]:
+        limit: int,
+        cursor: str | None = None,
+        estimate_total: bool = False,
+    ) -> LocationListPayload:
         """
         Recommend locations based on category ID and recent total reviews.
 
+        The ranking is read from the precomputed category leaderboard, so
+        the cost does not depend on how many locations the category has.
+
         Args:
             category_process (LocationCategoryProcess): An instance of
                 LocationCategoryProcess.
+            city_process (CityProcess): An instance of CityProcess.
+            leaderboard_process (LeaderboardProcess): An instance of
+                LeaderboardProcess.
             category_id (int): The ID of the category to recommend
                 locations for.
+            limit (int): The page size.
+            cursor (str | None): Optional. The ``next_cursor`` of the
+                previous page.
+            estimate_total (bool): Optional. Whether to include an
+                estimate of the total number of recommended locations.
 
         Returns:
-            list[LocationType | None]: A list of recommended locations.
+            LocationListPayload: A page of recommended locations, most
+            viewed within the trending window first.
+
+        Raises:
+            AssertionError: If the cursor is invalid.
         """
-        utc_now = datetime.now(timezone.utc)
-        month_before = utc_now - timedelta(days=30)
+        after = decode_cursor(cursor, size=2) if cursor else None
+        page_kwargs = {"category_id": category_id, "limit": limit, "after": after}
 
-        kwargs = {
-            "is_deleted": False,
-            "locations_categories_set__category_id": category_id,
-            "locations_categories_set__updated_at__range": [month_before, utc_now],
-        }
+        estimated_total_count = None
+        if estimate_total:
+            locations, estimated_total_count = await asyncio.gather(
+                leaderboard_process.get_page(**page_kwargs),
+                leaderboard_process.count(category_id=category_id),
+            )
+        else:
+            locations = await leaderboard_process.get_page(**page_kwargs)
 
-        if locations := await self.get_objects(
-            order_by=["locations_categories_set__total_reviews"],
-            **kwargs,
-        ):
-            categories_index_dict = await category_process.get_categories_index_dict()
+        if not locations:
+            return LocationListPayload.empty_state(
+                limit=limit,
+                estimated_total_count=estimated_total_count,
+            )
+
+        next_cursor = None
+        if len(locations) > limit:
+            locations = locations[:limit]
+            last = locations[-1]
+            next_cursor = encode_cursor(last.recent_reviews, last.id)
 
-            cities_dict = await city_process.get_city_and_country()
+        categories_index_dict, cities_dict = await asyncio.gather(
+            category_process.get_categories_by_location_ids(
+                location_id_list=[location.id for location in locations],
+            ),
+            city_process.get_city_and_country(),
+        )
 
-            return [
-                LocationType.from_db_model(
+        nested_cache = {}
+        return LocationListPayload.model_construct(
+            metadata=LocationMetadata(
+                total_count=len(locations),
+                limit=limit,
+                next_cursor=next_cursor,
+                estimated_total_count=estimated_total_count,
+            ),
+            items=[
+                LocationType.construct_from_db_model(
                     instance=location,
                     category_id=category_id,
                     city_tuple=cities_dict.get(location.city_id) or (),
                     categories_list=categories_index_dict.get(location.id),
+                    nested_cache=nested_cache,
                 )
                 for location in locations
-            ]
+            ],
+        )
+
+    async def batch_location_detail(
+        self,
+        category_process: LocationCategoryProcess,
+        city_process: CityProcess,
+        keys: list[tuple[int, int]],
+    ) -> BatchLocationDetailPayload:
+        """
+        Return the detail of many locations, each in a category, with a
+        constant number of queries regardless of the number of pairs.
+
+        Args:
+            category_process (LocationCategoryProcess): An instance of
+                LocationCategoryProcess.
+            city_process (CityProcess): An instance of CityProcess.
+            keys (list[tuple[int, int]]): The (location_id, category_id)
+                pairs; repeated pairs are answered once.
+
+        Returns:
+            BatchLocationDetailPayload: The details, in the order of the
+            pairs, and the pairs that were not found.
+        """
+        keys = list(dict.fromkeys(keys))
+        locations, categories_index_dict, cities_dict = await asyncio.gather(
+            self.get_detail_objects(keys=keys),
+            category_process.get_categories_by_location_ids(
+                location_id_list=[location_id for location_id, _ in keys],
+            ),
+            city_process.get_city_and_country(),
+        )
+
+        items = []
+        not_found = []
+        nested_cache = {}
+        for location_id, category_id in keys:
+            if (location := locations.get((location_id, category_id))) is None:
+                not_found.append(
+                    LocationDetailKeyType.model_construct(
+                        location_id=location_id,
+                        category_id=category_id,
+                    )
+                )
+                continue
+            items.append(
+                LocationType.construct_from_db_model(
+                    instance=location,
+                    category_id=category_id,
+                    city_tuple=cities_dict.get(location.city_id) or (),
+                    categories_list=categories_index_dict.get(location_id),
+                    nested_cache=nested_cache,
+                )
+            )
+        return BatchLocationDetailPayload.model_construct(
+            metadata=LocationMetadata(total_count=len(items)),
+            items=items,
+            not_found=not_found,
+        )
+
+    async def nearby_locations(
+        self,
+        category_process: LocationCategoryProcess,
+        city_process: CityProcess,
+        latitude: float,
+        longitude: float,
+        radius_m: float,
+        category_id: int | None = None,
+        limit: int = 20,
+    ) -> list[NearbyLocationType]:
+        """
+        Return the locations closest to a coordinate, ranked by distance.
+
+        Args:
+            category_process (LocationCategoryProcess): An instance of
+                LocationCategoryProcess.
+            city_process (CityProcess): An instance of CityProcess.
+            latitude (float): Latitude of the search center.
+            longitude (float): Longitude of the search center.
+            radius_m (float): The search radius in metres.
+            category_id (int | None): Optional. Restrict the results to
+                locations of this category.
+            limit (int): The maximum number of locations to return.
+
+        Returns:
+            list[NearbyLocationType]: The nearby locations, closest first.
+        """
+        kwargs = {"is_deleted": False}
+        if category_id:
+            kwargs.update(
+                {
+                    "locations_categories_set__category_id": category_id,
+                    "locations_categories_set__is_deleted": False,
+                }
+            )
+
+        if nearby := await self.get_nearby_objects(
+            latitude=latitude,
+            longitude=longitude,
+            radius_m=radius_m,
+            limit=limit,
+            **kwargs,
+        ):
+            categories_index_dict, cities_dict = await asyncio.gather(
+                category_process.get_categories_by_location_ids(
+                    location_id_list=[location.id for location, _ in nearby],
+                ),
+                city_process.get_city_and_country(),
+            )
+
+            locations = []
+            nested_cache = {}
+            for location, distance in nearby:
+                categories = categories_index_dict.get(location.id) or []
+                detail_category_id = category_id or min(
+                    (category.id for category in categories), default=None
+                )
+                locations.append(
+                    NearbyLocationType.construct_from_db_model(
+                        instance=location,
+                        category_id=detail_category_id,
+                        city_tuple=cities_dict.get(location.city_id) or (),
+                        categories_list=categories,
+                        nested_cache=nested_cache,
+                        distance_m=distance,
+                    )
+                )
+            return locations
         return []
 
+    async def search_locations(
+        self,
+        category_process: LocationCategoryProcess,
+        city_process: CityProcess,
+        search_process: SearchProcess,
+        query: str,
+        limit: int = 10,
+    ) -> list[SearchLocationType]:
+        """
+        Return the locations whose address, city or category matches a
+        text, ranked by text score and total reviews.
+
+        Args:
+            category_process (LocationCategoryProcess): An instance of
+                LocationCategoryProcess.
+            city_process (CityProcess): An instance of CityProcess.
+            search_process (SearchProcess): An instance of SearchProcess.
+            query (str): The search text; its last word may be a prefix.
+            limit (int): The maximum number of locations to return.
+
+        Returns:
+            list[SearchLocationType]: The matching locations, best first.
+        """
+        if not (hits := await search_process.get_hits(query=query, limit=limit)):
+            return []
+
+        categories_index_dict, cities_dict = await asyncio.gather(
+            category_process.get_categories_by_location_ids(
+                location_id_list=[location.id for location, _, _ in hits],
+            ),
+            city_process.get_city_and_country(),
+        )
+
+        locations = []
+        nested_cache = {}
+        for location, score, category_id in hits:
+            categories = categories_index_dict.get(location.id) or []
+            detail_category_id = category_id or min(
+                (category.id for category in categories), default=None
+            )
+            locations.append(
+                SearchLocationType.construct_from_db_model(
+                    instance=location,
+                    category_id=detail_category_id,
+                    city_tuple=cities_dict.get(location.city_id) or (),
+                    categories_list=categories,
+                    nested_cache=nested_cache,
+                    score=score,
+                )
+            )
+        return locations
+
+    async def viewport_locations(
+        self,
+        category_process: LocationCategoryProcess,
+        city_process: CityProcess,
+        cluster_process: ClusterProcess,
+        zoom: int,
+        min_latitude: float,
+        min_longitude: float,
+        max_latitude: float,
+        max_longitude: float,
+        category_id: int | None = None,
+    ) -> ViewportPayload:
+        """
+        Return what a map shows inside a bounding box at a zoom level.
+
+        Up to ``CLUSTER_MAX_ZOOM`` the precomputed cluster aggregates of the
+        visible grid cells are read first; when they hold more than
+        ``VIEWPORT_LOCATIONS_LIMIT`` locations the clusters are returned,
+        so the cost follows the number of visible cells. Otherwise, and at
+        closer zooms, the locations themselves are returned; past
+        ``VIEWPORT_LOCATIONS_LIMIT`` of them (at close zooms, or when the
+        clusters are stale) the oldest are returned, flagged as
+        ``truncated`` with the count of the whole viewport.
+
+        Args:
+            category_process (LocationCategoryProcess): An instance of
+                LocationCategoryProcess.
+            city_process (CityProcess): An instance of CityProcess.
+            cluster_process (ClusterProcess): An instance of ClusterProcess.
+            zoom (int): The map zoom level.
+            min_latitude (float): South edge of the bounding box.
+            min_longitude (float): West edge of the bounding box.
+            max_latitude (float): North edge of the bounding box.
+            max_longitude (float): East edge of the bounding box.
+            category_id (int | None): Optional. Restrict the results to
+                locations of this category.
+
+        Returns:
+            ViewportPayload: The clusters or the locations of the viewport.
+
+        Raises:
+            AssertionError: If the bounding box is invalid or spans too
+                many cells at this zoom.
+        """
+        if min_latitude > max_latitude or min_longitude > max_longitude:
+            raise AssertionError(
+                "The bounding box is invalid; the minimums must not exceed "
+                "the maximums."
+            )
+        bbox = {
+            "min_latitude": min_latitude,
+            "min_longitude": min_longitude,
+            "max_latitude": max_latitude,
+            "max_longitude": max_longitude,
+        }
+
+        limit = settings.VIEWPORT_LOCATIONS_LIMIT
+        if zoom <= settings.CLUSTER_MAX_ZOOM:
+            clusters = await cluster_process.get_clusters(
+                zoom=zoom,
+                category_id=category_id,
+                **bbox,
+            )
+            if (total_count := sum(cluster.count for cluster in clusters)) > limit:
+                nested_cache = {}
+                return ViewportPayload.model_construct(
+                    metadata=ViewportMetadata(
+                        mode=ViewportModeEnum.CLUSTERS,
+                        zoom=zoom,
+                        total_count=total_count,
+                    ),
+                    clusters=[
+                        ClusterType.construct_from_db_model(
+                            instance=cluster,
+                            nested_cache=nested_cache,
+                        )
+                        for cluster in clusters
+                    ],
+                    items=[],
+                )
+
+        kwargs = {"is_deleted": False}
+        if category_id:
+            kwargs.update(
+                {
+                    "locations_categories_set__category_id": category_id,
+                    "locations_categories_set__is_deleted": False,
+                }
+            )
+        locations, total_count = await self.get_viewport_objects(
+            limit=limit,
+            **bbox,
+            **kwargs,
+        )
+        if not locations:
+            return ViewportPayload.empty_state(zoom=zoom)
+        if truncated := total_count > len(locations):
+            logger.warning(
+                f"***Viewport Locations, {total_count} locations at zoom {zoom}, "
+                f"{len(locations)} returned; rebuild the clusters if stale"
+            )
+
+        categories_index_dict, cities_dict = await asyncio.gather(
+            category_process.get_categories_by_location_ids(
+                location_id_list=[location.id for location in locations],
+            ),
+            city_process.get_city_and_country(),
+        )
+
+        items = []
+        nested_cache = {}
+        for location in locations:
+            categories = categories_index_dict.get(location.id) or []
+            detail_category_id = category_id or min(
+                (category.id for category in categories), default=None
+            )
+            items.append(
+                LocationType.construct_from_db_model(
+                    instance=location,
+                    category_id=detail_category_id,
+                    city_tuple=cities_dict.get(location.city_id) or (),
+                    categories_list=categories,
+                    nested_cache=nested_cache,
+                )
+            )
+        return ViewportPayload.model_construct(
+            metadata=ViewportMetadata(
+                zoom=zoom,
+                total_count=total_count,
+                truncated=truncated,
+            ),
+            clusters=[],
+            items=items,
+        )
+
+    async def bulk_create_from_lines(
+        self,
+        lines: AsyncIterable[tuple[int, bytes]],
+        batch_size: int,
+    ) -> BulkCreateLocationPayload:
+        """
+        Import locations from NDJSON lines, one ``LocationAddInput`` per
+        line, as they are streamed.
+
+        Lines are validated one by one and the valid rows are inserted in
+        batches of ``batch_size`` with ``bulk_import``.
+
+        Args:
+            lines (AsyncIterable[tuple[int, bytes]]): The line number and
+                raw content of every NDJSON line.
+            batch_size (int): The number of rows inserted per batch.
+
+        Returns:
+            BulkCreateLocationPayload: A payload with one result per line
+            and the totals by status.
+        """
+        started_at = time.perf_counter()
+        results: list[BulkLocationResult] = []
+        batch: list[tuple[int, LocationAddInput]] = []
+
+        async for line, content in lines:
+            try:
+                batch.append((line, LocationAddInput.model_validate_json(content)))
+            except ValueError as exp:
+                results.append(
+                    BulkLocationResult(
+                        line=line,
+                        status=BulkLocationStatusEnum.INVALID,
+                        message=str(exp),
+                    )
+                )
+                continue
+
+            if len(batch) >= batch_size:
+                results.extend(await self.bulk_import(rows=batch))
+                batch = []
+
+        if batch:
+            results.extend(await self.bulk_import(rows=batch))
+
+        results.sort(key=lambda result: result.line)
+        metadata = BulkLocationMetadata(
+            total_rows=len(results),
+            elapsed_seconds=round(time.perf_counter() - started_at, 3),
+        )
+        for result in results:
+            field = result.status.value
+            setattr(metadata, field, getattr(metadata, field) + 1)
+
+        return BulkCreateLocationPayload(
+            metadata=metadata,
+            results=results,
+            response=Response(
+                status_code=status.HTTP_201_CREATED,
+                type="Success",
+                message="",
+            ),
+        )
+
     async def create_instance(
         self,
         input: LocationAddInput,
         categories_list: list[CategoryModel],
-        location_category_process: LocationCategoryProcess,
     ) -> LocationModel:
         """
         Create a new LocationModel instance.
@@ -180,28 +1019,15 @@ class LocationProcess(
             input (LocationAddInput): The input data for the new location.
             categories_list (list[CategoryModel]): The list of categories
                 to associate with the location.
-            location_category_process (LocationCategoryProcess): An instance
-                of LocationCategoryProcess.
+
+        Raises:
+            AssertionError: If a location of the same country and city is
+                registered within ``LOCATION_DUPLICATE_RADIUS_M`` metres.
         """
         try:
-            location_kwargs = input.location.model_dump()
-            filter_kwargs = location_kwargs.copy()
-            filter_kwargs.pop("address")
-
-            if previous_register := await self.get_object(**filter_kwargs):
-                raise AssertionError(
-                    f"This location {previous_register} alredy registered"
-                )
-
-            pre_saved_location = LocationModel(**location_kwargs)
-            location = await self.save_instance(instance_to_save=pre_saved_location)
-
-            await location_category_process.create_instances(
-                location=location,
+            return await self.insert_location(
+                input=input,
                 categories_list=categories_list,
             )
-            return location
-        except AssertionError as exp:
-            raise AssertionError(str(exp)) from exp
         except DatabaseError as exp:
             raise DatabaseError(str(exp)) from exp
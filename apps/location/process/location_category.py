@@ -1,13 +1,42 @@
 # Standard Libraries
+from datetime import datetime, timezone
 from typing import Iterable
 
+# Third-party Libraries
+from django.db import transaction
+from django.db.models import Case, F, Q, Value, When
+
 # Own Libraries
 from apps.core.models import Category as CategoryModel
 from apps.core.models import Location as LocationModel
 from apps.core.models import LocationCategory as LocationCategoryModel
+from apps.core.models import LocationCategoryViews as LocationCategoryViewsModel
 from apps.utils.decorator import async_database
 
 
+def build_increment_case(increments: dict[tuple[int, int], int]) -> tuple[Q, Case]:
+    """
+    Build the filter and the per-row value of a bulk increment keyed by
+    (location_id, category_id).
+
+    Returns:
+        tuple[Q, Case]: A filter matching the keyed rows and an expression
+        evaluating to the increment of each of them.
+    """
+    rows_filter = Q()
+    whens = []
+    for (location_id, category_id), value in increments.items():
+        rows_filter |= Q(location_id=location_id, category_id=category_id)
+        whens.append(
+            When(
+                location_id=location_id,
+                category_id=category_id,
+                then=Value(value),
+            )
+        )
+    return rows_filter, Case(*whens, default=Value(0))
+
+
 class QueryLocationCategoryProcess:
     """
     A class to handle querying operations for LocationCategoryModel
@@ -59,15 +88,54 @@ class QueryLocationCategoryProcess:
         if location_categories := await self.get_objects(
             is_deleted=False,
         ):
-            location_id_list = {loc_cat.location_id for loc_cat in location_categories}
-            return {
-                location_id: {
+            categories_index_dict = {}
+            for location_cat in location_categories:
+                categories_index_dict.setdefault(location_cat.location_id, set()).add(
                     location_cat.category
-                    for location_cat in location_categories
-                    if location_cat.location_id == location_id
-                }
-                for location_id in location_id_list
-            }
+                )
+            return categories_index_dict
+
+    @async_database()
+    def get_categories_by_location_ids(
+        self,
+        location_id_list: Iterable[int],
+    ) -> dict[int, list[CategoryModel]]:
+        """
+        Retrieve the categories of the given locations only, grouped by
+        location ID.
+
+        Unlike ``get_categories_index_dict``, only the rows of the locations
+        being rendered are read, with a single query over the
+        (location, category) unique index.
+
+        Args:
+            location_id_list (Iterable[int]): The IDs of the locations.
+
+        Returns:
+            dict[int, list[CategoryModel]]: A dictionary mapping location
+            IDs to their categories, ordered by category ID.
+        """
+        if not (location_id_list := set(location_id_list)):
+            return {}
+
+        queryset = (
+            LocationCategoryModel.objects.select_related("category")
+            .filter(location_id__in=location_id_list, is_deleted=False)
+            .only(
+                "location_id",
+                "category__id",
+                "category__name",
+                "category__description",
+            )
+            .order_by("location_id", "category_id")
+        )
+
+        categories_index_dict = {}
+        for location_cat in queryset:
+            categories_index_dict.setdefault(location_cat.location_id, []).append(
+                location_cat.category
+            )
+        return categories_index_dict
 
 
 class EditionLocationCategoryProcess:
@@ -99,6 +167,71 @@ class EditionLocationCategoryProcess:
         """
         return LocationCategoryModel.objects.bulk_create(objs=objs)
 
+    @async_database()
+    def bulk_increment_reviews(self, increments: dict[tuple[int, int], int]) -> int:
+        """
+        Add views to many LocationCategoryModel rows with a single
+        ``total_reviews = total_reviews + n`` UPDATE, which also grows the
+        rolling ``recent_reviews``, and add them to today's
+        LocationCategoryViewsModel buckets.
+
+        The keys without a live row, e.g. of a location archived since it
+        was viewed, are skipped, so they cannot fail the whole batch on the
+        foreign keys of the buckets.
+
+        Args:
+            increments (dict[tuple[int, int], int]): Number of views to add
+                keyed by (location_id, category_id).
+
+        Returns:
+            int: The number of rows updated.
+        """
+        if not increments:
+            return 0
+
+        now = datetime.now(timezone.utc)
+        rows_filter, _ = build_increment_case(increments)
+        with transaction.atomic():
+            live_keys = set(
+                LocationCategoryModel.objects.filter(
+                    rows_filter,
+                    is_deleted=False,
+                ).values_list("location_id", "category_id")
+            )
+            increments = {
+                key: value for key, value in increments.items() if key in live_keys
+            }
+            if not increments:
+                return 0
+
+            rows_filter, views = build_increment_case(increments)
+            updated = LocationCategoryModel.objects.filter(
+                rows_filter,
+                is_deleted=False,
+            ).update(
+                total_reviews=F("total_reviews") + views,
+                recent_reviews=F("recent_reviews") + views,
+                updated_at=now,
+            )
+            # Create the missing buckets empty and increment them all, so
+            # concurrent flushes of several workers add up.
+            LocationCategoryViewsModel.objects.bulk_create(
+                [
+                    LocationCategoryViewsModel(
+                        location_id=location_id,
+                        category_id=category_id,
+                        day=now.date(),
+                    )
+                    for location_id, category_id in increments
+                ],
+                ignore_conflicts=True,
+            )
+            LocationCategoryViewsModel.objects.filter(
+                rows_filter,
+                day=now.date(),
+            ).update(views=F("views") + views)
+        return updated
+
 
 class LocationCategoryProcess(
     QueryLocationCategoryProcess,
@@ -0,0 +1,91 @@
+# Standard Libraries
+import logging
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
+
+# Third-party Libraries
+from django.db import transaction
+from django.db.models import F, Value
+from django.db.models.functions import Greatest
+
+# Own Libraries
+from apps.core.models import LocationCategory as LocationCategoryModel
+from apps.core.models import LocationCategoryViews as LocationCategoryViewsModel
+from apps.location.process.location_category import build_increment_case
+from config.env_vars import settings
+
+logger = logging.getLogger(__name__)
+
+
+def get_window_start_day() -> date:
+    """Return the first day whose view buckets are inside the trending window."""
+    return datetime.now(timezone.utc).date() - timedelta(
+        days=settings.LEADERBOARD_WINDOW_DAYS - 1
+    )
+
+
+def expire_view_buckets(batch_size: int = 1000) -> int:
+    """
+    Subtract the view buckets that left the trending window from
+    ``LocationCategory.recent_reviews`` and mark them as expired, in
+    batches of ``batch_size`` buckets.
+
+    Returns:
+        int: The number of buckets expired.
+    """
+    window_start_day = get_window_start_day()
+    expired = 0
+    while True:
+        with transaction.atomic():
+            buckets = list(
+                LocationCategoryViewsModel.objects.select_for_update(skip_locked=True)
+                .filter(expired=False, day__lt=window_start_day)
+                .values_list("id", "location_id", "category_id", "views")[:batch_size]
+            )
+            if not buckets:
+                return expired
+
+            decrements = Counter()
+            for _, location_id, category_id, views in buckets:
+                decrements[(location_id, category_id)] += views
+            rows_filter, views = build_increment_case(decrements)
+            LocationCategoryModel.objects.filter(rows_filter).update(
+                recent_reviews=Greatest(F("recent_reviews") - views, Value(0))
+            )
+            LocationCategoryViewsModel.objects.filter(
+                id__in=[bucket_id for bucket_id, *_ in buckets]
+            ).update(expired=True)
+        expired += len(buckets)
+
+
+def prune_view_buckets() -> int:
+    """
+    Delete the expired view buckets older than
+    ``VIEW_BUCKET_RETENTION_DAYS``.
+
+    Returns:
+        int: The number of buckets deleted.
+    """
+    retention_days = max(
+        settings.VIEW_BUCKET_RETENTION_DAYS,
+        settings.LEADERBOARD_WINDOW_DAYS,
+    )
+    deleted, _ = LocationCategoryViewsModel.objects.filter(
+        expired=True,
+        day__lt=datetime.now(timezone.utc).date() - timedelta(days=retention_days),
+    ).delete()
+    return deleted
+
+
+def roll_view_buckets() -> tuple[int, int]:
+    """
+    Move the trending window to today: expire the buckets that left it
+    and prune the ones past the retention.
+
+    Returns:
+        tuple[int, int]: The number of buckets expired and deleted.
+    """
+    expired = expire_view_buckets()
+    deleted = prune_view_buckets()
+    logger.info(f"***Roll view buckets, {expired} expired, {deleted} deleted")
+    return expired, deleted
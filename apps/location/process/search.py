@@ -0,0 +1,267 @@
+# Standard Libraries
+import logging
+import math
+
+# Third-party Libraries
+from django.db import connections
+from django.db.models import Max, QuerySet
+from django.db.models.signals import post_delete, post_save
+
+# Own Libraries
+from apps.core.models import Category as CategoryModel
+from apps.core.models import City as CityModel
+from apps.core.models import Location as LocationModel
+from apps.core.models import LocationCategory as LocationCategoryModel
+from apps.utils.cache import VersionedCache
+from apps.utils.decorator import async_database
+from apps.utils.ngram import NgramIndex, normalize, text_score
+from config.env_vars import settings
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 5000
+
+# Weight of a text match by the field it matched: a matching address names
+# the location itself, a matching city or category only narrows it down.
+ADDRESS_WEIGHT = 1.0
+CITY_WEIGHT = 0.8
+CATEGORY_WEIGHT = 0.6
+
+SearchHit = tuple[LocationModel, float, int | None]
+
+
+def load_index(queryset: QuerySet, field: str) -> NgramIndex:
+    """Build the in-memory n-gram index of ``field`` over ``queryset``."""
+    index = NgramIndex()
+    for object_id, text in queryset.values_list("id", field).iterator(
+        chunk_size=BATCH_SIZE
+    ):
+        index.add(object_id, text)
+    return index
+
+
+address_index_cache: VersionedCache[NgramIndex] = VersionedCache(
+    name="address_search_index",
+    loader=lambda: load_index(
+        LocationModel.objects.filter(is_deleted=False), field="address"
+    ),
+    ttl=settings.SEARCH_INDEX_TTL,
+)
+city_index_cache: VersionedCache[NgramIndex] = VersionedCache(
+    name="city_search_index",
+    loader=lambda: load_index(CityModel.objects.filter(is_deleted=False), "name"),
+    ttl=settings.SEARCH_INDEX_TTL,
+)
+category_index_cache: VersionedCache[NgramIndex] = VersionedCache(
+    name="category_search_index",
+    loader=lambda: load_index(CategoryModel.objects.filter(is_deleted=False), "name"),
+    ttl=settings.SEARCH_INDEX_TTL,
+)
+
+
+def update_address_index(sender, instance: LocationModel, **kwargs) -> None:
+    """
+    Keep a loaded address index in sync with a saved or deleted location
+    instead of rebuilding it; bulk writes are picked up on the next load.
+    """
+    if (index := address_index_cache.peek()) is None:
+        return
+    if instance.is_deleted or kwargs.get("signal") is post_delete:
+        index.discard(instance.id)
+    else:
+        index.add(instance.id, instance.address)
+
+
+post_save.connect(update_address_index, sender=LocationModel, weak=False)
+post_delete.connect(update_address_index, sender=LocationModel, weak=False)
+
+for sender, cache in (
+    (CityModel, city_index_cache),
+    (CategoryModel, category_index_cache),
+):
+    post_save.connect(cache.invalidate, sender=sender, weak=False)
+    post_delete.connect(cache.invalidate, sender=sender, weak=False)
+
+
+def trigram_matches(
+    queryset: QuerySet,
+    field: str,
+    query: str,
+    limit: int,
+) -> list[tuple[int, float]]:
+    """
+    Return the rows of ``queryset`` whose ``field`` matches ``query`` with
+    pg_trgm, best first, with their ``text_score``.
+
+    The word similarity operator and the ordering by word distance are
+    both served by the trigram GiST index, so only ``limit`` rows are read.
+    """
+    # Third-party Libraries
+    from django.contrib.postgres.search import TrigramWordDistance
+
+    rows = (
+        queryset.filter(**{f"{field}__trigram_word_similar": query})
+        .annotate(distance=TrigramWordDistance(query, field))
+        .order_by("distance")
+        .values_list("id", field, "distance")[:limit]
+    )
+    return [
+        (object_id, text_score(query, normalize(text), 1 - distance))
+        for object_id, text, distance in rows
+    ]
+
+
+class QuerySearchProcess:
+    """
+    A class to handle the text search of LocationModel objects
+    asynchronously.
+
+    """
+
+    @staticmethod
+    def match(query: str, limit: int) -> tuple[list, list, list]:
+        """
+        Return the addresses, cities and categories matching ``query``,
+        as (id, text score) pairs, with pg_trgm on PostgreSQL and the
+        in-memory n-gram indexes elsewhere.
+        """
+        if connections[LocationModel.objects.db].vendor == "postgresql":
+            return (
+                trigram_matches(
+                    LocationModel.objects.filter(is_deleted=False),
+                    field="address",
+                    query=query,
+                    limit=limit,
+                ),
+                trigram_matches(
+                    CityModel.objects.filter(is_deleted=False),
+                    field="name",
+                    query=query,
+                    limit=limit,
+                ),
+                trigram_matches(
+                    CategoryModel.objects.filter(is_deleted=False),
+                    field="name",
+                    query=query,
+                    limit=limit,
+                ),
+            )
+
+        return tuple(
+            cache.get().search(
+                query=query,
+                limit=limit,
+                min_similarity=settings.SEARCH_MIN_SIMILARITY,
+            )
+            for cache in (address_index_cache, city_index_cache, category_index_cache)
+        )
+
+    @async_database()
+    def preload_indexes(self) -> None:
+        """Load the in-memory n-gram indexes used when not on PostgreSQL."""
+        if connections[LocationModel.objects.db].vendor == "postgresql":
+            return
+        for cache in (address_index_cache, city_index_cache, category_index_cache):
+            cache.get()
+
+    @async_database()
+    def get_hits(self, query: str, limit: int) -> list[SearchHit]:
+        """
+        Search locations by address, city name and category name.
+
+        Up to ``SEARCH_CANDIDATES`` matches are read per field; a matching
+        city or category contributes its most reviewed locations. Each
+        candidate keeps its best weighted text score, which is blended with
+        its total reviews, on a log scale relative to the most reviewed
+        candidate, using ``SEARCH_TEXT_WEIGHT``.
+
+        Args:
+            query (str): The search text; its last word may be a prefix.
+            limit (int): The maximum number of locations to return.
+
+        Returns:
+            list[SearchHit]: The locations, annotated with their
+            ``total_reviews``, with their score and the matched category
+            ID, if any, best first.
+        """
+        if not (query := normalize(query)):
+            return []
+        candidates_limit = settings.SEARCH_CANDIDATES
+        addresses, cities, categories = self.match(query, limit=candidates_limit)
+
+        # location_id: (weighted text score, matched category_id)
+        candidates: dict[int, tuple[float, int | None]] = {}
+
+        def add_candidate(location_id, score, category_id=None) -> None:
+            if score > candidates.get(location_id, (0, None))[0]:
+                candidates[location_id] = (score, category_id)
+
+        for location_id, score in addresses:
+            add_candidate(location_id, ADDRESS_WEIGHT * score)
+
+        related = LocationCategoryModel.objects.filter(
+            is_deleted=False,
+            location__is_deleted=False,
+        ).order_by("-total_reviews")
+        if city_scores := dict(cities):
+            for location_id, city_id in related.filter(
+                location__city_id__in=city_scores
+            ).values_list("location_id", "location__city_id")[:candidates_limit]:
+                add_candidate(location_id, CITY_WEIGHT * city_scores[city_id])
+        if category_scores := dict(categories):
+            for location_id, category_id in related.filter(
+                category_id__in=category_scores
+            ).values_list("location_id", "category_id")[:candidates_limit]:
+                add_candidate(
+                    location_id,
+                    CATEGORY_WEIGHT * category_scores[category_id],
+                    category_id,
+                )
+
+        if not candidates:
+            return []
+
+        reviews = dict(
+            LocationCategoryModel.objects.filter(
+                location_id__in=candidates,
+                is_deleted=False,
+            )
+            .values("location_id")
+            .annotate(total_reviews=Max("total_reviews"))
+            .values_list("location_id", "total_reviews")
+        )
+        max_reviews = max(reviews.values(), default=0)
+        text_weight = settings.SEARCH_TEXT_WEIGHT
+
+        ranking = []
+        for location_id, (text, category_id) in candidates.items():
+            popularity = (
+                math.log1p(reviews.get(location_id, 0)) / math.log1p(max_reviews)
+                if max_reviews
+                else 0
+            )
+            score = text_weight * text + (1 - text_weight) * popularity
+            ranking.append((score, location_id, category_id))
+        ranking.sort(key=lambda item: (-item[0], item[1]))
+        ranking = ranking[:limit]
+
+        # Only the returned page is loaded as model instances.
+        locations = LocationModel.objects.in_bulk(
+            [location_id for _, location_id, _ in ranking]
+        )
+        hits = []
+        for score, location_id, category_id in ranking:
+            if (location := locations.get(location_id)) is None:
+                continue
+            location.total_reviews = reviews.get(location_id, 0)
+            hits.append((location, score, category_id))
+        return hits
+
+
+class SearchProcess(QuerySearchProcess):
+    """
+    A combined class inheriting the text search operations of
+    LocationModel objects asynchronously.
+    """
+
+    pass
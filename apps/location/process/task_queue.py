@@ -0,0 +1,130 @@
+# Standard Libraries
+import logging
+from datetime import datetime, timedelta, timezone
+
+# Third-party Libraries
+from django.db import transaction
+from django.db.models import BooleanField, Count, ExpressionWrapper, F, Q
+
+# Own Libraries
+from apps.core.models import QueuedTask as QueuedTaskModel
+from apps.utils.decorator import async_database
+from config.env_vars import settings
+
+logger = logging.getLogger(__name__)
+
+# Longest wait before retrying a failed task.
+MAX_RETRY_DELAY = timedelta(minutes=5)
+
+
+class TaskQueueProcess:
+    """
+    A class to enqueue, claim and complete the tasks of the durable task
+    queue (QueuedTaskModel objects) asynchronously.
+
+    Claims lock the ready rows with ``SELECT ... FOR UPDATE SKIP LOCKED``,
+    so several workers share the queue without waiting on each other. On
+    SQLite, which has no row locks, a single worker must run.
+    """
+
+    @async_database()
+    def enqueue(self, kind: str, payload: dict) -> QueuedTaskModel:
+        now = datetime.now(timezone.utc)
+        return QueuedTaskModel.objects.create(
+            kind=kind,
+            payload=payload,
+            available_at=now,
+            created_at=now,
+        )
+
+    @async_database()
+    def claim(self, batch_size: int, lease: float) -> list[QueuedTaskModel]:
+        """
+        Claim up to ``batch_size`` ready tasks, oldest first, hiding them
+        from the other workers for ``lease`` seconds.
+
+        Args:
+            batch_size (int): Maximum number of tasks claimed.
+            lease (float): Seconds until the tasks can be claimed again if
+                they are neither completed nor retried.
+        """
+        now = datetime.now(timezone.utc)
+        with transaction.atomic():
+            tasks = list(
+                QueuedTaskModel.objects.select_for_update(skip_locked=True)
+                .filter(failed_at__isnull=True, available_at__lte=now)
+                .order_by("available_at", "id")[:batch_size]
+            )
+            if tasks:
+                QueuedTaskModel.objects.filter(
+                    id__in=[task.id for task in tasks]
+                ).update(
+                    attempts=F("attempts") + 1,
+                    available_at=now + timedelta(seconds=lease),
+                )
+        for task in tasks:
+            task.attempts += 1
+        return tasks
+
+    @async_database()
+    def complete(self, tasks: list[QueuedTaskModel]) -> int:
+        """Delete the completed tasks. Returns the number deleted."""
+        deleted, _ = QueuedTaskModel.objects.filter(
+            id__in=[task.id for task in tasks]
+        ).delete()
+        return deleted
+
+    @async_database()
+    def retry(self, tasks: list[QueuedTaskModel], error: str) -> int:
+        """
+        Schedule the next attempt of failed tasks, after a delay doubling
+        on each attempt from ``TASK_QUEUE_RETRY_BACKOFF`` seconds, or mark
+        them as failed after ``TASK_QUEUE_MAX_ATTEMPTS`` attempts.
+
+        Returns:
+            int: The number of tasks marked as failed.
+        """
+        now = datetime.now(timezone.utc)
+        given_up = 0
+        with transaction.atomic():
+            for task in tasks:
+                if task.attempts >= settings.TASK_QUEUE_MAX_ATTEMPTS:
+                    task.failed_at = now
+                    given_up += 1
+                else:
+                    delay = timedelta(
+                        seconds=settings.TASK_QUEUE_RETRY_BACKOFF
+                        * 2 ** (task.attempts - 1)
+                    )
+                    task.available_at = now + min(delay, MAX_RETRY_DELAY)
+                task.last_error = error
+            QueuedTaskModel.objects.bulk_update(
+                tasks,
+                fields=["available_at", "failed_at", "last_error"],
+            )
+        return given_up
+
+    @async_database()
+    def get_depth(self) -> dict[tuple[str, str], int]:
+        """
+        Return the number of ready and failed tasks keyed by (kind, state).
+        Tasks claimed or waiting for a retry are not counted.
+        """
+        now = datetime.now(timezone.utc)
+        rows = (
+            QueuedTaskModel.objects.filter(
+                Q(failed_at__isnull=False) | Q(available_at__lte=now)
+            )
+            .values(
+                "kind",
+                failed=ExpressionWrapper(
+                    Q(failed_at__isnull=False), output_field=BooleanField()
+                ),
+            )
+            .annotate(tasks=Count("id"))
+            .order_by()
+        )
+        return {
+            (row["kind"], "failed" if row["failed"] else "ready"): row["tasks"]
+            for row in rows
+        }
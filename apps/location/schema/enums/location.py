@@ -5,3 +5,15 @@ import enum
 class LocationFieldEnum(enum.Enum):
     ID = "id"
     CREATED_AT = "created_at"
+
+
+class BulkLocationStatusEnum(enum.Enum):
+    CREATED = "created"
+    DUPLICATED = "duplicated"
+    INVALID = "invalid"
+    FAILED = "failed"
+
+
+class ViewportModeEnum(enum.Enum):
+    LOCATIONS = "locations"
+    CLUSTERS = "clusters"
@@ -4,6 +4,7 @@ from pydantic import BaseModel, PositiveInt, field_validator
 # Own Libraries
 from apps.location.schema.enums.location import LocationFieldEnum
 from apps.utils.enums import SortedOrderByFieldEnum
+from config.env_vars import settings
 
 
 class CreateLocationInput(BaseModel):
@@ -28,3 +29,26 @@ class CreateLocationInput(BaseModel):
 class LocationAddInput(BaseModel):
     category_id_list: list[PositiveInt]
     location: CreateLocationInput
+
+
+class LocationDetailKeyInput(BaseModel):
+    location_id: PositiveInt
+    category_id: PositiveInt
+
+
+class BatchLocationDetailInput(BaseModel):
+    items: list[LocationDetailKeyInput]
+
+    @field_validator("items")
+    @classmethod
+    def _check_items(cls, items: list[LocationDetailKeyInput]):
+        if not items:
+            raise AssertionError(
+                "The input for 'items' is invalid; at least one item is required"
+            )
+        if len(items) > settings.BATCH_DETAIL_MAX_ITEMS:
+            raise AssertionError(
+                "The input for 'items' is invalid; maximum items allowed is "
+                f"{settings.BATCH_DETAIL_MAX_ITEMS}"
+            )
+        return items
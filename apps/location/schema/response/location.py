@@ -2,23 +2,92 @@
 from pydantic import BaseModel, Field
 
 # Own Libraries
+from apps.location.schema.enums.location import (
+    BulkLocationStatusEnum,
+    ViewportModeEnum,
+)
 from apps.location.schema.response.interface import Response
-from apps.location.schema.types.location import LocationType
+from apps.location.schema.types.cluster import ClusterType
+from apps.location.schema.types.location import (
+    LocationDetailKeyType,
+    LocationType,
+    NearbyLocationType,
+    SearchLocationType,
+)
 
 
 class LocationMetadata(BaseModel):
     total_count: int = 0
+    limit: int | None = None
+    next_cursor: str | None = None
+    estimated_total_count: int | None = None
 
 
 class LocationListPayload(BaseModel):
     metadata: LocationMetadata
     items: list[LocationType] = Field(default_factory=list)
+    response: Response | None = None
+
+    @classmethod
+    def empty_state(cls, response: Response | None = None, **metadata):
+        return cls(metadata=LocationMetadata(**metadata), items=[], response=response)
+
+
+class NearbyLocationListPayload(BaseModel):
+    metadata: LocationMetadata
+    items: list[NearbyLocationType] = Field(default_factory=list)
+
+    @classmethod
+    def empty_state(cls):
+        return cls(metadata=LocationMetadata(), items=[])
+
+
+class BatchLocationDetailPayload(BaseModel):
+    metadata: LocationMetadata
+    items: list[LocationType] = Field(default_factory=list)
+    not_found: list[LocationDetailKeyType] = Field(default_factory=list)
+    response: Response | None = None
+
+    @classmethod
+    def empty_state(cls, response: Response | None = None):
+        return cls(
+            metadata=LocationMetadata(),
+            items=[],
+            not_found=[],
+            response=response,
+        )
+
+
+class SearchLocationListPayload(BaseModel):
+    metadata: LocationMetadata
+    items: list[SearchLocationType] = Field(default_factory=list)
 
     @classmethod
     def empty_state(cls):
         return cls(metadata=LocationMetadata(), items=[])
 
 
+class ViewportMetadata(BaseModel):
+    mode: ViewportModeEnum = ViewportModeEnum.LOCATIONS
+    zoom: int | None = None
+    total_count: int = 0
+    truncated: bool = False
+
+
+class ViewportPayload(BaseModel):
+    metadata: ViewportMetadata
+    clusters: list[ClusterType] = Field(default_factory=list)
+    items: list[LocationType] = Field(default_factory=list)
+    response: Response | None = None
+
+    @classmethod
+    def empty_state(cls, response: Response | None = None, **metadata):
+        return cls(
+            metadata=ViewportMetadata(**metadata),
+            response=response,
+        )
+
+
 class CreateLocationPayload(BaseModel):
     location: LocationType | None = None
     response: Response
@@ -26,3 +95,29 @@ class CreateLocationPayload(BaseModel):
     @classmethod
     def empty_state(cls, response: Response):
         return cls(location=None, response=response)
+
+
+class BulkLocationResult(BaseModel):
+    line: int
+    status: BulkLocationStatusEnum
+    location_id: int | None = None
+    message: str | None = None
+
+
+class BulkLocationMetadata(BaseModel):
+    total_rows: int = 0
+    created: int = 0
+    duplicated: int = 0
+    invalid: int = 0
+    failed: int = 0
+    elapsed_seconds: float = 0
+
+
+class BulkCreateLocationPayload(BaseModel):
+    metadata: BulkLocationMetadata = Field(default_factory=BulkLocationMetadata)
+    results: list[BulkLocationResult] = Field(default_factory=list)
+    response: Response
+
+    @classmethod
+    def empty_state(cls, response: Response):
+        return cls(response=response)
@@ -17,3 +17,12 @@ class CategoryType(BaseModel):
             name=instance.name,
             description=instance.description,
         )
+
+    @classmethod
+    def construct_from_db_model(cls, instance: Category) -> "CategoryType":
+        """Same as ``from_db_model`` but skipping validation."""
+        return cls.model_construct(
+            id=instance.id,
+            name=instance.name,
+            description=instance.description,
+        )
@@ -1,22 +1,57 @@
+# Standard Libraries
+from typing import NamedTuple
+
+# Third-party Libraries
 from pydantic import BaseModel
 
+# Own Libraries
 from apps.core.models import City as CityModel
 from apps.core.models import Country as CountryModel
 
 
+class CountryRecord(NamedTuple):
+    """Compact, immutable country data kept in the reference cache."""
+
+    id: int
+    name: str
+    code: str
+
+
+class CityRecord(NamedTuple):
+    """Compact, immutable city data kept in the reference cache."""
+
+    id: int
+    name: str
+    country_id: int
+
+
+CityTuple = tuple[CityModel, CountryModel] | tuple[CityRecord, CountryRecord]
+
+
 class CountryType(BaseModel):
     id: int
     name: str
     code: str
 
     @classmethod
-    def from_db_model(cls, instance: CountryModel) -> "CountryType":
+    def from_db_model(cls, instance: CountryModel | CountryRecord) -> "CountryType":
         return cls(
             id=instance.id,
             name=instance.name,
             code=instance.code,
         )
 
+    @classmethod
+    def construct_from_db_model(
+        cls, instance: CountryModel | CountryRecord
+    ) -> "CountryType":
+        """Same as ``from_db_model`` but skipping validation."""
+        return cls.model_construct(
+            id=instance.id,
+            name=instance.name,
+            code=instance.code,
+        )
+
 
 class CityType(BaseModel):
     id: int
@@ -24,7 +59,11 @@ class CityType(BaseModel):
     country: CountryType
 
     @classmethod
-    def from_db_model(cls, instance: CityModel, country: CountryModel) -> "CityType":
+    def from_db_model(
+        cls,
+        instance: CityModel | CityRecord,
+        country: CountryModel | CountryRecord,
+    ) -> "CityType":
         return cls(
             id=instance.id,
             name=instance.name,
@@ -32,5 +71,18 @@ class CityType(BaseModel):
         )
 
     @staticmethod
-    def get_country(instance: CountryModel):
+    def get_country(instance: CountryModel | CountryRecord):
         return CountryType.from_db_model(instance=instance)
+
+    @classmethod
+    def construct_from_db_model(
+        cls,
+        instance: CityModel | CityRecord,
+        country: CountryModel | CountryRecord,
+    ) -> "CityType":
+        """Same as ``from_db_model`` but skipping validation."""
+        return cls.model_construct(
+            id=instance.id,
+            name=instance.name,
+            country=CountryType.construct_from_db_model(instance=country),
+        )
@@ -0,0 +1,47 @@
+# Third-party Libraries
+from pydantic import BaseModel
+
+# Own Libraries
+from apps.core.models import LocationCluster as ClusterModel
+from apps.location.schema.types.category import CategoryType
+
+
+class ClusterType(BaseModel):
+    count: int
+    latitude: float
+    longitude: float
+    top_category: CategoryType | None = None
+
+    @classmethod
+    def construct_from_db_model(
+        cls,
+        instance: ClusterModel,
+        nested_cache: dict | None = None,
+    ) -> "ClusterType":
+        """
+        Build the type of a cluster, centred on the centroid of its
+        locations, with ``model_construct``, skipping validation.
+
+        Args:
+            instance (ClusterModel): The cluster, with its top category
+                selected.
+            nested_cache (dict | None): Optional. A dict shared by the
+                clusters of a list so that the category types are built
+                once per ID.
+        """
+        nested_cache = {} if nested_cache is None else nested_cache
+
+        top_category = None
+        if category := instance.top_category:
+            if (key := (CategoryType, category.id)) not in nested_cache:
+                nested_cache[key] = CategoryType.construct_from_db_model(
+                    instance=category
+                )
+            top_category = nested_cache[key]
+
+        return cls.model_construct(
+            count=instance.count,
+            latitude=instance.latitude,
+            longitude=instance.longitude,
+            top_category=top_category,
+        )
@@ -6,10 +6,8 @@ from pydantic import BaseModel, Field
 
 # Own Libraries
 from apps.location.schema.types.category import CategoryType
-from apps.location.schema.types.city import CityType
+from apps.location.schema.types.city import CityTuple, CityType
 from apps.core.models import Category as CategoryModel
-from apps.core.models import City as CityModel
-from apps.core.models import Country as CountryModel
 from apps.core.models import Location as LocationModel
 from config.env_vars import settings
 
@@ -29,7 +27,7 @@ class LocationType(BaseModel):
         cls,
         instance: LocationModel,
         category_id: int,
-        city_tuple: tuple[CityModel, CountryModel],
+        city_tuple: CityTuple,
         categories_list: Iterable[CategoryModel] | None = None,
     ) -> "LocationType":
 
@@ -49,8 +47,62 @@ class LocationType(BaseModel):
             total_reviews=getattr(instance, "total_reviews", 0),
         )
 
+    @classmethod
+    def construct_from_db_model(
+        cls,
+        instance: LocationModel,
+        category_id: int,
+        city_tuple: CityTuple,
+        categories_list: Iterable[CategoryModel] | None = None,
+        nested_cache: dict | None = None,
+        **extra,
+    ) -> "LocationType":
+        """
+        Build the type like ``from_db_model`` but with ``model_construct``,
+        skipping validation: the values come from typed database columns.
+
+        Args:
+            nested_cache (dict | None): Optional. A dict shared by the items
+                of a list so that the nested category and city types are
+                built once per ID.
+            **extra: Additional fields of subclasses.
+        """
+        nested_cache = {} if nested_cache is None else nested_cache
+
+        categories = []
+        for category in categories_list or []:
+            if (key := (CategoryType, category.id)) not in nested_cache:
+                nested_cache[key] = CategoryType.construct_from_db_model(
+                    instance=category
+                )
+            categories.append(nested_cache[key])
+
+        city = None
+        if city_tuple:
+            city_instance, country = city_tuple
+            if (key := (CityType, city_instance.id)) not in nested_cache:
+                nested_cache[key] = CityType.construct_from_db_model(
+                    instance=city_instance, country=country
+                )
+            city = nested_cache[key]
+
+        return cls.model_construct(
+            id=instance.id,
+            address=instance.address,
+            latitude=float(instance.latitude),
+            longitude=float(instance.longitude),
+            categories_set=categories,
+            city=city,
+            url_detail=cls.get_url_detail(
+                location_id=instance.id, category_id=category_id
+            ),
+            # annotate field's
+            total_reviews=getattr(instance, "total_reviews", 0),
+            **extra,
+        )
+
     @staticmethod
-    def get_city_type(city_tuple: tuple[CityModel, CountryModel]) -> CityType | None:
+    def get_city_type(city_tuple: CityTuple) -> CityType | None:
         if city_tuple:
             city, country = city_tuple
             return CityType.from_db_model(instance=city, country=country)
@@ -69,3 +121,90 @@ class LocationType(BaseModel):
                 for category in categories_list
             ]
         return []
+
+
+class LocationDetailKeyType(BaseModel):
+    location_id: int
+    category_id: int
+
+
+class NearbyLocationType(LocationType):
+    distance_m: float = 0
+
+    @classmethod
+    def from_db_model(
+        cls,
+        instance: LocationModel,
+        category_id: int,
+        city_tuple: CityTuple,
+        categories_list: Iterable[CategoryModel] | None = None,
+        distance_m: float = 0,
+    ) -> "NearbyLocationType":
+        location = super().from_db_model(
+            instance=instance,
+            category_id=category_id,
+            city_tuple=city_tuple,
+            categories_list=categories_list,
+        )
+        location.distance_m = round(distance_m, 2)
+        return location
+
+    @classmethod
+    def construct_from_db_model(
+        cls,
+        instance: LocationModel,
+        category_id: int,
+        city_tuple: CityTuple,
+        categories_list: Iterable[CategoryModel] | None = None,
+        nested_cache: dict | None = None,
+        distance_m: float = 0,
+    ) -> "NearbyLocationType":
+        return super().construct_from_db_model(
+            instance=instance,
+            category_id=category_id,
+            city_tuple=city_tuple,
+            categories_list=categories_list,
+            nested_cache=nested_cache,
+            distance_m=round(distance_m, 2),
+        )
+
+
+class SearchLocationType(LocationType):
+    score: float = 0
+
+    @classmethod
+    def from_db_model(
+        cls,
+        instance: LocationModel,
+        category_id: int,
+        city_tuple: CityTuple,
+        categories_list: Iterable[CategoryModel] | None = None,
+        score: float = 0,
+    ) -> "SearchLocationType":
+        location = super().from_db_model(
+            instance=instance,
+            category_id=category_id,
+            city_tuple=city_tuple,
+            categories_list=categories_list,
+        )
+        location.score = round(score, 4)
+        return location
+
+    @classmethod
+    def construct_from_db_model(
+        cls,
+        instance: LocationModel,
+        category_id: int,
+        city_tuple: CityTuple,
+        categories_list: Iterable[CategoryModel] | None = None,
+        nested_cache: dict | None = None,
+        score: float = 0,
+    ) -> "SearchLocationType":
+        return super().construct_from_db_model(
+            instance=instance,
+            category_id=category_id,
+            city_tuple=city_tuple,
+            categories_list=categories_list,
+            nested_cache=nested_cache,
+            score=round(score, 4),
+        )
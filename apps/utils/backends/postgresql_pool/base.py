@@ -0,0 +1,84 @@
+"""
+PostgreSQL backend taking its connections from a ``ConnectionPool`` shared
+by the threads of the worker, instead of one persistent connection per
+thread (``CONN_MAX_AGE``).
+
+Closing the connection of a thread gives it back to the pool, which the
+``async_database`` methods do after every call. It is selected by
+``config.settings.base`` when ``DATABASE_CONNECTION_POOL`` is on, with the
+pool options in the ``POOL`` key of the database settings.
+"""
+
+# Third-party Libraries
+from django.db.backends.postgresql.base import (
+    DatabaseWrapper as PostgresDatabaseWrapper,
+)
+from django.db.backends.postgresql.psycopg_any import IsolationLevel
+from psycopg2 import extensions
+
+# Own Libraries
+from apps.utils.db_pool import ConnectionPool, get_pool
+
+
+def check_connection(connection) -> bool:
+    """Whether a pooled connection still reaches the server."""
+    if connection.closed:
+        return False
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+    except extensions.Error:
+        return False
+    return True
+
+
+def reset_connection(connection) -> bool:
+    """
+    Roll back the transaction left open on a released connection. Returns
+    False when its state is unknown and it must be discarded.
+    """
+    if connection.closed:
+        return False
+    status = connection.get_transaction_status()
+    if status == extensions.TRANSACTION_STATUS_UNKNOWN:
+        return False
+    if status != extensions.TRANSACTION_STATUS_IDLE:
+        connection.rollback()
+    return True
+
+
+class DatabaseWrapper(PostgresDatabaseWrapper):
+    is_pooled = True
+
+    @property
+    def pool(self) -> ConnectionPool:
+        return get_pool(self.alias, factory=self.create_pool)
+
+    def create_pool(self) -> ConnectionPool:
+        options = self.settings_dict.get("POOL", {})
+        conn_params = self.get_connection_params()
+        return ConnectionPool(
+            name=self.alias,
+            connect=lambda: super(DatabaseWrapper, self).get_new_connection(
+                conn_params
+            ),
+            check=check_connection,
+            reset=reset_connection,
+            **options,
+        )
+
+    def get_new_connection(self, conn_params):
+        # Set by the parent on the wrapper that opens a connection; the
+        # pooled ones are opened by whichever wrapper needed them first.
+        isolation_level = self.settings_dict["OPTIONS"].get("isolation_level")
+        self.isolation_level = IsolationLevel(
+            IsolationLevel.READ_COMMITTED
+            if isolation_level is None
+            else isolation_level
+        )
+        return self.pool.acquire()
+
+    def _close(self):
+        if self.connection is not None:
+            with self.wrap_database_errors:
+                self.pool.release(self.connection)
@@ -0,0 +1,89 @@
+# Standard Libraries
+import logging
+import threading
+import time
+from typing import Callable, Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class VersionedCache(Generic[T]):
+    """
+    Process-wide cache for reference data that rarely changes.
+
+    The data is built once by ``loader`` and served from memory until the
+    cache version is bumped with ``invalidate`` (e.g. from model signals)
+    or, as a backstop for writes made by other processes, until ``ttl``
+    seconds have passed since the last load.
+
+    Attributes:
+        name (str): Name used in logs and stats.
+        loader (Callable[[], T]): Builds the cached data, usually with a
+            database query.
+        ttl (float | None): Optional. Maximum age in seconds of the data.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        loader: Callable[[], T],
+        ttl: float | None = None,
+    ) -> None:
+        self.name = name
+        self.loader = loader
+        self.ttl = ttl
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self._data: T | None = None
+        self._loaded_version: int | None = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def is_fresh(self) -> bool:
+        if self._loaded_version != self.version:
+            return False
+        return self.ttl is None or time.monotonic() - self._loaded_at < self.ttl
+
+    def peek(self) -> T | None:
+        """Return the cached data if it is fresh, without loading it."""
+        if self.is_fresh:
+            self.hits += 1
+            return self._data
+        return None
+
+    def get(self) -> T:
+        """Return the cached data, loading it first when it is stale."""
+        if self.is_fresh:
+            self.hits += 1
+            return self._data
+
+        with self._lock:
+            if not self.is_fresh:
+                self.misses += 1
+                version = self.version
+                data = self.loader()
+                self._data, self._loaded_version = data, version
+                self._loaded_at = time.monotonic()
+                logger.debug(f"***{self.name} cache loaded, version {version}***")
+            else:
+                self.hits += 1
+            return self._data
+
+    def invalidate(self, *args, **kwargs) -> None:
+        """
+        Bump the cache version so the next read reloads the data.
+        Accepts any arguments so it can be connected to model signals.
+        """
+        self.version += 1
+
+    def stats(self) -> dict[str, int | str]:
+        return {
+            "name": self.name,
+            "version": self.version,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
@@ -24,3 +24,4 @@ class LocationCategoryFactory(DjangoModelFactory):
     location = factory.SubFactory(LocationFactory)
     category_id = factory.Faker("random_int", min=1, max=5)
     total_reviews = factory.Faker("random_int", min=0, max=100)
+    recent_reviews = factory.SelfAttribute("total_reviews")
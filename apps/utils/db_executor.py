@@ -0,0 +1,120 @@
+# Standard Libraries
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+# Third-party Libraries
+from asgiref.sync import sync_to_async
+
+# Own Libraries
+from apps.utils.enums import DatabaseExecutionModeEnum
+from apps.utils.instrumentation import request_metrics
+from config.env_vars import settings
+
+logger = logging.getLogger(__name__)
+
+
+class DatabaseExecutor:
+    """
+    Runs the synchronous ORM calls of ``async_database`` off the event loop.
+
+    Modes:
+        THREAD_SENSITIVE: every call runs on the single thread shared by
+            ``sync_to_async(thread_sensitive=True)``, so the database work
+            of a worker is serialized.
+        POOL: calls run on a bounded thread pool. Django keeps one
+            connection per thread, so up to ``pool_size`` queries of a
+            worker run concurrently (e.g. under ``asyncio.gather``).
+
+    The time each call spends queued before a thread picks it up is
+    recorded and exposed through ``stats``, and added to the metrics of the
+    current request.
+
+    Attributes:
+        mode (DatabaseExecutionModeEnum): The execution mode.
+        pool_size (int): Number of threads used in POOL mode.
+    """
+
+    def __init__(self, mode: DatabaseExecutionModeEnum, pool_size: int) -> None:
+        self.mode = mode
+        self.pool_size = pool_size
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self.calls = 0
+        self.queued = 0
+        self.in_flight = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.pool_size,
+                        thread_name_prefix="async_database",
+                    )
+        return self._executor
+
+    async def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run ``func(*args, **kwargs)`` on a database thread and await it."""
+        submitted_at = time.perf_counter()
+        with self._stats_lock:
+            self.queued += 1
+
+        def call():
+            wait = time.perf_counter() - submitted_at
+            self._record_start(wait=wait)
+            if metrics := request_metrics.get():
+                metrics.add_executor_wait(wait)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                with self._stats_lock:
+                    self.in_flight -= 1
+
+        if self.mode == DatabaseExecutionModeEnum.POOL:
+            return await sync_to_async(
+                call,
+                thread_sensitive=False,
+                executor=self.executor,
+            )()
+        return await sync_to_async(call, thread_sensitive=True)()
+
+    def shutdown(self) -> None:
+        if executor := self._executor:
+            self._executor = None
+            executor.shutdown(wait=True)
+
+    def stats(self) -> dict[str, Any]:
+        with self._stats_lock:
+            return {
+                "mode": self.mode.value,
+                "pool_size": self.pool_size,
+                "calls": self.calls,
+                "queued": self.queued,
+                "in_flight": self.in_flight,
+                "queue_wait_total_seconds": self.total_wait,
+                "queue_wait_max_seconds": self.max_wait,
+                "queue_wait_avg_seconds": (
+                    self.total_wait / self.calls if self.calls else 0.0
+                ),
+            }
+
+    def _record_start(self, wait: float) -> None:
+        with self._stats_lock:
+            self.calls += 1
+            self.queued -= 1
+            self.in_flight += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+
+database_executor = DatabaseExecutor(
+    mode=DatabaseExecutionModeEnum(settings.DATABASE_EXECUTION_MODE),
+    pool_size=settings.DATABASE_POOL_SIZE,
+)
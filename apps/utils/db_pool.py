@@ -0,0 +1,327 @@
+# Standard Libraries
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable
+
+# Third-party Libraries
+from django.db import connections
+
+# Own Libraries
+from apps.utils.metrics import (
+    DB_POOL_ACQUIRE_LATENCY,
+    DB_POOL_CONNECTIONS,
+    DB_POOL_EVENTS,
+    DB_POOL_WAITING,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class PoolTimeout(Exception):
+    """Raised when no connection is available within the acquire timeout."""
+
+
+class PooledConnection:
+    """A DB-API connection of a ``ConnectionPool`` and its timestamps."""
+
+    __slots__ = ("connection", "created_at", "idle_since")
+
+    def __init__(self, connection: Any) -> None:
+        self.connection = connection
+        self.created_at = time.monotonic()
+        self.idle_since = self.created_at
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of database connections shared by the threads of one
+    worker process.
+
+    Connections are opened on demand up to ``max_size``; when all of them
+    are in use ``acquire`` waits up to ``timeout`` seconds for one to be
+    released. Idle connections above ``min_size`` are closed after
+    ``max_idle`` seconds, any connection after ``max_lifetime`` seconds,
+    and a connection idle for more than ``check_interval`` seconds is
+    health-checked before being handed out.
+
+    Attributes:
+        name (str): Name used in logs and metrics, e.g. the database alias.
+        connect (Callable[[], Any]): Opens a new connection.
+        check (Callable[[Any], bool]): Whether a connection is usable.
+        reset (Callable[[Any], bool]): Ends the transaction of a released
+            connection; returns False if it must be discarded.
+        min_size (int): Connections kept open while idle.
+        max_size (int): Maximum connections open at once.
+        timeout (float): Seconds ``acquire`` waits for a connection.
+        max_idle (float): Seconds an idle connection is kept above
+            ``min_size``.
+        max_lifetime (float): Seconds after which a connection is replaced.
+        check_interval (float): Idle seconds after which a connection is
+            checked before use.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        connect: Callable[[], Any],
+        check: Callable[[Any], bool],
+        reset: Callable[[Any], bool],
+        min_size: int = 1,
+        max_size: int = 10,
+        timeout: float = 5.0,
+        max_idle: float = 300.0,
+        max_lifetime: float = 3600.0,
+        check_interval: float = 30.0,
+    ) -> None:
+        self.name = name
+        self.connect = connect
+        self.check = check
+        self.reset = reset
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self.max_lifetime = max_lifetime
+        self.check_interval = check_interval
+        self._idle: list[PooledConnection] = []
+        self._in_use: dict[int, PooledConnection] = {}
+        self._opening = 0
+        self._waiting = 0
+        self._condition = threading.Condition()
+        self._in_use_gauge = DB_POOL_CONNECTIONS.labels(pool=name, state="in_use")
+        self._idle_gauge = DB_POOL_CONNECTIONS.labels(pool=name, state="idle")
+        self._waiting_gauge = DB_POOL_WAITING.labels(pool=name)
+        self._acquire_latency = DB_POOL_ACQUIRE_LATENCY.labels(pool=name)
+
+    @property
+    def size(self) -> int:
+        """Connections open, or being opened, by the pool."""
+        return len(self._idle) + len(self._in_use) + self._opening
+
+    def fill(self) -> None:
+        """Open connections until ``min_size`` of them are open."""
+        while True:
+            with self._condition:
+                if self.size >= self.min_size:
+                    return
+                self._opening += 1
+            entry = self._open()
+            with self._condition:
+                self._opening -= 1
+                self._idle.append(entry)
+                self._update_gauges()
+                self._condition.notify()
+
+    def acquire(self) -> Any:
+        """
+        Return a connection for the exclusive use of the caller until it is
+        passed to ``release``.
+
+        Raises:
+            PoolTimeout: If no connection is available within ``timeout``.
+        """
+        started_at = time.monotonic()
+        deadline = started_at + self.timeout
+        while True:
+            entry, expired = self._take(deadline)
+            self._close_all(expired, event="recycled")
+            if entry is None:
+                entry = self._open()
+                with self._condition:
+                    self._opening -= 1
+                    self._in_use[id(entry.connection)] = entry
+                    self._update_gauges()
+            elif (
+                time.monotonic() - entry.idle_since > self.check_interval
+                and not self.check(entry.connection)
+            ):
+                self._event("check_failed")
+                with self._condition:
+                    self._in_use.pop(id(entry.connection), None)
+                self._discard(entry)
+                continue
+            break
+
+        self._acquire_latency.observe(time.monotonic() - started_at)
+        return entry.connection
+
+    def release(self, connection: Any) -> None:
+        """Give back a connection obtained from ``acquire``."""
+        with self._condition:
+            entry = self._in_use.pop(id(connection), None)
+            self._update_gauges()
+        if entry is None:
+            logger.warning(f"***{self.name} pool, release of an unknown connection")
+            self._close(connection, event="closed")
+            return
+
+        reusable = time.monotonic() - entry.created_at < self.max_lifetime
+        try:
+            reusable = reusable and self.reset(connection)
+        except Exception as exp:
+            logger.warning(f"***{self.name} pool, reset failed, {repr(exp)}")
+            reusable = False
+        if not reusable:
+            self._discard(entry)
+            return
+
+        with self._condition:
+            entry.idle_since = time.monotonic()
+            self._idle.append(entry)
+            self._update_gauges()
+            self._condition.notify()
+
+    def close(self) -> None:
+        """Close the idle connections; those in use close on release."""
+        with self._condition:
+            idle, self._idle = self._idle, []
+            self.min_size = self.max_lifetime = 0
+            self._update_gauges()
+        self._close_all(idle, event="closed")
+
+    def stats(self) -> dict[str, int | str]:
+        with self._condition:
+            return {
+                "name": self.name,
+                "size": self.size,
+                "in_use": len(self._in_use),
+                "idle": len(self._idle),
+                "waiting": self._waiting,
+                "max_size": self.max_size,
+            }
+
+    def _take(self, deadline: float) -> tuple[PooledConnection | None, list]:
+        """
+        Take the most recently used idle connection, or reserve a slot to
+        open a new one (returning None), waiting until ``deadline``. Also
+        returns the idle connections to recycle.
+        """
+        with self._condition:
+            self._waiting += 1
+            self._waiting_gauge.inc()
+            try:
+                while True:
+                    expired = self._pop_expired()
+                    if self._idle:
+                        entry = self._idle.pop()
+                        self._in_use[id(entry.connection)] = entry
+                        return entry, expired
+                    if self.size < self.max_size:
+                        self._opening += 1
+                        return None, expired
+                    if (remaining := deadline - time.monotonic()) <= 0:
+                        self._event("timeout")
+                        raise PoolTimeout(
+                            f"No connection of the {self.name} pool was available "
+                            f"within {self.timeout}s ({self.max_size} in use)"
+                        )
+                    self._condition.wait(remaining)
+            finally:
+                self._waiting -= 1
+                self._waiting_gauge.dec()
+                self._update_gauges()
+
+    def _pop_expired(self) -> list[PooledConnection]:
+        """Remove the idle connections past their idle time or lifetime."""
+        now = time.monotonic()
+        expired = []
+        keep = []
+        # The oldest idle connections come first.
+        for entry in self._idle:
+            over_min = len(keep) + len(self._in_use) + self._opening >= self.min_size
+            if now - entry.created_at >= self.max_lifetime or (
+                over_min and now - entry.idle_since >= self.max_idle
+            ):
+                expired.append(entry)
+            else:
+                keep.append(entry)
+        self._idle = keep
+        return expired
+
+    def _open(self) -> PooledConnection:
+        """
+        Open a connection for a slot reserved in ``_opening``; the caller
+        releases the slot once the connection is accounted for.
+        """
+        try:
+            entry = PooledConnection(self.connect())
+        except Exception:
+            with self._condition:
+                self._opening -= 1
+                self._condition.notify()
+            self._event("connect_failed")
+            raise
+        self._event("opened")
+        return entry
+
+    def _discard(self, entry: PooledConnection) -> None:
+        self._close(entry.connection, event="closed")
+        with self._condition:
+            self._update_gauges()
+            self._condition.notify()
+
+    def _close_all(self, entries: list[PooledConnection], event: str) -> None:
+        for entry in entries:
+            self._close(entry.connection, event=event)
+
+    def _close(self, connection: Any, event: str) -> None:
+        try:
+            connection.close()
+        except Exception as exp:
+            logger.debug(f"***{self.name} pool, close failed, {repr(exp)}")
+        self._event(event)
+
+    def _event(self, event: str) -> None:
+        DB_POOL_EVENTS.labels(pool=self.name, event=event).inc()
+
+    def _update_gauges(self) -> None:
+        self._in_use_gauge.set(len(self._in_use))
+        self._idle_gauge.set(len(self._idle))
+
+
+_pools: dict[str, ConnectionPool] = {}
+_pools_pid: int | None = None
+_pools_lock = threading.Lock()
+
+
+def get_pool(name: str, factory: Callable[[], ConnectionPool]) -> ConnectionPool:
+    """
+    Return the pool ``name`` of the current process, creating it with
+    ``factory`` on first use. Pools inherited from the parent process
+    (gunicorn ``--preload``) are dropped: their sockets belong to it.
+    """
+    global _pools_pid
+
+    with _pools_lock:
+        if _pools_pid != os.getpid():
+            _pools.clear()
+            _pools_pid = os.getpid()
+        if (pool := _pools.get(name)) is None:
+            pool = _pools[name] = factory()
+        return pool
+
+
+def pools_stats() -> list[dict[str, int | str]]:
+    """Return the ``stats`` of the pools of the current process."""
+    return [pool.stats() for pool in list(_pools.values())]
+
+
+def close_pools() -> None:
+    for pool in list(_pools.values()):
+        pool.close()
+
+
+def release_pooled_connections() -> None:
+    """
+    Give the connections of the current thread opened by a pooling backend
+    back to their pool, unless they are inside a transaction.
+    """
+    for connection in connections.all(initialized_only=True):
+        if (
+            getattr(connection, "is_pooled", False)
+            and connection.connection is not None
+            and not connection.in_atomic_block
+        ):
+            connection.close()
@@ -0,0 +1,119 @@
+# Standard Libraries
+import contextvars
+import random
+from contextlib import contextmanager
+from typing import Iterator
+
+# Third-party Libraries
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+REPLICA_PREFIX = "replica_"
+
+
+class RoutingState:
+    """
+    Database routing of a single request, or of a block of ``use_primary``.
+
+    Like ``RequestMetrics`` the instance is shared, through
+    ``routing_state``, with every database thread and task of the request,
+    so a write made by any of them sends the following reads to the
+    primary.
+
+    Attributes:
+        primary (bool): Whether the reads go to the primary: the request
+            wrote to it (read-your-writes) or asked for it.
+        replica (str | None): Replica serving the reads of the request,
+            picked on its first read so they all see the same snapshot lag.
+    """
+
+    __slots__ = ("primary", "replica")
+
+    def __init__(self, primary: bool = False) -> None:
+        self.primary = primary
+        self.replica: str | None = None
+
+
+routing_state: contextvars.ContextVar[RoutingState | None] = contextvars.ContextVar(
+    "routing_state", default=None
+)
+
+
+@contextmanager
+def use_primary() -> Iterator[None]:
+    """
+    Send the reads of the block to the primary, those made by the
+    ``async_database`` calls it awaits included.
+    """
+    token = routing_state.set(RoutingState(primary=True))
+    try:
+        yield
+    finally:
+        routing_state.reset(token)
+
+
+class ReplicaRouter:
+    """
+    Django database router sending the writes to ``default`` (the primary)
+    and the reads to the ``replica_*`` databases (see
+    ``DATABASE_REPLICA_URLS``).
+
+    Reads go to the primary when there is no replica, inside a transaction
+    of the primary, and in a request after its first write.
+    """
+
+    def __init__(self) -> None:
+        self.replicas = [
+            alias for alias in settings.DATABASES if alias.startswith(REPLICA_PREFIX)
+        ]
+
+    def db_for_read(self, model, **hints) -> str:
+        state = routing_state.get()
+        if (
+            not self.replicas
+            or (state is not None and state.primary)
+            or connections[DEFAULT_DB_ALIAS].in_atomic_block
+        ):
+            return DEFAULT_DB_ALIAS
+        if state is None:
+            return random.choice(self.replicas)
+        if state.replica is None:
+            state.replica = random.choice(self.replicas)
+        return state.replica
+
+    def db_for_write(self, model, **hints) -> str:
+        if (state := routing_state.get()) is not None:
+            state.primary = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints) -> bool:
+        # The replicas hold the same rows as the primary.
+        return True
+
+    def allow_migrate(self, db: str, app_label: str, **hints) -> bool:
+        # The replicas get the schema from the primary by replication.
+        return db == DEFAULT_DB_ALIAS
+
+
+class ReadYourWritesMiddleware:
+    """
+    ASGI middleware giving each HTTP request its ``RoutingState``, so the
+    reads that follow a write of the request see it.
+
+    Attributes:
+        app: The wrapped ASGI application.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = routing_state.set(RoutingState())
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            routing_state.reset(token)
@@ -1,11 +1,11 @@
 # Standard Libraries
 import functools
 import logging
+import time
 from functools import wraps
 from typing import Union
 
 # Third-party Libraries
-from asgiref.sync import sync_to_async
 from django.db import close_old_connections, utils
 from fastapi import status
 from fastapi.responses import JSONResponse
@@ -14,24 +14,61 @@ from pydantic import ValidationError
 # Own Libraries
 from apps.location.schema.response.category import CreateCategoryPayload
 from apps.location.schema.response.interface import Response
-from apps.location.schema.response.location import CreateLocationPayload
+from apps.location.schema.response.location import (
+    BatchLocationDetailPayload,
+    BulkCreateLocationPayload,
+    CreateLocationPayload,
+    LocationListPayload,
+    ViewportPayload,
+)
+from apps.utils.db_executor import database_executor
+from apps.utils.db_pool import release_pooled_connections
+from apps.utils.db_router import use_primary
+from apps.utils.metrics import HANDLER_OUTCOMES, process_method_timer
 
 logger = logging.getLogger(__name__)
 
-PayloadClass = Union[CreateCategoryPayload, CreateLocationPayload]
+PayloadClass = Union[
+    BatchLocationDetailPayload,
+    BulkCreateLocationPayload,
+    CreateCategoryPayload,
+    CreateLocationPayload,
+    LocationListPayload,
+    ViewportPayload,
+]
 
 
 def async_database():
+    """
+    Decorator turning a synchronous ORM method into a coroutine run by
+    ``database_executor`` (see ``DATABASE_EXECUTION_MODE``), timed in the
+    ``process_method_duration_seconds`` histogram. With a pooling database
+    backend the connections are given back to the pool after each call.
+    """
+
     def decorator(func):
-        @sync_to_async(thread_sensitive=True)
+        timer = process_method_timer(func.__qualname__)
+
         @wraps(func)
-        def wrapper(*args, **kwargs):
+        def sync_wrapper(*args, **kwargs):
             try:
                 return func(*args, **kwargs)
             except (utils.InterfaceError, utils.OperationalError):
                 close_old_connections()
                 logger.info("database:close_old_connections()")
-                return func(*args, **kwargs)
+                # The failing database may be a replica: retry on the primary.
+                with use_primary():
+                    return func(*args, **kwargs)
+            finally:
+                release_pooled_connections()
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            started_at = time.perf_counter()
+            try:
+                return await database_executor.run(sync_wrapper, *args, **kwargs)
+            finally:
+                timer.observe(time.perf_counter() - started_at)
 
         return wrapper
 
@@ -56,11 +93,19 @@ def handler_exception(payload_class: PayloadClass, log_tag: str):
     """
 
     def decorator(func):
+        succeeded, rejected, failed = (
+            HANDLER_OUTCOMES.labels(handler=log_tag, outcome=outcome)
+            for outcome in ("success", "validation_error", "internal_error")
+        )
+
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
             try:
-                return await func(*args, **kwargs)
+                result = await func(*args, **kwargs)
+                succeeded.inc()
+                return result
             except (AssertionError, ValidationError) as exp:
+                rejected.inc()
                 logger.warning(
                     f"***{log_tag}, Validation Error, {repr(exp)}", exc_info=True
                 )
@@ -73,10 +118,11 @@ def handler_exception(payload_class: PayloadClass, log_tag: str):
                     )
                 )
                 return JSONResponse(
-                    content=content.model_dump(),
+                    content=content.model_dump(mode="json"),
                     status_code=status.HTTP_400_BAD_REQUEST,
                 )
             except Exception as exp:
+                failed.inc()
                 logger.error(
                     f"***{log_tag}, Internal Error, {repr(exp)}", exc_info=True
                 )
@@ -88,7 +134,7 @@ def handler_exception(payload_class: PayloadClass, log_tag: str):
                     )
                 )
                 return JSONResponse(
-                    content=content.model_dump(),
+                    content=content.model_dump(mode="json"),
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 )
 
@@ -5,3 +5,8 @@ import enum
 class SortedOrderByFieldEnum(enum.Enum):
     ASC = ""
     DESC = "-"
+
+
+class DatabaseExecutionModeEnum(enum.Enum):
+    THREAD_SENSITIVE = "thread_sensitive"
+    POOL = "pool"
@@ -0,0 +1,43 @@
+# Standard Libraries
+import hashlib
+
+# Third-party Libraries
+from fastapi import status
+from fastapi.responses import Response
+
+
+def make_weak_etag(*parts) -> str:
+    """
+    Build a weak ETag from the values identifying a representation, such
+    as ``updated_at`` timestamps, counters and request parameters.
+    """
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Return whether an ``If-None-Match`` header matches ``etag`` using the
+    weak comparison required for conditional GET requests.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque_tag = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque_tag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def cache_headers(etag: str, cache_control: str) -> dict[str, str]:
+    return {"ETag": etag, "Cache-Control": cache_control}
+
+
+def not_modified(etag: str, cache_control: str) -> Response:
+    """Return an empty 304 NOT MODIFIED response for ``etag``."""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers=cache_headers(etag=etag, cache_control=cache_control),
+    )
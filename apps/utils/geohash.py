@@ -0,0 +1,161 @@
+# Standard Libraries
+import math
+from decimal import Decimal
+
+BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+BASE32_INDEX = {char: index for index, char in enumerate(BASE32)}
+
+MAX_PRECISION = 12
+EARTH_RADIUS_M = 6_371_008.8
+METERS_PER_DEGREE = EARTH_RADIUS_M * math.pi / 180
+
+Number = float | Decimal
+
+
+def encode(latitude: Number, longitude: Number, precision: int = MAX_PRECISION) -> str:
+    """
+    Encode a coordinate into a geohash string.
+
+    Args:
+        latitude (float | Decimal): Latitude in degrees, -90 to 90.
+        longitude (float | Decimal): Longitude in degrees, -180 to 180.
+        precision (int): Number of characters of the resulting hash.
+
+    Returns:
+        str: The geohash; every prefix of it is the enclosing cell at a
+        lower precision.
+    """
+    latitude, longitude = float(latitude), float(longitude)
+    lat_range, lon_range = [-90.0, 90.0], [-180.0, 180.0]
+    chars, bit, char_index, even = [], 0, 0, True
+
+    while len(chars) < precision:
+        coord, bounds = (longitude, lon_range) if even else (latitude, lat_range)
+        middle = (bounds[0] + bounds[1]) / 2
+        if coord >= middle:
+            char_index = (char_index << 1) | 1
+            bounds[0] = middle
+        else:
+            char_index <<= 1
+            bounds[1] = middle
+        even = not even
+        bit += 1
+        if bit == 5:
+            chars.append(BASE32[char_index])
+            bit, char_index = 0, 0
+
+    return "".join(chars)
+
+
+def decode_bounds(geohash: str) -> tuple[float, float, float, float]:
+    """
+    Return the bounding box of a geohash cell as
+    (min_lat, min_lon, max_lat, max_lon).
+    """
+    lat_range, lon_range = [-90.0, 90.0], [-180.0, 180.0]
+    even = True
+    for char in geohash:
+        char_index = BASE32_INDEX[char]
+        for shift in range(4, -1, -1):
+            bounds = lon_range if even else lat_range
+            middle = (bounds[0] + bounds[1]) / 2
+            if (char_index >> shift) & 1:
+                bounds[0] = middle
+            else:
+                bounds[1] = middle
+            even = not even
+    return lat_range[0], lon_range[0], lat_range[1], lon_range[1]
+
+
+def cell_size_degrees(precision: int) -> tuple[float, float]:
+    """Return the (height, width) in degrees of a cell at the given precision."""
+    bits = precision * 5
+    lon_bits = (bits + 1) // 2
+    lat_bits = bits // 2
+    return 180.0 / (1 << lat_bits), 360.0 / (1 << lon_bits)
+
+
+def precision_for_radius(latitude: Number, radius_m: float) -> int:
+    """
+    Return the highest precision whose cells are at least ``radius_m``
+    tall and wide around ``latitude``, so that the 3x3 block of cells
+    centred on a point contains every point within the radius.
+    """
+    # The narrowest longitude span is at the edge closest to the pole.
+    edge_latitude = min(90.0, abs(float(latitude)) + radius_m / METERS_PER_DEGREE)
+    cos_lat = math.cos(math.radians(edge_latitude))
+
+    for precision in range(MAX_PRECISION, 0, -1):
+        height_deg, width_deg = cell_size_degrees(precision)
+        height_m = height_deg * METERS_PER_DEGREE
+        width_m = width_deg * METERS_PER_DEGREE * cos_lat
+        if min(height_m, width_m) >= radius_m:
+            return precision
+    return 1
+
+
+def neighbours(geohash: str) -> list[str]:
+    """
+    Return the cell itself followed by its (up to) eight neighbours at
+    the same precision. Longitude wraps around the antimeridian and
+    cells beyond the poles are omitted.
+    """
+    precision = len(geohash)
+    min_lat, min_lon, max_lat, max_lon = decode_bounds(geohash)
+    height, width = max_lat - min_lat, max_lon - min_lon
+    center_lat, center_lon = min_lat + height / 2, min_lon + width / 2
+
+    cells = [geohash]
+    for d_lat in (-1, 0, 1):
+        latitude = center_lat + d_lat * height
+        if not -90.0 < latitude < 90.0:
+            continue
+        for d_lon in (-1, 0, 1):
+            longitude = (center_lon + d_lon * width + 180.0) % 360.0 - 180.0
+            if (cell := encode(latitude, longitude, precision)) not in cells:
+                cells.append(cell)
+    return cells
+
+
+def cells_around(latitude: Number, longitude: Number, radius_m: float) -> list[str]:
+    """
+    Return the geohash cells whose prefixes cover every point within
+    ``radius_m`` metres of a coordinate: its cell at
+    ``precision_for_radius`` and the neighbours of that cell.
+    """
+    precision = precision_for_radius(latitude, radius_m)
+    return neighbours(encode(latitude, longitude, precision))
+
+
+def covering_prefixes(cells: set[str], max_prefixes: int) -> set[str]:
+    """
+    Shorten ``cells`` until at most ``max_prefixes`` distinct prefixes
+    remain, dropping those covered by a shorter one, so that a single
+    query with one prefix lookup each reads all their points.
+    """
+    prefixes = set(cells)
+    while len(prefixes) > max_prefixes and max(map(len, prefixes)) > 1:
+        length = max(map(len, prefixes)) - 1
+        prefixes = {prefix[:length] for prefix in prefixes}
+    return {
+        prefix
+        for prefix in prefixes
+        if not any(prefix[:length] in prefixes for length in range(1, len(prefix)))
+    }
+
+
+def haversine_m(
+    lat_1: Number,
+    lon_1: Number,
+    lat_2: Number,
+    lon_2: Number,
+) -> float:
+    """Return the great-circle distance in metres between two coordinates."""
+    phi_1, phi_2 = math.radians(float(lat_1)), math.radians(float(lat_2))
+    d_phi = phi_2 - phi_1
+    d_lambda = math.radians(float(lon_2) - float(lon_1))
+    a = (
+        math.sin(d_phi / 2) ** 2
+        + math.cos(phi_1) * math.cos(phi_2) * math.sin(d_lambda / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_M * math.asin(min(1.0, math.sqrt(a)))
@@ -0,0 +1,44 @@
+# Standard Libraries
+import math
+from decimal import Decimal
+
+# Square cells of the clustering grid per map tile side: at zoom ``z`` the
+# world is 2**z tiles wide, so a 256px tile holds 4x4 cells of 64px.
+CELLS_PER_TILE = 4
+
+Number = float | Decimal
+
+
+def cell_size_degrees(zoom: int) -> float:
+    """Return the side, in degrees, of the grid cells at ``zoom``."""
+    return 360 / (2**zoom * CELLS_PER_TILE)
+
+
+def cell_of(latitude: Number, longitude: Number, zoom: int) -> tuple[int, int]:
+    """
+    Return the (x, y) grid cell containing a coordinate at ``zoom``.
+
+    Cells are counted from (-180, -90); the same formula is evaluated in
+    SQL when the cluster aggregates are rebuilt.
+    """
+    size = cell_size_degrees(zoom)
+    return (
+        math.floor((float(longitude) + 180) / size),
+        math.floor((float(latitude) + 90) / size),
+    )
+
+
+def cell_range(
+    min_latitude: Number,
+    min_longitude: Number,
+    max_latitude: Number,
+    max_longitude: Number,
+    zoom: int,
+) -> tuple[int, int, int, int]:
+    """
+    Return the (min_x, min_y, max_x, max_y) cells covering a bounding box
+    at ``zoom``, both ends included.
+    """
+    min_x, min_y = cell_of(min_latitude, min_longitude, zoom)
+    max_x, max_y = cell_of(max_latitude, max_longitude, zoom)
+    return min_x, min_y, max_x, max_y
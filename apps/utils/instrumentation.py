@@ -0,0 +1,168 @@
+# Standard Libraries
+import contextvars
+import logging
+import threading
+import time
+from collections import Counter
+
+# Third-party Libraries
+from django.db.backends.signals import connection_created
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """Raised in strict mode when a request runs more queries than allowed."""
+
+
+class RequestMetrics:
+    """
+    Database activity of a single request.
+
+    The instance is shared, through ``request_metrics``, with every database
+    thread that serves the request, hence the lock.
+
+    Attributes:
+        queries (int): Number of SQL queries executed.
+        db_time (float): Seconds spent executing them.
+        executor_wait (float): Seconds the ``async_database`` calls waited
+            for a database thread.
+        statements (Counter[str]): Executions per SQL statement, with its
+            parameters left as placeholders.
+    """
+
+    def __init__(self) -> None:
+        self.queries = 0
+        self.db_time = 0.0
+        self.executor_wait = 0.0
+        self.statements: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def add_query(self, sql: str, duration: float) -> None:
+        with self._lock:
+            self.queries += 1
+            self.db_time += duration
+            self.statements[sql] += 1
+
+    def add_executor_wait(self, wait: float) -> None:
+        with self._lock:
+            self.executor_wait += wait
+
+    def repeated_statements(self, threshold: int) -> dict[str, int]:
+        """Return the statements executed at least ``threshold`` times."""
+        with self._lock:
+            return {
+                sql: count
+                for sql, count in self.statements.most_common()
+                if count >= threshold
+            }
+
+    def server_timing(self) -> str:
+        """Render the metrics as a ``Server-Timing`` header value."""
+        return (
+            f'db;dur={self.db_time * 1000:.2f};desc="{self.queries} queries", '
+            f"db-wait;dur={self.executor_wait * 1000:.2f}"
+        )
+
+
+# asgiref copies the context into the threads of ``sync_to_async``, so the
+# metrics of the request are reachable from the ORM calls it makes.
+request_metrics: contextvars.ContextVar[RequestMetrics | None] = contextvars.ContextVar(
+    "request_metrics", default=None
+)
+
+
+def record_query(execute, sql, params, many, context):
+    """Django execute wrapper adding each query to the current request."""
+    if (metrics := request_metrics.get()) is None:
+        return execute(sql, params, many, context)
+
+    started_at = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.add_query(sql=sql, duration=time.perf_counter() - started_at)
+
+
+def install_query_recorder(sender, connection, **kwargs) -> None:
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+class QueryInstrumentationMiddleware:
+    """
+    ASGI middleware recording the SQL queries of every HTTP request.
+
+    The query count, database time and ``async_database`` queue wait are
+    sent in a ``Server-Timing`` header and logged when the request ends,
+    along with the statements repeated ``n_plus_one_threshold`` times or
+    more (the usual shape of an N+1). With ``strict`` set, a request that
+    runs more than ``query_budget`` queries before responding fails with
+    ``QueryBudgetExceeded``.
+
+    Attributes:
+        app: The wrapped ASGI application.
+        query_budget (int): Maximum queries a request should run.
+        strict (bool): Whether exceeding the budget raises.
+        n_plus_one_threshold (int): Executions of the same statement
+            reported as a possible N+1.
+    """
+
+    def __init__(
+        self,
+        app,
+        query_budget: int,
+        strict: bool = False,
+        n_plus_one_threshold: int = 5,
+    ) -> None:
+        self.app = app
+        self.query_budget = query_budget
+        self.strict = strict
+        self.n_plus_one_threshold = n_plus_one_threshold
+        connection_created.connect(
+            install_query_recorder,
+            dispatch_uid="apps.utils.instrumentation.install_query_recorder",
+        )
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        metrics = RequestMetrics()
+        token = request_metrics.set(metrics)
+        path = f"{scope['method']} {scope['path']}"
+
+        async def send_with_timing(message) -> None:
+            if message["type"] == "http.response.start":
+                if self.strict and metrics.queries > self.query_budget:
+                    raise QueryBudgetExceeded(
+                        f"{path} ran {metrics.queries} queries, the budget is "
+                        f"{self.query_budget}"
+                    )
+                message.setdefault("headers", []).append(
+                    (b"server-timing", metrics.server_timing().encode("latin-1"))
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            request_metrics.reset(token)
+            self.report(path=path, metrics=metrics)
+
+    def report(self, path: str, metrics: RequestMetrics) -> None:
+        logger.debug(
+            f"***{path}, {metrics.queries} queries, "
+            f"db {metrics.db_time * 1000:.2f}ms, "
+            f"db-wait {metrics.executor_wait * 1000:.2f}ms"
+        )
+        if metrics.queries > self.query_budget:
+            logger.warning(
+                f"***{path}, Query Budget, {metrics.queries} queries "
+                f"(budget {self.query_budget})"
+            )
+        for sql, count in metrics.repeated_statements(
+            threshold=self.n_plus_one_threshold
+        ).items():
+            logger.warning(f"***{path}, Possible N+1, {count}x {sql}")
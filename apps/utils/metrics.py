@@ -0,0 +1,169 @@
+# Standard Libraries
+import os
+import time
+
+# Third-party Libraries
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# When PROMETHEUS_MULTIPROC_DIR is set (see run.sh) every gunicorn worker
+# writes its samples there and ``render_metrics`` aggregates all of them.
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Latency of the HTTP requests by route.",
+    ["method", "route"],
+    buckets=LATENCY_BUCKETS,
+)
+REQUEST_COUNT = Counter(
+    "http_requests",
+    "HTTP requests by route and status code.",
+    ["method", "route", "status_code"],
+)
+HANDLER_OUTCOMES = Counter(
+    "handler_exception_outcomes",
+    "Outcomes of the routes wrapped by handler_exception.",
+    ["handler", "outcome"],
+)
+IDEMPOTENCY_OUTCOMES = Counter(
+    "idempotency_key_outcomes",
+    "Requests sent with an Idempotency-Key by route and outcome (executed, "
+    "replayed, in_progress, mismatch).",
+    ["scope", "outcome"],
+)
+SINGLE_FLIGHT_OUTCOMES = Counter(
+    "single_flight_outcomes",
+    "Calls of the single-flight layers by outcome (hit, stale, coalesced, miss).",
+    ["name", "outcome"],
+)
+PROCESS_LATENCY = Histogram(
+    "process_method_duration_seconds",
+    "Latency of the async_database Process methods, queue wait included.",
+    ["process", "method"],
+    buckets=LATENCY_BUCKETS,
+)
+TASK_QUEUE_DEPTH = Gauge(
+    "task_queue_depth",
+    "Tasks of the durable task queue by kind and state (ready, failed), as "
+    "last counted by a task worker.",
+    ["kind", "state"],
+    multiprocess_mode="livemax",
+)
+TASK_QUEUE_LATENCY = Histogram(
+    "task_queue_latency_seconds",
+    "Time from enqueueing a task to its completion, retries included.",
+    ["kind"],
+    buckets=LATENCY_BUCKETS,
+)
+TASK_QUEUE_TASKS = Counter(
+    "task_queue_tasks",
+    "Tasks run by the task workers by kind and outcome (completed, "
+    "retried, failed).",
+    ["kind", "outcome"],
+)
+DB_POOL_CONNECTIONS = Gauge(
+    "db_pool_connections",
+    "Connections of the database pools by state (in_use, idle).",
+    ["pool", "state"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_WAITING = Gauge(
+    "db_pool_waiting",
+    "Threads waiting for a connection of the database pools.",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_ACQUIRE_LATENCY = Histogram(
+    "db_pool_acquire_duration_seconds",
+    "Time spent acquiring a connection from the database pools.",
+    ["pool"],
+    buckets=LATENCY_BUCKETS,
+)
+DB_POOL_EVENTS = Counter(
+    "db_pool_events",
+    "Connections opened, closed, recycled, failing their health check or "
+    "timed out by the database pools.",
+    ["pool", "event"],
+)
+
+
+def process_method_timer(qualname: str) -> Histogram:
+    """
+    Return the ``PROCESS_LATENCY`` child of a method from its qualified
+    name, e.g. ``QueryLocationProcess.get_page``.
+    """
+    process, _, method = qualname.rpartition(".")
+    return PROCESS_LATENCY.labels(process=process or "-", method=method)
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Return the metrics in Prometheus text format and its content type."""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware observing the latency of every HTTP request, labelled
+    with the path template of the route that served it.
+
+    Attributes:
+        app: The wrapped ASGI application.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message) -> None:
+            nonlocal status_code
+            await send(message)
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+
+        started_at = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started_at
+            # The router stores the matched route in the (shared) scope.
+            route = getattr(scope.get("route"), "path", "unmatched")
+            REQUEST_LATENCY.labels(method=scope["method"], route=route).observe(elapsed)
+            REQUEST_COUNT.labels(
+                method=scope["method"],
+                route=route,
+                status_code=status_code,
+            ).inc()
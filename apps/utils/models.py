@@ -7,7 +7,22 @@ from django.db import connection, models
 logger = logging.getLogger(__name__)
 
 
+class LiveManager(models.Manager):
+    """Manager of the rows that are not soft-deleted."""
+
+    def get_queryset(self) -> models.QuerySet:
+        return super().get_queryset().filter(is_deleted=False)
+
+
 class AuditableMixin(models.Model):
+    """
+    Adds the audit dates and the soft-delete flag.
+
+    ``objects``, the default manager, only returns the live rows, which the
+    partial indexes of the models cover; ``all_objects`` also returns the
+    soft-deleted ones, e.g. to check the unique constraints or archive them.
+    """
+
     created_at: str = models.DateTimeField(
         auto_now_add=True,
         editable=False,
@@ -17,10 +32,10 @@ class AuditableMixin(models.Model):
         auto_now=True,
         verbose_name="Fecha de modificación",
     )
-    is_deleted: bool = models.BooleanField(
-        default=False,
-        db_index=True,
-    )
+    is_deleted: bool = models.BooleanField(default=False)
+
+    objects = LiveManager()
+    all_objects = models.Manager()
 
     class Meta:
         abstract = True
@@ -0,0 +1,26 @@
+# Standard Libraries
+from typing import AsyncIterable, AsyncIterator
+
+
+async def iter_lines(
+    chunks: AsyncIterable[bytes],
+) -> AsyncIterator[tuple[int, bytes]]:
+    """
+    Split a stream of byte chunks (e.g. ``Request.stream()``) into NDJSON
+    lines without buffering the whole body.
+
+    Yields:
+        tuple[int, bytes]: The 1-based line number and the stripped line;
+        blank lines are skipped.
+    """
+    buffer = b""
+    line_number = 0
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            line_number += 1
+            if line := line.strip():
+                yield line_number, line
+    if buffer := buffer.strip():
+        yield line_number + 1, buffer
@@ -0,0 +1,133 @@
+# Standard Libraries
+import math
+import re
+import threading
+from array import array
+from collections import Counter
+
+WORD_RE = re.compile(r"[^\W_]+")
+
+EMPTY_POSTING = array("q")
+
+
+def normalize(text: str) -> str:
+    """Lowercase ``text`` and keep its alphanumeric words, space separated."""
+    return " ".join(WORD_RE.findall(text.lower()))
+
+
+def trigrams(text: str, prefix: bool = False) -> set[str]:
+    """
+    Return the trigrams of ``text`` the way pg_trgm extracts them: per
+    lowercase alphanumeric word, padded with two spaces in front and one
+    behind.
+
+    Args:
+        text (str): The text.
+        prefix (bool): Treat the last word as the prefix of a longer one,
+            leaving out its end-of-word trigram (for as-you-type queries).
+    """
+    grams = set()
+    words = WORD_RE.findall(text.lower())
+    for position, word in enumerate(words, start=1):
+        padded = f"  {word}" if prefix and position == len(words) else f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def text_score(query: str, text: str, similarity: float) -> float:
+    """
+    Score in [0, 1] how well ``text`` matches ``query``, both normalized:
+    1 for a prefix of the text, 0.9 for a prefix of one of its words, or
+    the trigram ``similarity`` scaled down to 0.8 for fuzzy matches.
+    """
+    if text.startswith(query):
+        return 1.0
+    if f" {query}" in f" {text}":
+        return 0.9
+    return 0.8 * similarity
+
+
+class NgramIndex:
+    """
+    In-memory trigram inverted index for fuzzy and prefix text search.
+
+    Each trigram maps to the ids of the documents containing it. A query
+    sharing ``required`` of its ``n`` trigrams with a document must share
+    at least one of its ``n - required + 1`` rarest trigrams, so only their
+    postings are read to collect candidates, which are then verified
+    against the stored text.
+
+    Documents are updated by adding them again and removed with
+    ``discard``; stale postings are skipped when verifying.
+
+    Attributes:
+        max_candidates (int): The maximum candidates verified per query,
+            those sharing most rare trigrams with it.
+    """
+
+    def __init__(self, max_candidates: int = 5000) -> None:
+        self.max_candidates = max_candidates
+        self._texts: dict[int, str] = {}
+        self._postings: dict[str, array] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def add(self, doc_id: int, text: str) -> None:
+        text = normalize(text)
+        with self._lock:
+            if self._texts.get(doc_id) == text:
+                return
+            self._texts[doc_id] = text
+            for gram in trigrams(text):
+                if (posting := self._postings.get(gram)) is None:
+                    posting = self._postings[gram] = array("q")
+                posting.append(doc_id)
+
+    def discard(self, doc_id: int) -> None:
+        with self._lock:
+            self._texts.pop(doc_id, None)
+
+    def search(
+        self,
+        query: str,
+        limit: int,
+        min_similarity: float,
+    ) -> list[tuple[int, float]]:
+        """
+        Return the documents matching ``query``, best first.
+
+        Args:
+            query (str): The search text; its last word may be a prefix.
+            limit (int): The maximum number of documents to return.
+            min_similarity (float): The minimum share of the query
+                trigrams a document must contain.
+
+        Returns:
+            list[tuple[int, float]]: The document ids with their
+            ``text_score``.
+        """
+        query = normalize(query)
+        if not (grams := trigrams(query, prefix=True)):
+            return []
+        required = max(1, math.ceil(min_similarity * len(grams)))
+
+        postings = sorted(
+            (self._postings.get(gram, EMPTY_POSTING) for gram in grams), key=len
+        )
+        counts = Counter()
+        for posting in postings[: len(grams) - required + 1]:
+            counts.update(posting)
+
+        matches = []
+        for doc_id, _ in counts.most_common(self.max_candidates):
+            if (text := self._texts.get(doc_id)) is None:
+                continue
+            if (shared := len(grams & trigrams(text))) < required:
+                continue
+            similarity = shared / len(grams)
+            matches.append((doc_id, text_score(query, text, similarity)))
+
+        matches.sort(key=lambda match: (-match[1], match[0]))
+        return matches[:limit]
@@ -0,0 +1,38 @@
+# Standard Libraries
+import base64
+import json
+
+
+def encode_cursor(*values: int) -> str:
+    """
+    Encode the keyset values of the last item of a page into an opaque,
+    URL safe cursor token.
+    """
+    raw = json.dumps(list(values), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> tuple[int, ...]:
+    """
+    Decode a cursor created by ``encode_cursor``.
+
+    Args:
+        cursor (str): The cursor token.
+        size (int): The number of keyset values expected.
+
+    Raises:
+        AssertionError: If the cursor is malformed.
+    """
+    try:
+        padding = "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(cursor + padding))
+    except (ValueError, TypeError) as exp:
+        raise AssertionError("The cursor is invalid") from exp
+
+    if (
+        not isinstance(values, list)
+        or len(values) != size
+        or not all(isinstance(value, int) for value in values)
+    ):
+        raise AssertionError("The cursor is invalid")
+    return tuple(values)
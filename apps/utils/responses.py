@@ -0,0 +1,31 @@
+# Standard Libraries
+from functools import lru_cache
+
+# Third-party Libraries
+from fastapi.responses import Response
+from pydantic import BaseModel, TypeAdapter
+
+
+@lru_cache(maxsize=None)
+def get_type_adapter(model_class: type[BaseModel]) -> TypeAdapter:
+    """Return the compiled TypeAdapter of a payload class, built once."""
+    return TypeAdapter(model_class)
+
+
+class PayloadResponse(Response):
+    """
+    JSON response rendering a pydantic payload with its compiled
+    pydantic-core serializer.
+
+    Returning it from a route skips FastAPI's second validation of the
+    payload against the response model and the ``jsonable_encoder`` pass:
+    the payload is serialized straight to bytes exactly once.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: BaseModel | bytes) -> bytes:
+        if isinstance(content, bytes):
+            # Rendered before, e.g. served from a cache.
+            return content
+        return get_type_adapter(type(content)).dump_json(content)
@@ -0,0 +1,109 @@
+# Standard Libraries
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Hashable
+
+# Own Libraries
+from apps.utils.metrics import SINGLE_FLIGHT_OUTCOMES
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """
+    Coalesces the concurrent identical computations of a worker.
+
+    The first caller of ``run`` for a key starts the computation, and the
+    callers arriving while it is in flight await the same result instead
+    of starting their own. With ``ttl`` the result is then served from
+    memory for that many seconds (a micro-cache), and for ``stale_ttl``
+    more seconds it is still served while a single background computation
+    refreshes it (stale-while-revalidate).
+
+    Errors are shared by the callers of the computation, never cached.
+
+    Attributes:
+        name (str): Name used in logs and metrics.
+        ttl (float): Seconds a result is served without recomputing it.
+        stale_ttl (float): Seconds a result is served past ``ttl`` while
+            it is recomputed.
+        max_entries (int): Maximum results kept; the oldest are evicted.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl: float = 0.0,
+        stale_ttl: float = 0.0,
+        max_entries: int = 1024,
+    ) -> None:
+        self.name = name
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self._results: dict[Hashable, tuple[float, Any]] = {}
+        self._in_flight: dict[Hashable, asyncio.Task] = {}
+        self._outcomes = {
+            outcome: SINGLE_FLIGHT_OUTCOMES.labels(name=name, outcome=outcome)
+            for outcome in ("hit", "stale", "coalesced", "miss")
+        }
+
+    async def run(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return the result of ``compute`` for ``key``, sharing it with the
+        identical calls in flight or served from the micro-cache.
+
+        Args:
+            key (Hashable): The route and normalized parameters identifying
+                the computation.
+            compute (Callable[[], Awaitable]): Computes the result.
+        """
+        if (cached := self._results.get(key)) is not None:
+            stored_at, result = cached
+            age = time.monotonic() - stored_at
+            if age < self.ttl:
+                self._outcomes["hit"].inc()
+                return result
+            if age < self.ttl + self.stale_ttl:
+                if key not in self._in_flight:
+                    self._start(key, compute)
+                self._outcomes["stale"].inc()
+                return result
+
+        if (task := self._in_flight.get(key)) is not None:
+            self._outcomes["coalesced"].inc()
+        else:
+            task = self._start(key, compute)
+            self._outcomes["miss"].inc()
+        # A cancelled caller must not cancel the computation of the others.
+        return await asyncio.shield(task)
+
+    def _start(
+        self,
+        key: Hashable,
+        compute: Callable[[], Awaitable[Any]],
+    ) -> asyncio.Task:
+        task = asyncio.ensure_future(self._compute(key, compute))
+        self._in_flight[key] = task
+        task.add_done_callback(lambda task: self._finish(key, task))
+        return task
+
+    async def _compute(self, key: Hashable, compute: Callable[[], Awaitable[Any]]):
+        result = await compute()
+        if self.ttl + self.stale_ttl > 0:
+            self._results.pop(key, None)
+            self._results[key] = (time.monotonic(), result)
+            while len(self._results) > self.max_entries:
+                del self._results[next(iter(self._results))]
+        return result
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Retrieved here as well, since nobody awaits a background refresh.
+        if not task.cancelled() and (exp := task.exception()) is not None:
+            logger.debug(f"***{self.name} single flight, {repr(exp)}")
+
+    def clear(self) -> None:
+        self._results.clear()
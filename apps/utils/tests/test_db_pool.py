@@ -0,0 +1,170 @@
+# Standard Libraries
+import itertools
+import threading
+from unittest import mock
+
+# Third-party Libraries
+from django.test import SimpleTestCase
+
+# Own Libraries
+from apps.utils.db_pool import ConnectionPool, PoolTimeout
+
+
+class FakeConnection:
+    """A DB-API connection stand-in recording whether it was closed."""
+
+    def __init__(self, number: int) -> None:
+        self.number = number
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FakeClock:
+    """A ``time`` stand-in whose ``monotonic`` only moves when advanced."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class ConnectionPoolTestCase(SimpleTestCase):
+    def setUp(self) -> None:
+        self.numbers = itertools.count(1)
+        self.opened: list[FakeConnection] = []
+        self.reset = mock.Mock(return_value=True)
+        self.check = mock.Mock(return_value=True)
+
+    def connect(self) -> FakeConnection:
+        connection = FakeConnection(next(self.numbers))
+        self.opened.append(connection)
+        return connection
+
+    def make_pool(self, **options) -> ConnectionPool:
+        return ConnectionPool(
+            name=self._testMethodName,
+            connect=self.connect,
+            check=self.check,
+            reset=self.reset,
+            **{"min_size": 0, "max_size": 2, **options},
+        )
+
+    def test_acquire_times_out_when_every_connection_is_in_use(self):
+        pool = self.make_pool(max_size=1, timeout=0.05)
+        connection = pool.acquire()
+
+        with self.assertRaises(PoolTimeout):
+            pool.acquire()
+
+        pool.release(connection)
+        self.assertIs(pool.acquire(), connection)
+        self.assertEqual(len(self.opened), 1)
+
+    def test_acquire_waits_for_a_released_connection(self):
+        pool = self.make_pool(max_size=1, timeout=5.0)
+        connection = pool.acquire()
+        timer = threading.Timer(0.05, pool.release, args=(connection,))
+        timer.start()
+
+        self.assertIs(pool.acquire(), connection)
+        timer.join()
+        self.assertEqual(pool.stats()["waiting"], 0)
+
+    def test_idle_connection_above_min_size_is_recycled(self):
+        clock = FakeClock()
+        with mock.patch("apps.utils.db_pool.time", clock):
+            pool = self.make_pool(max_idle=60.0, check_interval=3600.0)
+            first = pool.acquire()
+            pool.release(first)
+
+            clock.advance(30.0)
+            self.assertIs(pool.acquire(), first)
+            pool.release(first)
+
+            clock.advance(61.0)
+            second = pool.acquire()
+
+        self.assertIsNot(second, first)
+        self.assertTrue(first.closed)
+        self.assertFalse(second.closed)
+
+    def test_idle_connection_within_min_size_is_kept(self):
+        clock = FakeClock()
+        with mock.patch("apps.utils.db_pool.time", clock):
+            pool = self.make_pool(min_size=1, max_idle=60.0, check_interval=3600.0)
+            pool.fill()
+            clock.advance(61.0)
+            connection = pool.acquire()
+
+        self.assertIs(connection, self.opened[0])
+        self.assertFalse(connection.closed)
+
+    def test_connection_past_max_lifetime_is_replaced(self):
+        clock = FakeClock()
+        with mock.patch("apps.utils.db_pool.time", clock):
+            pool = self.make_pool(min_size=1, max_lifetime=600.0, max_idle=3600.0)
+            pool.fill()
+            clock.advance(601.0)
+            connection = pool.acquire()
+
+        self.assertIsNot(connection, self.opened[0])
+        self.assertTrue(self.opened[0].closed)
+
+    def test_stale_idle_connection_is_checked_before_use(self):
+        clock = FakeClock()
+        self.check.return_value = False
+        with mock.patch("apps.utils.db_pool.time", clock):
+            pool = self.make_pool(check_interval=30.0)
+            first = pool.acquire()
+            pool.release(first)
+            clock.advance(31.0)
+            second = pool.acquire()
+
+        self.check.assert_called_once_with(first)
+        self.assertTrue(first.closed)
+        self.assertIsNot(second, first)
+        self.assertEqual(pool.stats()["in_use"], 1)
+
+    def test_release_resets_the_connection(self):
+        pool = self.make_pool()
+        connection = pool.acquire()
+        pool.release(connection)
+
+        self.reset.assert_called_once_with(connection)
+        self.assertFalse(connection.closed)
+        self.assertEqual(pool.stats()["idle"], 1)
+
+    def test_release_discards_a_connection_that_fails_to_reset(self):
+        self.reset.return_value = False
+        pool = self.make_pool()
+        connection = pool.acquire()
+        pool.release(connection)
+
+        self.assertTrue(connection.closed)
+        self.assertEqual(pool.stats()["size"], 0)
+        self.assertIsNot(pool.acquire(), connection)
+
+    def test_release_discards_a_connection_whose_reset_raises(self):
+        self.reset.side_effect = RuntimeError("server closed the connection")
+        pool = self.make_pool()
+        connection = pool.acquire()
+        with self.assertLogs("apps.utils.db_pool", "WARNING"):
+            pool.release(connection)
+
+        self.assertTrue(connection.closed)
+        self.assertEqual(pool.stats()["size"], 0)
+
+    def test_release_of_an_unknown_connection_closes_it(self):
+        pool = self.make_pool()
+        connection = FakeConnection(0)
+        with self.assertLogs("apps.utils.db_pool", "WARNING"):
+            pool.release(connection)
+
+        self.assertTrue(connection.closed)
+        self.reset.assert_not_called()
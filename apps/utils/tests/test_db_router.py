@@ -0,0 +1,112 @@
+# Standard Libraries
+import asyncio
+import os
+import tempfile
+from unittest import mock
+
+# Third-party Libraries
+from django.db import DEFAULT_DB_ALIAS, connections, router, transaction
+from django.test import TransactionTestCase
+
+# Own Libraries
+from apps.core.models import Category as CategoryModel
+from apps.utils.db_executor import database_executor
+from apps.utils.db_router import ReplicaRouter, RoutingState, routing_state, use_primary
+from apps.utils.decorator import async_database
+from apps.utils.enums import DatabaseExecutionModeEnum
+
+REPLICA = "replica_test"
+
+
+@async_database()
+def get_category_names() -> list[str]:
+    return list(CategoryModel.objects.order_by("id").values_list("name", flat=True))
+
+
+class ReplicaRouterTestCase(TransactionTestCase):
+    """
+    Routes the reads of the ``ReplicaRouter`` between the test database and
+    a replica kept in a second SQLite file. Their rows differ, so the names
+    read tell which database served a query.
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        # Fixed for the class: the database threads keep their connections.
+        replica_dir = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(replica_dir.cleanup)
+        connections.settings[REPLICA] = {
+            **connections.settings[DEFAULT_DB_ALIAS],
+            "NAME": os.path.join(replica_dir.name, "replica.sqlite3"),
+        }
+        cls.addClassCleanup(connections.settings.pop, REPLICA)
+        cls.addClassCleanup(connections[REPLICA].close)
+        with connections[REPLICA].schema_editor() as editor:
+            editor.create_model(CategoryModel)
+        CategoryModel.objects.using(REPLICA).create(name="Replica")
+
+        replica_router = next(
+            instance
+            for instance in router.routers
+            if isinstance(instance, ReplicaRouter)
+        )
+        patcher = mock.patch.object(replica_router, "replicas", [REPLICA])
+        patcher.start()
+        cls.addClassCleanup(patcher.stop)
+
+    def start_request(self) -> None:
+        """Give the test the routing state of a request, as the middleware does."""
+        token = routing_state.set(RoutingState())
+        self.addCleanup(routing_state.reset, token)
+
+    def get_names(self) -> list[str]:
+        return list(CategoryModel.objects.order_by("id").values_list("name", flat=True))
+
+    def test_reads_go_to_the_replica(self):
+        self.assertEqual(self.get_names(), ["Replica"])
+
+        self.start_request()
+        self.assertEqual(self.get_names(), ["Replica"])
+
+    def test_write_pins_the_following_reads_to_the_primary(self):
+        self.start_request()
+        self.assertEqual(self.get_names(), ["Replica"])
+
+        CategoryModel.objects.create(name="Primary")
+
+        self.assertEqual(self.get_names(), ["Primary"])
+        self.assertEqual(
+            list(CategoryModel.objects.using(REPLICA).values_list("name", flat=True)),
+            ["Replica"],
+        )
+
+    def test_write_pins_the_reads_of_its_request_only(self):
+        self.start_request()
+        CategoryModel.objects.create(name="Primary")
+        self.assertEqual(self.get_names(), ["Primary"])
+
+        self.start_request()
+        self.assertEqual(self.get_names(), ["Replica"])
+
+    def test_reads_inside_a_primary_transaction_go_to_the_primary(self):
+        CategoryModel.objects.using(DEFAULT_DB_ALIAS).create(name="Primary")
+
+        with transaction.atomic():
+            self.assertEqual(self.get_names(), ["Primary"])
+        self.assertEqual(self.get_names(), ["Replica"])
+
+    def test_use_primary_applies_inside_async_database_threads(self):
+        CategoryModel.objects.create(name="Primary")
+
+        async def read() -> tuple[list[str], list[str]]:
+            with use_primary():
+                primary_names = await get_category_names()
+            return primary_names, await get_category_names()
+
+        for mode in DatabaseExecutionModeEnum:
+            with self.subTest(mode=mode.value):
+                with mock.patch.object(database_executor, "mode", mode):
+                    primary_names, names = asyncio.run(read())
+                self.assertEqual(primary_names, ["Primary"])
+                self.assertEqual(names, ["Replica"])
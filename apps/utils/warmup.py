@@ -0,0 +1,130 @@
+# Standard Libraries
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable
+
+# Third-party Libraries
+from django.db import connection
+from fastapi import FastAPI
+from pydantic import BaseModel
+
+# Own Libraries
+from apps.utils.db_executor import database_executor
+from apps.utils.db_pool import pools_stats
+from apps.utils.decorator import async_database
+from apps.utils.enums import DatabaseExecutionModeEnum
+from apps.utils.responses import get_type_adapter
+
+logger = logging.getLogger(__name__)
+
+WarmupStep = Callable[[], Awaitable]
+
+
+@async_database()
+def ping_database() -> None:
+    """Open, or health-check, the connection of the current DB thread."""
+    connection.ensure_connection()
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1")
+
+
+@async_database()
+def fill_connection_pool() -> None:
+    """Open the ``min_size`` connections of a pooling database backend."""
+    if getattr(connection, "is_pooled", False):
+        connection.pool.fill()
+
+
+async def open_database_connections() -> None:
+    """
+    Open the connections of the ``async_database`` threads: the shared one
+    in THREAD_SENSITIVE mode, up to ``pool_size`` in POOL mode, or those
+    kept by the connection pool.
+    """
+    if database_executor.mode == DatabaseExecutionModeEnum.POOL:
+        await asyncio.gather(
+            *(ping_database() for _ in range(database_executor.pool_size))
+        )
+    else:
+        await ping_database()
+    await fill_connection_pool()
+
+
+async def warm_schemas(app: FastAPI, payload_classes: list[type[BaseModel]]) -> None:
+    """
+    Build the OpenAPI schema of ``app`` and the serializers of the
+    ``PayloadResponse`` payloads, which are otherwise built by the first
+    request that needs them.
+    """
+    app.openapi()
+    for payload_class in payload_classes:
+        get_type_adapter(payload_class)
+
+
+class Readiness:
+    """
+    Warm-up state of the worker, reported by ``/readyz``.
+
+    The steps run once when the worker starts (see ``config.asgi``); a
+    worker is ready once all of them succeeded. Failed steps are retried
+    on the next ``ensure_ready`` call, so a worker started while the
+    database was unreachable becomes ready when it comes back.
+
+    Attributes:
+        ready (bool): Whether every step succeeded.
+        import_seconds (float | None): Time spent importing the app.
+        steps (dict[str, float]): Seconds spent by each step.
+        errors (dict[str, str]): The error of each failed step.
+    """
+
+    def __init__(self) -> None:
+        self.ready = False
+        self.import_seconds: float | None = None
+        self.steps: dict[str, float] = {}
+        self.errors: dict[str, str] = {}
+        self._steps: dict[str, WarmupStep] = {}
+        self._lock = asyncio.Lock()
+
+    async def warm_up(self, steps: dict[str, WarmupStep]) -> None:
+        """Run the warm-up ``steps`` in order and log the startup report."""
+        self._steps = steps
+        await self.ensure_ready()
+        logger.info(f"***Startup report, {self.report()}")
+
+    async def ensure_ready(self) -> bool:
+        """Run the steps not completed yet and return the readiness."""
+        async with self._lock:
+            for name, step in self._steps.items():
+                if name in self.steps and name not in self.errors:
+                    continue
+                started_at = time.perf_counter()
+                try:
+                    await step()
+                except Exception as exp:
+                    self.errors[name] = repr(exp)
+                    logger.error(f"***Warm-up, {name}, {repr(exp)}")
+                else:
+                    self.errors.pop(name, None)
+                finally:
+                    self.steps[name] = time.perf_counter() - started_at
+            self.ready = bool(self._steps) and not self.errors
+            return self.ready
+
+    def report(self) -> dict:
+        return {
+            "ready": self.ready,
+            "import_ms": (
+                round(self.import_seconds * 1000, 2)
+                if self.import_seconds is not None
+                else None
+            ),
+            "steps_ms": {
+                name: round(seconds * 1000, 2) for name, seconds in self.steps.items()
+            },
+            "errors": self.errors,
+            "database_pools": pools_stats(),
+        }
+
+
+readiness = Readiness()
@@ -0,0 +1,401 @@
+"""
+End-to-end load test of the REST API.
+
+Seeds the configured database with synthetic locations built by
+``LocationFactory``/``LocationCategoryFactory`` and inserted in bulk, then
+drives ``fastapp`` in-process through httpx's ASGI transport with
+concurrent clients, one route at a time. Throughput, p50/p95/p99 latency
+and the SQL queries run per request are reported as JSON, which can be
+kept as a baseline and compared against later runs.
+
+Everything runs offline, against SQLite or a local Postgres.
+
+Usage:
+    python -m benchmarks.load --database-url sqlite:///benchmarks/load.sqlite3 \\
+        --locations 10000 --concurrency 16 --requests 500 \\
+        --output benchmarks/results.json [--baseline benchmarks/baseline.json]
+"""
+
+# Standard Libraries
+import argparse
+import asyncio
+import contextvars
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from urllib.parse import quote
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--database-url",
+        help="Database to seed and query; defaults to DATABASE_URL. Use "
+        "sqlite:///path/to/file.sqlite3 to run without Postgres.",
+    )
+    parser.add_argument("--locations", type=int, default=10_000)
+    parser.add_argument("--seed-batch-size", type=int, default=5_000)
+    parser.add_argument("--skip-seed", action="store_true")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=500, help="Per route.")
+    parser.add_argument("--warmup", type=int, default=20, help="Per route.")
+    parser.add_argument("--routes", nargs="+", choices=ROUTES, default=ROUTES)
+    parser.add_argument("--random-seed", type=int, default=42)
+    parser.add_argument("--output", help="Write the JSON report to this file.")
+    parser.add_argument("--baseline", help="JSON report to compare against.")
+    return parser.parse_args()
+
+
+ROUTES = ["recommend", "detail", "search", "add_location", "add_category"]
+CATEGORIES = 5
+COUNTRIES = 3
+
+# Stats of the request being served by the current task; asgiref copies the
+# context into the database threads, so queries are counted per request.
+_current_request: contextvars.ContextVar["RequestStats"] = contextvars.ContextVar(
+    "benchmark_request"
+)
+
+
+@dataclass
+class RequestStats:
+    queries: int = 0
+
+
+@dataclass
+class RouteStats:
+    latencies: list[float] = field(default_factory=list)
+    queries: list[int] = field(default_factory=list)
+    errors: int = 0
+    elapsed: float = 0.0
+
+    def report(self) -> dict:
+        latencies = sorted(self.latencies) or [0.0]
+        cut_points = (
+            statistics.quantiles(latencies, n=100, method="inclusive")
+            if len(latencies) > 1
+            else latencies * 99
+        )
+        requests = len(self.latencies)
+        return {
+            "requests": requests,
+            "errors": self.errors,
+            "throughput_rps": round(requests / self.elapsed, 2) if self.elapsed else 0,
+            "latency_ms": {
+                "mean": round(statistics.fmean(latencies) * 1000, 3),
+                "p50": round(cut_points[49] * 1000, 3),
+                "p95": round(cut_points[94] * 1000, 3),
+                "p99": round(cut_points[98] * 1000, 3),
+                "max": round(latencies[-1] * 1000, 3),
+            },
+            "queries": {
+                "total": sum(self.queries),
+                "per_request_avg": (
+                    round(statistics.fmean(self.queries), 2) if self.queries else 0
+                ),
+                "per_request_max": max(self.queries, default=0),
+            },
+        }
+
+
+def count_queries(execute, sql, params, many, context):
+    if stats := _current_request.get(None):
+        stats.queries += 1
+    return execute(sql, params, many, context)
+
+
+def install_query_counter(sender, connection, **kwargs) -> None:
+    if count_queries not in connection.execute_wrappers:
+        connection.execute_wrappers.append(count_queries)
+
+
+def seed(locations: int, batch_size: int) -> None:
+    """
+    Create the reference rows used by the factories and top the
+    ``location`` table up to ``locations`` rows.
+    """
+    # Third-party Libraries
+    from django.core.management import call_command
+    from django.db import transaction
+
+    # Own Libraries
+    from apps.core.models import Category, City, Country, Location, LocationCategory
+    from apps.location.process.leaderboard import rebuild_leaderboard
+    from apps.utils.data_factories.location import (
+        LocationCategoryFactory,
+        LocationFactory,
+    )
+    from apps.utils.geohash import encode
+
+    call_command("migrate", verbosity=0)
+
+    for index in range(1, COUNTRIES + 1):
+        Country.objects.get_or_create(
+            id=index,
+            defaults={"name": f"Benchmark country {index}", "code": f"B{index}"},
+        )
+        City.objects.get_or_create(
+            id=index,
+            defaults={"name": f"Benchmark city {index}", "country_id": index},
+        )
+    for index in range(1, CATEGORIES + 1):
+        Category.objects.get_or_create(
+            id=index,
+            defaults={"name": f"Benchmark category {index}"},
+        )
+
+    missing = locations - Location.objects.count()
+    started_at = time.perf_counter()
+    while missing > 0:
+        size = min(batch_size, missing)
+        batch = LocationFactory.build_batch(size)
+        for location in batch:
+            location.geohash = encode(location.latitude, location.longitude)
+
+        with transaction.atomic():
+            created = Location.objects.bulk_create(batch)
+            LocationCategory.objects.bulk_create(
+                [
+                    LocationCategoryFactory.build(location=location)
+                    for location in created
+                ]
+            )
+        missing -= size
+        print(
+            f"seeded {locations - missing}/{locations} locations "
+            f"({time.perf_counter() - started_at:.1f}s)",
+            file=sys.stderr,
+        )
+
+    rebuild_leaderboard()
+
+
+class RequestFactory:
+    """Builds random, valid requests for each benchmarked route."""
+
+    def __init__(self, rng: random.Random, pairs: list[tuple[int, int]]) -> None:
+        self.rng = rng
+        self.pairs = pairs
+
+    def recommend(self) -> tuple[str, str, dict | None]:
+        category_id = self.rng.randint(1, CATEGORIES)
+        return "GET", f"/api/rest/recommend-locations?category_id={category_id}", None
+
+    def detail(self) -> tuple[str, str, dict | None]:
+        location_id, category_id = self.rng.choice(self.pairs)
+        return "GET", f"/api/rest/location-{location_id}/category-{category_id}", None
+
+    def search(self) -> tuple[str, str, dict | None]:
+        # City prefixes, misspelt categories and house number prefixes.
+        query = self.rng.choice(
+            [
+                f"Benchmark city {self.rng.randint(1, COUNTRIES)}",
+                f"Benchmark categry {self.rng.randint(1, CATEGORIES)}",
+                str(self.rng.randint(10, 9999)),
+            ]
+        )
+        return "GET", f"/api/rest/locations/search?q={quote(query)}", None
+
+    def add_location(self) -> tuple[str, str, dict | None]:
+        country_id = self.rng.randint(1, COUNTRIES)
+        return (
+            "POST",
+            "/api/rest/add-locations",
+            {
+                "category_id_list": self.rng.sample(
+                    range(1, CATEGORIES + 1), k=self.rng.randint(1, 3)
+                ),
+                "location": {
+                    "country_id": country_id,
+                    "city_id": country_id,
+                    "address": f"Benchmark street {self.rng.randint(1, 10_000)}",
+                    "latitude": round(self.rng.uniform(-90, 90), 7),
+                    "longitude": round(self.rng.uniform(-180, 180), 7),
+                },
+            },
+        )
+
+    def add_category(self) -> tuple[str, str, dict | None]:
+        return (
+            "POST",
+            "/api/rest/add-categories",
+            {"name": f"Benchmark {uuid.uuid4().hex[:12]}", "description": "Load test"},
+        )
+
+
+async def run_route(
+    client,
+    make_request,
+    concurrency: int,
+    requests: int,
+) -> RouteStats:
+    stats = RouteStats()
+    remaining = iter(range(requests))
+
+    async def client_loop():
+        while next(remaining, None) is not None:
+            method, url, body = make_request()
+            request_stats = RequestStats()
+            token = _current_request.set(request_stats)
+            started_at = time.perf_counter()
+            try:
+                response = await client.request(method, url, json=body)
+            except Exception:
+                stats.errors += 1
+                continue
+            finally:
+                _current_request.reset(token)
+            stats.latencies.append(time.perf_counter() - started_at)
+            stats.queries.append(request_stats.queries)
+            if response.status_code >= 400:
+                stats.errors += 1
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(client_loop() for _ in range(concurrency)))
+    stats.elapsed = time.perf_counter() - started_at
+    return stats
+
+
+def describe_database() -> tuple[list[tuple[int, int]], int, str]:
+    """
+    Return a sample of (location_id, category_id) pairs for the detail
+    route, the number of locations and the database vendor.
+    """
+    # Third-party Libraries
+    from django.db import connection
+
+    # Own Libraries
+    from apps.core.models import Location, LocationCategory
+
+    pairs = list(
+        LocationCategory.objects.filter(is_deleted=False, location__is_deleted=False)
+        .order_by("id")
+        .values_list("location_id", "category_id")[:10_000]
+    )
+    assert pairs, "The database has no locations; run without --skip-seed."
+    total_locations = Location.objects.count()
+    vendor = connection.vendor
+    # Connections are per thread; the app opens its own in the DB threads.
+    connection.close()
+    return pairs, total_locations, vendor
+
+
+async def run_load(
+    args: argparse.Namespace,
+    pairs: list[tuple[int, int]],
+    total_locations: int,
+    vendor: str,
+) -> dict:
+    # Third-party Libraries
+    import httpx
+
+    # Own Libraries
+    from apps.location.bg_tasks.view_counter import view_counter
+    from apps.utils.db_executor import database_executor
+    from apps.utils.db_pool import pools_stats
+    from config.asgi import fastapp
+
+    factory = RequestFactory(rng=random.Random(args.random_seed), pairs=pairs)
+    routes = {}
+    transport = httpx.ASGITransport(app=fastapp)
+    async with httpx.AsyncClient(
+        transport=transport,
+        base_url="http://bench",
+    ) as client:
+        for route in args.routes:
+            make_request = getattr(factory, route)
+            await run_route(client, make_request, args.concurrency, args.warmup)
+            stats = await run_route(
+                client, make_request, args.concurrency, args.requests
+            )
+            routes[route] = stats.report()
+            print(f"{route}: {json.dumps(routes[route])}", file=sys.stderr)
+    database_pools = pools_stats()
+    await view_counter.close()
+    database_executor.shutdown()
+
+    return {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "database": vendor,
+            "locations": total_locations,
+            "concurrency": args.concurrency,
+            "requests_per_route": args.requests,
+            "database_execution_mode": database_executor.mode.value,
+            "database_pools": database_pools,
+        },
+        "routes": routes,
+    }
+
+
+def compare(report: dict, baseline: dict) -> None:
+    """Print the change of each route's metrics against a baseline report."""
+
+    def delta(current: float, previous: float) -> str:
+        if not previous:
+            return "n/a"
+        return f"{(current - previous) / previous * 100:+.1f}%"
+
+    print(
+        f"{'route':<14} {'rps':>10} {'p50':>10} {'p95':>10} {'p99':>10} "
+        f"{'queries':>10}"
+    )
+    for route, current in report["routes"].items():
+        if not (previous := baseline.get("routes", {}).get(route)):
+            continue
+        deltas = [
+            delta(current["throughput_rps"], previous["throughput_rps"]),
+            *(
+                delta(current["latency_ms"][key], previous["latency_ms"][key])
+                for key in ("p50", "p95", "p99")
+            ),
+            delta(
+                current["queries"]["per_request_avg"],
+                previous["queries"]["per_request_avg"],
+            ),
+        ]
+        print(f"{route:<14} " + " ".join(f"{value:>10}" for value in deltas))
+
+
+def main():
+    args = parse_args()
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.base")
+
+    # Third-party Libraries
+    import django
+    from django.db.backends.signals import connection_created
+
+    django.setup()
+    connection_created.connect(install_query_counter)
+
+    if not args.skip_seed:
+        seed(locations=args.locations, batch_size=args.seed_batch_size)
+
+    # The ORM can't be used synchronously inside the event loop.
+    pairs, total_locations, vendor = describe_database()
+    report = asyncio.run(run_load(args, pairs, total_locations, vendor))
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(output + "\n")
+    else:
+        print(output)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            compare(report, json.load(file))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Microbenchmark of the LocationType list serialization.
+
+Compares, per item, the validated path (``from_db_model`` + FastAPI's
+response-model re-validation + ``jsonable_encoder`` + ``json.dumps``) with
+the fast path (``construct_from_db_model`` + ``PayloadResponse``).
+
+Usage:
+    python -m benchmarks.serialization [--repeat 20]
+"""
+
+# Standard Libraries
+import argparse
+import json
+import os
+import timeit
+from decimal import Decimal
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.base")
+
+# Third-party Libraries
+import django  # noqa: E402
+
+django.setup()
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+
+# Own Libraries
+from apps.core.models import Category as CategoryModel  # noqa: E402
+from apps.core.models import Location as LocationModel  # noqa: E402
+from apps.location.schema.response.location import (  # noqa: E402
+    LocationListPayload,
+    LocationMetadata,
+)
+from apps.location.schema.types.city import CityRecord, CountryRecord  # noqa: E402
+from apps.location.schema.types.location import LocationType  # noqa: E402
+from apps.utils.responses import PayloadResponse, get_type_adapter  # noqa: E402
+
+SIZES = (10, 100, 1000)
+
+
+def build_rows(size: int) -> list[tuple]:
+    country = CountryRecord(id=1, name="Colombia", code="CO")
+    cities = [CityRecord(id=i, name=f"City {i}", country_id=1) for i in range(1, 6)]
+    categories = [
+        CategoryModel(id=i, name=f"Category {i}", description="Lorem ipsum")
+        for i in range(1, 6)
+    ]
+    rows = []
+    for i in range(1, size + 1):
+        location = LocationModel(
+            id=i,
+            address=f"Street {i} # {i}-{i}",
+            latitude=Decimal("4.6097100"),
+            longitude=Decimal("-74.0817500"),
+            city_id=cities[i % 5].id,
+            country_id=1,
+        )
+        location.total_reviews = i
+        rows.append((location, (cities[i % 5], country), categories[: i % 5 + 1]))
+    return rows
+
+
+def validated_path(rows: list[tuple]) -> bytes:
+    payload = LocationListPayload(
+        metadata=LocationMetadata(total_count=len(rows)),
+        items=[
+            LocationType.from_db_model(
+                instance=location,
+                category_id=1,
+                city_tuple=city_tuple,
+                categories_list=categories,
+            )
+            for location, city_tuple, categories in rows
+        ],
+    )
+    # What FastAPI does with a returned model and a response model.
+    content = payload.model_dump(by_alias=True)
+    validated = get_type_adapter(LocationListPayload).validate_python(content)
+    return json.dumps(
+        jsonable_encoder(validated),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def fast_path(rows: list[tuple]) -> bytes:
+    nested_cache = {}
+    payload = LocationListPayload.model_construct(
+        metadata=LocationMetadata(total_count=len(rows)),
+        items=[
+            LocationType.construct_from_db_model(
+                instance=location,
+                category_id=1,
+                city_tuple=city_tuple,
+                categories_list=categories,
+                nested_cache=nested_cache,
+            )
+            for location, city_tuple, categories in rows
+        ],
+    )
+    return PayloadResponse(content=payload).body
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'items':>6} {'validated us/item':>18} {'fast us/item':>13} {'speedup':>8}")
+    for size in SIZES:
+        rows = build_rows(size)
+        assert json.loads(validated_path(rows)) == json.loads(fast_path(rows))
+
+        timings = {}
+        for name, func in (("validated", validated_path), ("fast", fast_path)):
+            number = max(1, 2000 // size)
+            best = min(
+                timeit.repeat(lambda: func(rows), number=number, repeat=args.repeat)
+            )
+            timings[name] = best / number / size * 1_000_000
+
+        print(
+            f"{size:>6} {timings['validated']:>18.2f} {timings['fast']:>13.2f} "
+            f"{timings['validated'] / timings['fast']:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
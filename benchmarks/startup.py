@@ -0,0 +1,160 @@
+"""
+Startup-time report of the API workers.
+
+Imports ``config.asgi`` in fresh interpreters with ``-X importtime`` and
+reports the median import time of the app, the slowest modules (by their
+own and cumulative time) and the time spent per top-level package. Then,
+in this process, runs the app lifespan and reports the time of each
+warm-up step, as ``/readyz`` does.
+
+Reports are JSON and can be compared against a baseline like the load
+test ones.
+
+Usage:
+    python -m benchmarks.startup --database-url sqlite:///benchmarks/load.sqlite3 \\
+        --runs 5 --output benchmarks/startup.json \\
+        [--baseline benchmarks/startup_baseline.json]
+"""
+
+# Standard Libraries
+import argparse
+import asyncio
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from datetime import datetime, timezone
+
+IMPORT_TIME_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)$")
+TARGET_MODULE = "config.asgi"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--database-url",
+        help="Database used by the warm-up; defaults to DATABASE_URL.",
+    )
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--skip-warmup", action="store_true")
+    parser.add_argument("--output", help="Write the JSON report to this file.")
+    parser.add_argument("--baseline", help="JSON report to compare against.")
+    return parser.parse_args()
+
+
+def import_times() -> dict[str, tuple[int, int]]:
+    """
+    Import the app in a fresh interpreter and return the (self,
+    cumulative) import time, in microseconds, of every module.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {TARGET_MODULE}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if match := IMPORT_TIME_RE.match(line):
+            self_us, cumulative_us, _, module = match.groups()
+            times[module] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def import_report(runs: int, top: int) -> dict:
+    """Aggregate the import times of ``runs`` interpreters by their median."""
+    samples = [import_times() for _ in range(runs)]
+    modules = set().union(*samples)
+
+    def median(module: str, index: int) -> float:
+        return statistics.median(
+            sample[module][index] / 1000 for sample in samples if module in sample
+        )
+
+    self_ms = {module: median(module, 0) for module in modules}
+    cumulative_ms = {module: median(module, 1) for module in modules}
+    packages = defaultdict(float)
+    for module, value in self_ms.items():
+        packages[module.split(".")[0]] += value
+
+    def slowest(values: dict[str, float]) -> dict[str, float]:
+        ranked = sorted(values.items(), key=lambda item: -item[1])[:top]
+        return {name: round(value, 2) for name, value in ranked}
+
+    return {
+        "total_ms": round(cumulative_ms.get(TARGET_MODULE, 0), 2),
+        "slowest_self_ms": slowest(self_ms),
+        "slowest_cumulative_ms": slowest(cumulative_ms),
+        "packages_ms": slowest(packages),
+    }
+
+
+async def warmup_report() -> dict:
+    """Run the lifespan of the app and return its startup report."""
+    # Own Libraries
+    from apps.utils.warmup import readiness
+    from config.asgi import fastapp
+
+    async with fastapp.router.lifespan_context(fastapp):
+        return readiness.report()
+
+
+def compare(report: dict, baseline: dict) -> None:
+    """Print the change of the import and warm-up times against a baseline."""
+
+    def delta(current: float, previous: float | None) -> str:
+        if not previous:
+            return "n/a"
+        return f"{(current - previous) / previous * 100:+.1f}%"
+
+    rows = [("import", report["imports"]["total_ms"], baseline["imports"]["total_ms"])]
+    previous_steps = (baseline.get("warmup") or {}).get("steps_ms", {})
+    for step, value in (report.get("warmup") or {}).get("steps_ms", {}).items():
+        rows.append((step, value, previous_steps.get(step)))
+
+    print(f"{'phase':<18} {'ms':>10} {'delta':>10}")
+    for phase, current, previous in rows:
+        print(f"{phase:<18} {current:>10} {delta(current, previous):>10}")
+
+
+def main():
+    args = parse_args()
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.base")
+
+    # Third-party Libraries
+    import django
+
+    django.setup()
+
+    report = {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": sys.version.split()[0],
+            "runs": args.runs,
+        },
+        "imports": import_report(runs=args.runs, top=args.top),
+        "warmup": None if args.skip_warmup else asyncio.run(warmup_report()),
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(output + "\n")
+    else:
+        print(output)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            compare(report, json.load(file))
+
+
+if __name__ == "__main__":
+    main()
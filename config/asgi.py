@@ -9,6 +9,11 @@ https://docs.djangoproject.com/en/5.0/howto/deployment/asgi/
 
 # Standard Libraries
 import os
+import time
+from contextlib import asynccontextmanager
+from functools import partial
+
+import_started_at = time.perf_counter()
 
 # Third-party Libraries
 from django.core.asgi import get_asgi_application
@@ -21,24 +26,108 @@ from fastapi import FastAPI
 
 # Own Libraries
 from apps.core.category_router import add_category_tag, category_router
+from apps.core.health_router import health_router, health_tag
 from apps.core.location_router import (
     add_location_tag,
+    batch_location_detail_tag,
+    bulk_add_locations_tag,
     location_detail_tag,
     location_router,
+    nearby_locations_tag,
     recommend_locations_tag,
+    search_locations_tag,
+    viewport_locations_tag,
+)
+from apps.core.metrics_router import metrics_router, metrics_tag
+from apps.location.bg_tasks.view_counter import view_counter
+from apps.location.process.city import CityProcess
+from apps.location.process.search import SearchProcess
+from apps.location.schema.response.location import (
+    BatchLocationDetailPayload,
+    LocationListPayload,
+    NearbyLocationListPayload,
+    SearchLocationListPayload,
+    ViewportPayload,
+)
+from apps.location.schema.types.location import LocationType
+from apps.utils.db_executor import database_executor
+from apps.utils.db_pool import close_pools
+from apps.utils.db_router import ReadYourWritesMiddleware
+from apps.utils.instrumentation import QueryInstrumentationMiddleware
+from apps.utils.metrics import MetricsMiddleware
+from apps.utils.warmup import (
+    open_database_connections,
+    readiness,
+    warm_schemas,
 )
+from config.env_vars import settings
 
 metadata_tags = [
     add_category_tag,
     add_location_tag,
     recommend_locations_tag,
     location_detail_tag,
+    batch_location_detail_tag,
+    nearby_locations_tag,
+    search_locations_tag,
+    viewport_locations_tag,
+    bulk_add_locations_tag,
+    metrics_tag,
+    health_tag,
 ]
 
+
+async def preload_reference_caches() -> None:
+    await CityProcess().get_city_and_country()
+    await SearchProcess().preload_indexes()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Warm the worker up before it serves traffic (``/readyz`` reports when
+    it is done) and flush the pending views when it stops.
+    """
+    await readiness.warm_up(
+        steps={
+            "database": open_database_connections,
+            "reference_caches": preload_reference_caches,
+            "schemas": partial(
+                warm_schemas,
+                app=app,
+                payload_classes=[
+                    LocationListPayload,
+                    NearbyLocationListPayload,
+                    SearchLocationListPayload,
+                    ViewportPayload,
+                    BatchLocationDetailPayload,
+                    LocationType,
+                ],
+            ),
+        }
+    )
+    yield
+    await view_counter.close()
+    database_executor.shutdown()
+    close_pools()
+
+
 fastapp = FastAPI(
     openapi_tags=[tag.model_dump(by_alias=True) for tag in metadata_tags],
+    lifespan=lifespan,
 )
 
+fastapp.add_middleware(MetricsMiddleware)
+fastapp.add_middleware(ReadYourWritesMiddleware)
+
+if settings.QUERY_INSTRUMENTATION:
+    fastapp.add_middleware(
+        QueryInstrumentationMiddleware,
+        query_budget=settings.QUERY_BUDGET,
+        strict=settings.QUERY_BUDGET_STRICT,
+        n_plus_one_threshold=settings.N_PLUS_ONE_THRESHOLD,
+    )
+
 
 fastapp.include_router(
     location_router,
@@ -48,3 +137,7 @@ fastapp.include_router(
     category_router,
     prefix="/api/rest",
 )
+fastapp.include_router(metrics_router)
+fastapp.include_router(health_router)
+
+readiness.import_seconds = time.perf_counter() - import_started_at
@@ -82,14 +82,40 @@ WSGI_APPLICATION = "config.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/2.2/ref/settings/#databases
 
-if DATABASE_URL := settings.DATABASE_URL:
-    DATABASES = {
-        "default": dj_database_url.config(
-            default=DATABASE_URL,
-            conn_max_age=600,
-            conn_health_checks=True,
+
+def database_settings(url: str) -> dict:
+    """Return the settings of the database at ``url``."""
+    database = dj_database_url.parse(url, conn_max_age=600, conn_health_checks=True)
+    if database["ENGINE"] != "django.db.backends.postgresql":
+        return database
+
+    # The text search uses the pg_trgm lookups, with the similarity threshold
+    # set for the whole session.
+    threshold = settings.SEARCH_MIN_SIMILARITY
+    options = database.setdefault("OPTIONS", {})
+    options["options"] = f"-c pg_trgm.word_similarity_threshold={threshold}"
+
+    # One pool of connections per worker shared by its DB threads, given
+    # back after each async_database call (see apps.utils.db_pool).
+    if settings.DATABASE_CONNECTION_POOL:
+        database.update(
+            ENGINE="apps.utils.backends.postgresql_pool",
+            CONN_MAX_AGE=0,
+            CONN_HEALTH_CHECKS=False,
+            POOL={
+                "min_size": settings.DATABASE_CONNECTION_POOL_MIN_SIZE,
+                "max_size": settings.DATABASE_CONNECTION_POOL_MAX_SIZE,
+                "timeout": settings.DATABASE_CONNECTION_POOL_TIMEOUT,
+                "max_idle": settings.DATABASE_CONNECTION_POOL_MAX_IDLE,
+                "max_lifetime": settings.DATABASE_CONNECTION_POOL_MAX_LIFETIME,
+                "check_interval": settings.DATABASE_CONNECTION_POOL_CHECK_INTERVAL,
+            },
         )
-    }
+    return database
+
+
+if DATABASE_URL := settings.DATABASE_URL:
+    DATABASES = {"default": database_settings(DATABASE_URL)}
 else:
     DATABASES = {
         "default": {
@@ -98,6 +124,24 @@ else:
         }
     }
 
+# Read replicas of the primary (default): the Query*Process reads go to them
+# (see apps.utils.db_router), the tests reuse the primary.
+replica_urls = [url.strip() for url in settings.DATABASE_REPLICA_URLS.split(",")]
+for number, url in enumerate(filter(None, replica_urls), start=1):
+    DATABASES[f"replica_{number}"] = {
+        **database_settings(url),
+        "TEST": {"MIRROR": "default"},
+    }
+
+DATABASE_ROUTERS = ["apps.utils.db_router.ReplicaRouter"]
+
+if DATABASES["default"]["ENGINE"] in (
+    "django.db.backends.postgresql",
+    "apps.utils.backends.postgresql_pool",
+):
+    # The pg_trgm lookups are registered by contrib.postgres.
+    INSTALLED_APPS.append("django.contrib.postgres")
+
 
 # Password validation
 # https://docs.djangoproject.com/en/2.2/ref/settings/#auth-password-validators
@@ -7,11 +7,22 @@ if [[ -z "${WORKERS}" ]]; then
     WORKERS=4
 fi
 
+# Every worker writes its metrics here; /metrics aggregates them.
+if [[ -z "${PROMETHEUS_MULTIPROC_DIR}" ]]; then
+    export PROMETHEUS_MULTIPROC_DIR=/tmp/prometheus_multiproc
+fi
+rm -rf "${PROMETHEUS_MULTIPROC_DIR}"
+mkdir -p "${PROMETHEUS_MULTIPROC_DIR}"
+
 echo "Running FastAPI App..."
 echo "Port: ${PORT}"
 echo "Workers: ${WORKERS}"
 
+# --preload imports the app once in the master process and forks the
+# workers from it, instead of every worker importing it again; each worker
+# then warms up in its lifespan and reports through /readyz.
 gunicorn config.asgi:fastapp \
+    --preload \
     --timeout 30 \
     --graceful-timeout 30 \
     --access-logfile - \